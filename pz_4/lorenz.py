@@ -0,0 +1,201 @@
+import numpy as np
+import argparse
+import json
+import os
+import tempfile
+import time
+
+# Класичні параметри атрактора Лоренца
+SIGMA = 10.0
+RHO = 28.0
+BETA = 8 / 3
+
+
+def lorenz_rhs(state: np.ndarray, sigma, rho, beta, out: np.ndarray = None) -> np.ndarray:
+    """
+    Права частина системи Лоренца для всього ансамблю
+
+    :param state: масив (3, N) - координати x, y, z усіх систем
+    :param sigma, rho, beta: числа або масиви (N,) - параметри кожної системи
+    """
+    x, y, z = state
+    if out is None:
+        out = np.empty_like(state)
+    # out[0] - тимчасово beta * z, щоб не виділяти проміжний масив
+    np.multiply(z, beta, out=out[0])
+    np.multiply(x, y, out=out[2])
+    out[2] -= out[0]
+    np.subtract(y, x, out=out[0])
+    out[0] *= sigma
+    np.subtract(rho, z, out=out[1])
+    out[1] *= x
+    out[1] -= y
+    return out
+
+
+def rk4_step(state: np.ndarray, dt: float, sigma=SIGMA, rho=RHO, beta=BETA,
+             work: np.ndarray = None, out: np.ndarray = None) -> np.ndarray:
+    """
+    Один крок методу Рунге-Кутти 4-го порядку для ансамблю (3, N)
+
+    :param work: робочий масив (5, 3, N) для стадій k1..k4 і проміжної точки; без нього виділяється на кожен крок
+    :param out: куди записати новий стан (може бути сам state)
+    :return: новий стан
+    """
+    if work is None:
+        work = np.empty((5,) + state.shape)
+    k1, k2, k3, k4, stage = work
+    lorenz_rhs(state, sigma, rho, beta, out=k1)
+    for k, k_next, h in ((k1, k2, 0.5 * dt), (k2, k3, 0.5 * dt), (k3, k4, dt)):
+        np.multiply(k, h, out=stage)
+        stage += state
+        lorenz_rhs(stage, sigma, rho, beta, out=k_next)
+    # k2 <- dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+    k2 += k3
+    k2 *= 2
+    k2 += k1
+    k2 += k4
+    k2 *= dt / 6
+    if out is None:
+        return state + k2
+    return np.add(state, k2, out=out)
+
+
+def perturbed_states(n_systems: int, base=(0.1, 0.0, 0.0), epsilon: float = 1e-3, seed=None) -> np.ndarray:
+    """
+    Початкові умови ансамблю: базова точка плюс нормальні збурення масштабу epsilon
+
+    Перша система - незбурена базова точка (еталон для separation()).
+
+    :return: масив (3, N)
+    """
+    rng = np.random.default_rng(seed)
+    states = np.asarray(base, dtype=np.float64)[:, None] + epsilon * rng.standard_normal((3, n_systems))
+    states[:, 0] = base
+    return states
+
+
+class LorenzEnsemble:
+    """
+    Ансамбль систем Лоренца, що інтегруються разом методом RK4
+
+    Стан зберігається масивом (3, N), тож кожен крок - кілька векторних операцій над N системами;
+    стадії RK4 рахуються в заздалегідь виділених масивах, стан оновлюється на місці.
+    Траєкторії записуються в кільцевий буфер фіксованої довжини: пам'ять не росте з часом.
+    """
+
+    def __init__(self, states: np.ndarray, dt=0.01, sigma=SIGMA, rho=RHO, beta=BETA,
+                 buffer_length=1000, record_every=1):
+        """
+        :param states: початкові умови (3, N)
+        :param buffer_length: скільки останніх записаних точок кожної траєкторії зберігати
+        :param record_every: записувати в буфер кожен record_every-й крок
+        """
+        self.state = np.array(states, dtype=np.float64).reshape(3, -1)
+        self.n_systems = self.state.shape[1]
+        self.dt = dt
+        self.sigma, self.rho, self.beta = sigma, rho, beta
+        self.record_every = record_every
+        self.step_count = 0
+        self._work = np.empty((5, 3, self.n_systems))
+
+        self.buffer = np.zeros((buffer_length, self.n_systems, 3), dtype=np.float32)
+        self.head = 0  # Позиція наступного запису
+        self.filled = 0
+        self._record()
+
+    def _record(self):
+        self.buffer[self.head] = self.state.T
+        self.head = (self.head + 1) % len(self.buffer)
+        self.filled = min(self.filled + 1, len(self.buffer))
+
+    def step(self, n_steps: int = 1):
+        for _ in range(n_steps):
+            rk4_step(self.state, self.dt, self.sigma, self.rho, self.beta, work=self._work, out=self.state)
+            self.step_count += 1
+            if self.step_count % self.record_every == 0:
+                self._record()
+
+    @property
+    def time(self) -> float:
+        return self.step_count * self.dt
+
+    def trajectories(self) -> np.ndarray:
+        """Записані точки від найстарішої до найновішої: масив (filled, N, 3)"""
+        start = (self.head - self.filled) % len(self.buffer)
+        return np.roll(self.buffer, -start, axis=0)[:self.filled]
+
+    def separation(self) -> np.ndarray:
+        """Відстань кожної системи від першої (еталонної) - міра чутливості до початкових умов"""
+        return np.linalg.norm(self.state - self.state[:, :1], axis=0)
+
+
+def _write_atomic(path: str, data: bytes):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def export_frames(ensemble: LorenzEnsemble, directory: str, n_frames: int, frames_per_chunk: int = 256) -> dict:
+    """
+    Інтегрування з проріджуванням: кадр - запис кільцевого буфера ансамблю (кожні record_every кроків)
+
+    Пачка з frames_per_chunk кадрів береться з буфера, тож його довжина має бути не меншою.
+    Кадри пишуться двійковими пачками chunk_00000.bin, ... (float32 little-endian, форма
+    (кадри, N, 3)), опис - у manifest.json. Сторінка index.html завантажує пачки по черзі.
+
+    :return: вміст manifest.json
+    """
+    if len(ensemble.buffer) < frames_per_chunk:
+        raise ValueError(f"Буфер ансамблю ({len(ensemble.buffer)}) коротший за пачку ({frames_per_chunk} кадрів)")
+    os.makedirs(directory, exist_ok=True)
+    manifest = {
+        'n_systems': ensemble.n_systems,
+        'dt': ensemble.dt,
+        'frame_dt': ensemble.dt * ensemble.record_every,
+        'params': {name: float(value) if np.ndim(value) == 0 else 'per-system'
+                   for name, value in (('sigma', ensemble.sigma), ('rho', ensemble.rho), ('beta', ensemble.beta))},
+        'dtype': '<f4',
+        'chunks': [],
+    }
+    for begin in range(0, n_frames, frames_per_chunk):
+        count = min(frames_per_chunk, n_frames - begin)
+        ensemble.step(count * ensemble.record_every)
+        frames = ensemble.trajectories()[-count:]
+        name = f'chunk_{len(manifest["chunks"]):05d}.bin'
+        _write_atomic(os.path.join(directory, name), frames.astype('<f4', copy=False).tobytes())
+        manifest['chunks'].append({'file': name, 'frames': count})
+    _write_atomic(os.path.join(directory, 'manifest.json'), json.dumps(manifest, indent=2).encode())
+    return manifest
+
+
+def load_chunk(path: str, n_systems: int) -> np.ndarray:
+    """Пачка кадрів у вигляді масиву (кадри, N, 3)"""
+    return np.fromfile(path, dtype='<f4').reshape(-1, n_systems, 3)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ансамбль систем Лоренца (RK4) з експортом кадрів для index.html")
+    parser.add_argument('--systems', type=int, default=1000)
+    parser.add_argument('--epsilon', type=float, default=1e-3, help="масштаб збурень початкових умов")
+    parser.add_argument('--dt', type=float, default=0.01)
+    parser.add_argument('--frames', type=int, default=2000)
+    parser.add_argument('--steps-per-frame', type=int, default=2)
+    parser.add_argument('--chunk-frames', type=int, default=256)
+    parser.add_argument('--out', default='frames', help="каталог для пачок кадрів (поруч з index.html)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    ensemble = LorenzEnsemble(perturbed_states(args.systems, epsilon=args.epsilon, seed=args.seed), args.dt,
+                              buffer_length=args.chunk_frames, record_every=args.steps_per_frame)
+    start = time.perf_counter()
+    manifest = export_frames(ensemble, args.out, args.frames, args.chunk_frames)
+    elapsed = time.perf_counter() - start
+    separation = ensemble.separation()
+    print(f"{args.systems} систем, {args.frames} кадрів у {len(manifest['chunks'])} пачках за {elapsed:.2f} с; "
+          f"t = {ensemble.time:.2f}, медіанне відхилення від еталону {np.median(separation):.3g}")
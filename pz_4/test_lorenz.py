@@ -0,0 +1,116 @@
+import numpy as np
+import os
+import tempfile
+import unittest
+
+from lorenz import LorenzEnsemble, export_frames, load_chunk, lorenz_rhs, perturbed_states, rk4_step
+
+
+def scalar_rk4(point, dt, steps, sigma=10.0, rho=28.0, beta=8 / 3):
+    """Еталонний RK4 для однієї системи"""
+    def f(p):
+        x, y, z = p
+        return np.array([sigma * (y - x), x * (rho - z) - y, x * y - beta * z])
+
+    p = np.array(point, dtype=float)
+    for _ in range(steps):
+        k1 = f(p)
+        k2 = f(p + dt / 2 * k1)
+        k3 = f(p + dt / 2 * k2)
+        k4 = f(p + dt * k3)
+        p = p + dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+    return p
+
+
+# Тести для ансамблю систем Лоренца
+class TestLorenzEnsemble(unittest.TestCase):
+    def test_matches_scalar_rk4(self):
+        """Кожна система ансамблю збігається з окремим інтегруванням"""
+        states = perturbed_states(5, epsilon=1.0, seed=1)
+        ensemble = LorenzEnsemble(states, 0.01)
+        ensemble.step(200)
+        for k in range(5):
+            self.assertTrue(np.allclose(ensemble.state[:, k], scalar_rk4(states[:, k], 0.01, 200), rtol=1e-10))
+
+    def test_fourth_order(self):
+        """Похибка зменшується приблизно в 16 разів при зменшенні кроку вдвічі"""
+        start = np.array([[1.0], [1.0], [1.0]])
+        reference = scalar_rk4(start[:, 0], 1e-4, 5000)
+        errors = []
+        for dt, steps in ((0.01, 50), (0.005, 100)):
+            state = start
+            for _ in range(steps):
+                state = rk4_step(state, dt)
+            errors.append(np.linalg.norm(state[:, 0] - reference))
+        self.assertGreater(errors[0] / errors[1], 12)
+
+    def test_per_system_params(self):
+        """Параметри можуть бути різними для кожної системи"""
+        state = np.ones((3, 2))
+        rhs = lorenz_rhs(state, np.array([10.0, 1.0]), 28.0, 8 / 3)
+        self.assertEqual(list(rhs[0]), [0.0, 0.0])
+        state[1] = 2.0
+        rhs = lorenz_rhs(state, np.array([10.0, 1.0]), 28.0, 8 / 3)
+        self.assertEqual(list(rhs[0]), [10.0, 1.0])
+
+    def test_ring_buffer(self):
+        """Буфер має фіксовану довжину і зберігає останні точки в хронологічному порядку"""
+        ensemble = LorenzEnsemble(perturbed_states(3, seed=0), 0.01, buffer_length=10, record_every=2)
+        history = [ensemble.state.T.copy()]
+        for _ in range(15):
+            ensemble.step(2)
+            history.append(ensemble.state.T.copy())
+        trajectories = ensemble.trajectories()
+        self.assertEqual(ensemble.buffer.shape, (10, 3, 3))
+        self.assertEqual(trajectories.shape, (10, 3, 3))
+        self.assertTrue(np.allclose(trajectories, np.array(history[-10:]), rtol=1e-6))
+
+        fresh = LorenzEnsemble(perturbed_states(3, seed=0), 0.01, buffer_length=10)
+        fresh.step(3)
+        self.assertEqual(len(fresh.trajectories()), 4)
+
+    def test_sensitivity(self):
+        """Малі збурення зростають на атракторі"""
+        ensemble = LorenzEnsemble(perturbed_states(50, epsilon=1e-6, seed=2), 0.01, buffer_length=1)
+        ensemble.step(3000)
+        self.assertEqual(ensemble.separation()[0], 0.0)
+        self.assertGreater(np.median(ensemble.separation()), 1e-3)
+
+    def test_export_frames(self):
+        """Пачки кадрів - двійкові float32, кадр - запис буфера після кожних record_every кроків"""
+        states = perturbed_states(4, seed=3)
+        with tempfile.TemporaryDirectory() as directory:
+            manifest = export_frames(LorenzEnsemble(states, 0.01, buffer_length=4, record_every=3), directory, 10,
+                                     frames_per_chunk=4)
+            self.assertEqual([chunk['frames'] for chunk in manifest['chunks']], [4, 4, 2])
+            self.assertTrue(os.path.exists(os.path.join(directory, 'manifest.json')))
+            frames = np.concatenate([load_chunk(os.path.join(directory, chunk['file']), 4)
+                                     for chunk in manifest['chunks']])
+
+        self.assertEqual(frames.shape, (10, 4, 3))
+        reference = LorenzEnsemble(states, 0.01, buffer_length=11, record_every=3)
+        reference.step(30)
+        self.assertTrue(np.array_equal(frames, reference.trajectories()[1:]))
+        self.assertEqual(manifest['frame_dt'], 0.03)
+
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(ValueError):
+                export_frames(LorenzEnsemble(states, 0.01, buffer_length=2), directory, 10, frames_per_chunk=4)
+
+    def test_step_reuses_buffers(self):
+        """Крок ансамблю оновлює стан на місці і збігається з rk4_step без робочих масивів"""
+        states = perturbed_states(6, seed=4)
+        ensemble = LorenzEnsemble(states, 0.01, buffer_length=1)
+        state, work = ensemble.state, ensemble._work
+        ensemble.step(5)
+        self.assertIs(ensemble.state, state)
+        self.assertIs(ensemble._work, work)
+
+        expected = states
+        for _ in range(5):
+            expected = rk4_step(expected, 0.01)
+        self.assertTrue(np.allclose(ensemble.state, expected, rtol=1e-12))
+
+
+if __name__ == "__main__":
+    unittest.main()
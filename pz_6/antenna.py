@@ -1,30 +1,83 @@
 import numpy as np
 import matplotlib.pyplot as plt
+import queue
 import random
+import threading
+from matplotlib.collections import EllipseCollection
 from matplotlib.widgets import Button, Slider
 from typing import List, Tuple, Dict
 
-class AntennaPlacementOptimizer:
+import raster
+from solver import AntennaPlacementSolver
+
+
+class AntennaPlacementOptimizer(AntennaPlacementSolver):
+    """Інтерактивний інтерфейс оптимізатора: сценарій і алгоритми - у AntennaPlacementSolver"""
+    
     def __init__(self, width=100, height=100):
-        self.width = width
-        self.height = height
+        super().__init__(width, height)
         self.fig, self.ax = plt.subplots(figsize=(12, 8))
-        plt.subplots_adjust(bottom=0.3)
-        
-        # Ініціалізація параметрів
-        self.antennas = []
-        self.obstacles = []
-        self.interest_points = []
-        self.coverage_radius = 15
-        self.antenna_types = {
-            'small': {'radius': 10, 'cost': 100},
-            'medium': {'radius': 15, 'cost': 200},
-            'large': {'radius': 20, 'cost': 300}
-        }
-        
-        # Інтерактивні елементи
+        plt.subplots_adjust(bottom=0.34)
+        
+        # Фонова оптимізація: потік, черга прогресу та прапорець скасування
+        self.worker = None
+        self.progress_queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.progress_timer = None
+        
+        # Графічні об'єкти та інтерактивні елементи
+        self._init_artists()
         self._init_ui()
         
+    def _init_artists(self):
+        """Постійні графічні об'єкти; далі оновлюються лише їхні дані"""
+        self.ax.set_xlim(0, self.width)
+        self.ax.set_ylim(0, self.height)
+        self.ax.grid(True)
+        
+        self.obstacle_artist, = self.ax.plot([], [], 'ks', markersize=8, linestyle='none')
+        self.interest_artist, = self.ax.plot([], [], 'go', markersize=5, alpha=0.5, linestyle='none')
+        self.antenna_artist, = self.ax.plot([], [], 'ro', markersize=8, linestyle='none')
+        self.antenna_circles = self._circle_collection('r')
+        
+        # Тимчасове рішення та стан оптимізації перемальовуються блітингом
+        self.solution_artist, = self.ax.plot([], [], 'bo', markersize=10, linestyle='none', animated=True)
+        self.solution_circles = self._circle_collection('b', animated=True)
+        self.status_text = self.ax.text(0.01, 0.99, '', transform=self.ax.transAxes,
+                                        va='top', animated=True)
+        self.progress_artists = (self.solution_circles, self.solution_artist, self.status_text)
+        
+        # Шар теплової карти потенційного покриття (растровий режим)
+        self.heatmap_artist = self.ax.imshow(np.zeros((1, 1)), extent=(0, self.width, 0, self.height),
+                                             origin='lower', cmap='YlOrRd', alpha=0.4, zorder=0,
+                                             aspect='auto', visible=False)
+        
+        self.background = None
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+    
+    def _circle_collection(self, color: str, animated: bool = False) -> EllipseCollection:
+        """Колекція кіл покриття, що оновлюється через зміщення та розміри"""
+        circles = EllipseCollection([], [], [], units='xy', offsets=np.empty((0, 2)),
+                                    offset_transform=self.ax.transData,
+                                    facecolors=color, edgecolors='none', alpha=0.1, animated=animated)
+        self.ax.add_collection(circles)
+        return circles
+    
+    @staticmethod
+    def _set_circles(circles: EllipseCollection, centers: np.ndarray, radii: np.ndarray):
+        circles.set_offsets(centers)
+        circles.set_widths(2 * radii)
+        circles.set_heights(2 * radii)
+        circles.set_angles(np.zeros(len(radii)))
+    
+    def _on_draw(self, event):
+        """Після повного малювання - знімок фону для блітингу та анімовані об'єкти"""
+        canvas = self.fig.canvas
+        if getattr(canvas, 'supports_blit', False):
+            self.background = canvas.copy_from_bbox(self.ax.bbox)
+        for artist in self.progress_artists:
+            self.ax.draw_artist(artist)
+    
     def _init_ui(self):
         """Ініціалізація інтерфейсу користувача"""
         # Кнопки
@@ -33,12 +86,20 @@ class AntennaPlacementOptimizer:
         ax_add_interest = plt.axes([0.55, 0.15, 0.15, 0.05])
         ax_random = plt.axes([0.15, 0.05, 0.15, 0.05])
         ax_optimize = plt.axes([0.55, 0.05, 0.15, 0.05])
+        ax_cancel = plt.axes([0.75, 0.05, 0.15, 0.05])
+        ax_heatmap = plt.axes([0.35, 0.05, 0.15, 0.05])
+        ax_raster = plt.axes([0.75, 0.15, 0.15, 0.05])
+        ax_budget_run = plt.axes([0.91, 0.15, 0.08, 0.05])
         
         self.btn_add_antenna = Button(ax_add_antenna, 'Додати антену')
         self.btn_add_obstacle = Button(ax_add_obstacle, 'Додати перешкоду')
         self.btn_add_interest = Button(ax_add_interest, 'Додати точку інтересу')
         self.btn_random = Button(ax_random, 'Випадкове розміщення')
         self.btn_optimize = Button(ax_optimize, 'Оптимізувати')
+        self.btn_cancel = Button(ax_cancel, 'Скасувати')
+        self.btn_heatmap = Button(ax_heatmap, 'Теплова карта')
+        self.btn_raster = Button(ax_raster, 'Пошук по растру')
+        self.btn_budget = Button(ax_budget_run, 'Бюджет')
         
         # Обробники подій
         self.btn_add_antenna.on_clicked(self._add_antenna)
@@ -46,15 +107,21 @@ class AntennaPlacementOptimizer:
         self.btn_add_interest.on_clicked(self._add_interest_point)
         self.btn_random.on_clicked(self._random_placement)
         self.btn_optimize.on_clicked(self._run_optimization)
+        self.btn_cancel.on_clicked(self._cancel_optimization)
+        self.btn_heatmap.on_clicked(self._toggle_heatmap)
+        self.btn_raster.on_clicked(self._run_raster_search)
+        self.btn_budget.on_clicked(self._run_budget_optimization)
         
         # Слайдери
         ax_radius = plt.axes([0.15, 0.22, 0.7, 0.02])
         ax_ants = plt.axes([0.15, 0.25, 0.7, 0.02])
         ax_iter = plt.axes([0.15, 0.28, 0.7, 0.02])
+        ax_budget = plt.axes([0.15, 0.31, 0.7, 0.02])
         
         self.slider_radius = Slider(ax_radius, 'Радіус покриття', 5, 30, valinit=15)
         self.slider_ants = Slider(ax_ants, 'Кількість мурах', 5, 50, valinit=20)
         self.slider_iter = Slider(ax_iter, 'Кількість ітерацій', 10, 200, valinit=50)
+        self.slider_budget = Slider(ax_budget, 'Бюджет', 100, 3000, valinit=1000, valstep=50)
         
         # Обробник кліків на графіку
         self.fig.canvas.mpl_connect('button_press_event', self._on_click)
@@ -63,13 +130,14 @@ class AntennaPlacementOptimizer:
     
     def _on_click(self, event):
         """Обробник кліків на графіку"""
-        if event.inaxes != self.ax:
+        if event.inaxes != self.ax or self._is_running():
             return
         
         if event.button == 1:  # Ліва кнопка миші
             self.antennas.append((event.xdata, event.ydata, 'medium'))
         elif event.button == 3:  # Права кнопка миші
             self.obstacles.append((event.xdata, event.ydata))
+            self._obstacle_grid()
         
         self._update_plot()
     
@@ -81,18 +149,31 @@ class AntennaPlacementOptimizer:
     
     def _add_obstacle(self, event):
         """Додати перешкоду вручну"""
+        if self._is_running():
+            print("Зачекайте завершення або скасуйте оптимізацію!")
+            return
+
         x, y = np.random.rand(2) * [self.width, self.height]
         self.obstacles.append((x, y))
+        self._obstacle_grid()
         self._update_plot()
     
     def _add_interest_point(self, event):
         """Додати точку інтересу вручну"""
+        if self._is_running():
+            print("Зачекайте завершення або скасуйте оптимізацію!")
+            return
+
         x, y = np.random.rand(2) * [self.width, self.height]
         self.interest_points.append((x, y))
         self._update_plot()
     
     def _random_placement(self, event):
         """Випадкове розміщення об'єктів"""
+        if self._is_running():
+            print("Зачекайте завершення або скасуйте оптимізацію!")
+            return
+
         n_antennas = random.randint(3, 10)
         n_obstacles = random.randint(5, 15)
         n_interest = random.randint(10, 20)
@@ -113,175 +194,177 @@ class AntennaPlacementOptimizer:
         self._update_plot()
     
     def _run_optimization(self, event):
-        """Запуск оптимізації"""
+        """Запуск оптимізації у фоновому потоці"""
         if not self.interest_points:
             print("Додайте точки інтересу перед оптимізацією!")
             return
+        if self._is_running():
+            print("Оптимізація вже виконується!")
+            return
         
-        # Параметри алгоритму
+        # Параметри алгоритму фіксуються на момент запуску
         n_ants = int(self.slider_ants.val)
         n_iterations = int(self.slider_iter.val)
         self.coverage_radius = int(self.slider_radius.val)
         
-        # Запуск мурашиного алгоритму
-        best_solution = self._ant_colony_optimization(n_ants, n_iterations)
+        # Запуск мурашиного алгоритму; GUI лише опитує чергу прогресу таймером
+        def solve(progress, cancel):
+            antennas, _, _ = self.solve('aco', n_ants, n_iterations, progress=progress, cancel=cancel)
+            return antennas
         
-        # Оновлення антен з оптимальними позиціями
-        self.antennas = [(x, y, 'medium') for x, y in best_solution]
-        self._update_plot()
+        self._start_worker(solve)
     
-    def _ant_colony_optimization(self, n_ants: int, n_iterations: int) -> List[Tuple[float, float]]:
-        """Мурашиний алгоритм для оптимізації розміщення антен"""
-        # Ініціалізація феромонів
-        pheromone = np.ones((len(self.interest_points), len(self.interest_points))) / len(self.interest_points)
+    def _run_budget_optimization(self, event):
+        """Вибір позицій і типів антен з максимальним покриттям у межах бюджету"""
+        if not self.interest_points:
+            print("Додайте точки інтересу перед оптимізацією!")
+            return
+        if self._is_running():
+            print("Оптимізація вже виконується!")
+            return
         
-        best_solution = None
-        best_coverage = -1
+        n_ants = int(self.slider_ants.val)
+        n_iterations = int(self.slider_iter.val)
+        total_budget = float(self.slider_budget.val)
         
-        for iteration in range(n_iterations):
-            solutions = []
-            
-            for _ in range(n_ants):
-                # Генерація рішення (вибір точок для антен)
-                solution = self._generate_solution(pheromone)
-                coverage = self._calculate_coverage(solution)
-                solutions.append((solution, coverage))
-                
-                # Оновлення найкращого рішення
-                if coverage > best_coverage:
-                    best_coverage = coverage
-                    best_solution = solution
-            
-            # Оновлення феромонів
-            pheromone = self._update_pheromones(pheromone, solutions)
-            
-            # Випаровування феромонів
-            pheromone *= 0.95
-            
-            # Візуалізація прогресу
-            if iteration % 10 == 0:
-                print(f"Iteration {iteration}: Best coverage = {best_coverage:.2f}%")
-                self._visualize_progress(best_solution, iteration, best_coverage)
+        def solve(progress, cancel):
+            antennas, coverage, cost = self.solve('budget', n_ants, n_iterations, total_budget,
+                                                  progress=progress, cancel=cancel)
+            print(f"Бюджетна оптимізація: покриття {coverage:.2f}%, вартість {cost:.0f} з {total_budget:.0f}")
+            return antennas
         
-        return best_solution
+        self._start_worker(solve)
+    
+    def _start_worker(self, solve):
+        """Запуск solve(progress, cancel) -> антени у фоновому потоці з опитуванням прогресу"""
+        self.cancel_event.clear()
+        self.worker = threading.Thread(target=self._optimization_worker, args=(solve,), daemon=True)
+        self.worker.start()
+        
+        self.progress_timer = self.fig.canvas.new_timer(interval=100)
+        self.progress_timer.add_callback(self._poll_progress)
+        self.progress_timer.start()
+    
+    def _toggle_heatmap(self, event):
+        """Показати/сховати карту потенційного покриття для поточного радіуса (з тінями перешкод)"""
+        if self.heatmap_artist.get_visible():
+            self.heatmap_artist.set_visible(False)
+        else:
+            heat = raster.coverage_heatmap(self.interest_points, self.width, self.height,
+                                           int(self.slider_radius.val), self.RASTER_SHAPE, self.obstacles)
+            self.heatmap_artist.set_data(heat)
+            self.heatmap_artist.set_clim(0, max(heat.max(), 1))
+            self.heatmap_artist.set_visible(True)
+        self.fig.canvas.draw_idle()
     
-    def _generate_solution(self, pheromone: np.ndarray) -> List[Tuple[float, float]]:
-        """Генерація рішення для однієї мурахи"""
+    def _run_raster_search(self, event):
+        """Розміщення антен у довільних точках області (по комірках растра)"""
         if not self.interest_points:
-            return []
-            
-        # Перевірка, що кількість точок для антен не перевищує кількість точок інтересу
-        n_points = min(5, len(self.interest_points))
-        selected_points = random.sample(self.interest_points, n_points)
-        return [(x, y) for x, y in selected_points]
+            print("Додайте точки інтересу перед оптимізацією!")
+            return
+        if self._is_running():
+            print("Оптимізація вже виконується!")
+            return
+        
+        self.coverage_radius = int(self.slider_radius.val)
+        self.antennas, coverage, _ = self.solve('raster')
+        print(f"Растровий пошук: покриття {coverage:.2f}%")
+        self._update_plot()
     
-    def _calculate_coverage(self, antennas: List[Tuple[float, float]]) -> float:
-        """Розрахунок відсотка покриття"""
-        if not self.interest_points:  # Якщо немає точок інтересу
-            return 0.0
-            
-        covered = 0
-        radius = self.coverage_radius
-        
-        for ip_x, ip_y in self.interest_points:
-            for ant_x, ant_y in antennas:
-                # Перевірка, що координати антен валідні
-                if not isinstance(ant_x, (int, float)) or not isinstance(ant_y, (int, float)):
-                    continue
-                    
-                distance = np.sqrt((ip_x - ant_x)**2 + (ip_y - ant_y)**2)
-                if distance <= radius and not self._is_obstructed((ant_x, ant_y), (ip_x, ip_y)):
-                    covered += 1
-                    break
-        
-        return (covered / len(self.interest_points)) * 100
+    def _cancel_optimization(self, event):
+        """Зупинити фонову оптимізацію після поточної ітерації"""
+        if self._is_running():
+            self.cancel_event.set()
     
-    def _is_obstructed(self, point1: Tuple[float, float], point2: Tuple[float, float]) -> bool:
-        """Перевірка на наявність перешкод між двома точками"""
-        if not self.obstacles:  # Якщо немає перешкод
-            return False
-            
-        for obs_x, obs_y in self.obstacles:
-            # Спрощена перевірка - якщо перешкода ближче ніж 5 одиниць до лінії
-            distance = self._distance_to_line(point1, point2, (obs_x, obs_y))
-            if distance < 5:
-                return True
-        return False
+    def _is_running(self) -> bool:
+        return self.worker is not None and self.worker.is_alive()
     
-    def _distance_to_line(self, p1, p2, p3):
-        """Відстань від точки p3 до лінії між p1 і p2"""
-        x1, y1 = p1
-        x2, y2 = p2
-        x3, y3 = p3
-        
-        # Якщо точки p1 і p2 збігаються, повертаємо відстань між p1 і p3
-        if x1 == x2 and y1 == y2:
-            return np.sqrt((x3 - x1)**2 + (y3 - y1)**2)
-        
-        px = x2 - x1
-        py = y2 - y1
-        norm = px*px + py*py
-        
-        u = ((x3 - x1) * px + (y3 - y1) * py) / float(norm)
-        u = max(0, min(1, u))
-        
-        x = x1 + u * px
-        y = y1 + u * py
-        
-        dx = x - x3
-        dy = y - y3
-        
-        return np.sqrt(dx*dx + dy*dy)
+    def _optimization_worker(self, solve):
+        """Тіло фонового потоку: лише обчислення, без звернень до matplotlib"""
+        def report(iteration, coverage, solution):
+            self.progress_queue.put(('progress', iteration, coverage, solution))
+        
+        try:
+            antennas = solve(report, self.cancel_event)
+            status = 'cancelled' if self.cancel_event.is_set() else 'done'
+            self.progress_queue.put((status, None, None, antennas))
+        except Exception as error:
+            self.progress_queue.put(('error', None, None, error))
     
-    def _update_pheromones(self, pheromone: np.ndarray, solutions: List) -> np.ndarray:
-        """Оновлення матриці феромонів"""
-        # Спрощена реалізація
-        best_solution, best_coverage = max(solutions, key=lambda x: x[1])
-        for i in range(len(best_solution)):
-            for j in range(i+1, len(best_solution)):
-                idx_i = self.interest_points.index(best_solution[i])
-                idx_j = self.interest_points.index(best_solution[j])
-                pheromone[idx_i][idx_j] += best_coverage / 100
-                pheromone[idx_j][idx_i] += best_coverage / 100
-        
-        return pheromone
+    def _poll_progress(self):
+        """Обробка повідомлень фонового потоку (викликається таймером фігури)"""
+        latest = None
+        while True:
+            try:
+                message = self.progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            status, iteration, coverage, payload = message
+            if status == 'progress':
+                latest = message
+                continue
+            
+            # Завершення роботи: оновлення антен з оптимальними позиціями
+            self.progress_timer.stop()
+            if status == 'error':
+                print(f"Помилка оптимізації: {payload}")
+            else:
+                if status == 'cancelled':
+                    print("Оптимізацію скасовано, показано найкраще знайдене рішення")
+                self.antennas = payload
+            self._update_plot()
+            return
+        
+        if latest is not None:
+            _, iteration, coverage, solution = latest
+            self._show_progress(solution, iteration, coverage)
     
     def _visualize_progress(self, solution: List[Tuple[float, float]], iteration: int, coverage: float):
         """Тимчасова візуалізація прогресу"""
-        self.ax.set_title(f'Оптимізація: Ітерація {iteration}, Покриття: {coverage:.1f}%')
-        self._update_plot(solution)
+        self._show_progress(solution, iteration, coverage)
         plt.pause(0.1)
     
+    def _show_progress(self, solution: List[Tuple[float, float]], iteration: int, coverage: float):
+        """Кадр прогресу: перемальовуються лише тимчасове рішення та підпис"""
+        self._set_solution(solution)
+        self.status_text.set_text(f'Оптимізація: Ітерація {iteration}, Покриття: {coverage:.1f}%')
+        
+        canvas = self.fig.canvas
+        if self.background is None:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self.background)
+        for artist in self.progress_artists:
+            self.ax.draw_artist(artist)
+        canvas.blit(self.ax.bbox)
+    
+    def _set_solution(self, solution):
+        points = np.array(solution or [], dtype=float).reshape(-1, 2)
+        self.solution_artist.set_data(points[:, 0], points[:, 1])
+        self._set_circles(self.solution_circles, points, np.full(len(points), float(self.coverage_radius)))
+    
     def _update_plot(self, temp_solution=None):
-        """Оновлення графічного відображення"""
-        self.ax.clear()
-        self.ax.set_xlim(0, self.width)
-        self.ax.set_ylim(0, self.height)
-        self.ax.grid(True)
-        
+        """Оновлення графічного відображення (дані наявних об'єктів, без їх перестворення)"""
         # Відображення перешкод
-        for x, y in self.obstacles:
-            self.ax.plot(x, y, 'ks', markersize=8)
+        obstacles = np.array(self.obstacles, dtype=float).reshape(-1, 2)
+        self.obstacle_artist.set_data(obstacles[:, 0], obstacles[:, 1])
         
         # Відображення точок інтересу
-        for x, y in self.interest_points:
-            self.ax.plot(x, y, 'go', markersize=5, alpha=0.5)
+        points = np.array(self.interest_points, dtype=float).reshape(-1, 2)
+        self.interest_artist.set_data(points[:, 0], points[:, 1])
         
         # Відображення антен
-        for x, y, ant_type in self.antennas:
-            radius = self.antenna_types[ant_type]['radius']
-            self.ax.plot(x, y, 'ro', markersize=8)
-            circle = plt.Circle((x, y), radius, color='r', alpha=0.1)
-            self.ax.add_patch(circle)
+        antennas = np.array([(x, y) for x, y, _ in self.antennas], dtype=float).reshape(-1, 2)
+        radii = np.array([self.antenna_types[ant_type]['radius'] for _, _, ant_type in self.antennas], dtype=float)
+        self.antenna_artist.set_data(antennas[:, 0], antennas[:, 1])
+        self._set_circles(self.antenna_circles, antennas, radii)
         
         # Відображення тимчасового рішення (під час оптимізації)
-        if temp_solution:
-            for x, y in temp_solution:
-                self.ax.plot(x, y, 'bo', markersize=10)
-                circle = plt.Circle((x, y), self.coverage_radius, color='b', alpha=0.1)
-                self.ax.add_patch(circle)
+        self._set_solution(temp_solution)
+        if not temp_solution:
+            self.status_text.set_text('')
         
-        self.fig.canvas.draw()
+        self.fig.canvas.draw_idle()
 
 # Запуск програми
 if __name__ == "__main__":
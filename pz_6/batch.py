@@ -0,0 +1,110 @@
+import numpy as np
+import argparse
+import csv
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List
+
+from solver import (AntennaPlacementSolver, DEFAULT_PARAMS, METHODS, SCENARIO_FORMATS,
+                    load_scenario, save_scenario)
+
+
+def scenario_files(directory: str) -> List[str]:
+    """Файли сценаріїв (.json, .npz) у каталозі"""
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                  if os.path.splitext(name)[1].lower() in SCENARIO_FORMATS)
+
+
+def generate_scenarios(directory: str, count: int, n_points: int = 100, n_obstacles: int = 30,
+                       seed: int = 0, extension: str = '.json') -> List[str]:
+    """Випадкові сценарії для пакетної оптимізації"""
+    paths = []
+    for index, child in enumerate(np.random.SeedSequence(seed).spawn(count)):
+        rng = np.random.default_rng(child)
+        solver = AntennaPlacementSolver()
+        solver.interest_points = [tuple(p) for p in rng.random((n_points, 2)) * [solver.width, solver.height]]
+        solver.obstacles = [tuple(p) for p in rng.random((n_obstacles, 2)) * [solver.width, solver.height]]
+        path = os.path.join(directory, f'scenario_{index:03d}{extension}')
+        save_scenario(solver, path, {'seed': int(child.generate_state(1)[0])})
+        paths.append(path)
+    return paths
+
+
+def run_scenario(path: str, out_dir: str, overrides: Dict = None) -> Dict:
+    """Оптимізація одного сценарію у процесі-працівнику; результат - файл сценарію з антенами"""
+    solver, params = load_scenario(path)
+    params = {**DEFAULT_PARAMS, **params, **(overrides or {})}
+    random.seed(params['seed'])
+    np.random.seed(params['seed'])
+
+    start = time.perf_counter()
+    solver.antennas, coverage, cost = solver.solve(params['method'], int(params['n_ants']),
+                                                   int(params['n_iterations']), float(params['budget']))
+    runtime = time.perf_counter() - start
+
+    save_scenario(solver, os.path.join(out_dir, os.path.basename(path)), params)
+    return {
+        'scenario': os.path.basename(path),
+        'method': params['method'],
+        'points': len(solver.interest_points),
+        'obstacles': len(solver.obstacles),
+        'antennas': len(solver.antennas),
+        'coverage': coverage,
+        'cost': cost,
+        'runtime': runtime,
+    }
+
+
+def run_batch(directory: str, out_dir: str, overrides: Dict = None, workers: int = None) -> List[Dict]:
+    """
+    Оптимізація всіх сценаріїв каталогу в пулі процесів
+
+    Параметри з overrides замінюють параметри, збережені у сценаріях.
+    Зведена таблиця записується в out_dir/summary.csv.
+    """
+    paths = scenario_files(directory)
+    os.makedirs(out_dir, exist_ok=True)
+    summary = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_scenario, path, out_dir, overrides): path for path in paths}
+        for completed, future in enumerate(as_completed(futures), 1):
+            row = future.result()
+            summary.append(row)
+            print(f"[{completed}/{len(paths)}] {row['scenario']}: покриття {row['coverage']:.2f}%, "
+                  f"вартість {row['cost']:.0f}, {row['runtime']:.2f} с")
+    summary.sort(key=lambda row: row['scenario'])
+    if summary:
+        with open(os.path.join(out_dir, 'summary.csv'), 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(summary[0].keys()))
+            writer.writeheader()
+            writer.writerows(summary)
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Пакетна оптимізація розміщення антен без інтерфейсу")
+    parser.add_argument('scenarios', help="каталог зі сценаріями .json/.npz")
+    parser.add_argument('--out', default='results', help="каталог для результатів і summary.csv")
+    parser.add_argument('--method', choices=METHODS, default=None)
+    parser.add_argument('--ants', type=int, default=None)
+    parser.add_argument('--iterations', type=int, default=None)
+    parser.add_argument('--budget', type=float, default=None)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--generate', type=int, default=0,
+                        help="спершу створити стільки випадкових сценаріїв у каталозі scenarios")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if args.generate:
+        os.makedirs(args.scenarios, exist_ok=True)
+        generate_scenarios(args.scenarios, args.generate, seed=args.seed)
+
+    overrides = {name: value for name, value in (('method', args.method), ('n_ants', args.ants),
+                                                 ('n_iterations', args.iterations), ('budget', args.budget))
+                 if value is not None}
+    summary = run_batch(args.scenarios, args.out, overrides, args.workers)
+    if summary:
+        print(f"\nСереднє покриття: {np.mean([row['coverage'] for row in summary]):.2f}%, "
+              f"сумарний час: {sum(row['runtime'] for row in summary):.2f} с")
@@ -0,0 +1,146 @@
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import argparse
+import random
+import sqlite3
+import time
+
+from antenna import AntennaPlacementOptimizer
+from distance_cache import euclidean_distances
+from profiling import PHASES, PROFILE_MODES, profile_run, save_stats, summarize
+from solver import OBSTACLE_BUFFER, AntennaPlacementSolver
+from test import AntColony
+
+
+def benchmark_line_of_sight(obstacle_counts=(100, 1000, 10000, 50000), n_segments=2000, size=1000):
+    """Час перевірки прямої видимості залежно від кількості перешкод"""
+    rng = np.random.default_rng(0)
+    optimizer = AntennaPlacementOptimizer(width=size, height=size)
+    starts = rng.random((n_segments, 2)) * size
+    ends = starts + (rng.random((n_segments, 2)) - 0.5) * 2 * optimizer.coverage_radius
+
+    results = []
+    for count in obstacle_counts:
+        optimizer.obstacles = [tuple(p) for p in rng.random((count, 2)) * size]
+        optimizer._obstacle_grid()  # Побудова індексу не входить у вимір
+
+        start = time.perf_counter()
+        optimizer._obstructed_segments_indexed(starts, ends)
+        indexed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for p1, p2 in zip(starts[:50], ends[:50]):
+            for obstacle in optimizer.obstacles:
+                optimizer._distance_to_line(p1, p2, obstacle)
+        full_scan = (time.perf_counter() - start) * n_segments / 50
+
+        results.append((count, indexed, full_scan))
+        print(f"Перешкод: {count:>7}, індекс: {indexed * 1000:8.1f} мс, повний перебір: {full_scan * 1000:10.1f} мс")
+    plt.close(optimizer.fig)
+    return results
+
+
+def benchmark_brute_force(obstacle_counts=(16, 64, 256, 1024), n_segments=20000, size=100):
+    """
+    Поріг GRID_MIN_OBSTACLES: повний перебір, перебір з відсіюванням за прямокутником відрізка
+    та індекс-сітка на щільній сцені (відрізки довжиною до радіуса покриття)
+    """
+    rng = np.random.default_rng(0)
+    solver = AntennaPlacementSolver(width=size, height=size)
+    solver.GRID_MIN_OBSTACLES = float('inf')
+    starts = rng.random((n_segments, 2)) * size
+    ends = starts + (rng.random((n_segments, 2)) - 0.5) * 2 * solver.coverage_radius
+
+    def full_scan(chunk=4096):
+        obstacles = np.array(solver.obstacles, dtype=float)
+        for begin in range(0, n_segments, chunk):
+            distance = solver._distance_to_segments(starts[begin:begin + chunk, None, :],
+                                                    ends[begin:begin + chunk, None, :], obstacles[None, :, :])
+            (distance < OBSTACLE_BUFFER).any(axis=1)
+
+    results = []
+    for count in obstacle_counts:
+        solver.obstacles = [tuple(p) for p in rng.random((count, 2)) * size]
+        solver._obstacle_grid()
+        times = []
+        for method in (full_scan, lambda: solver._obstructed_segments(starts, ends),
+                       lambda: solver._obstructed_segments_indexed(starts, ends)):
+            start = time.perf_counter()
+            method()
+            times.append(time.perf_counter() - start)
+        results.append((count, *times))
+        print(f"Перешкод: {count:>5}, повний перебір: {times[0] * 1000:8.1f} мс, "
+              f"з відсіюванням: {times[1] * 1000:8.1f} мс, сітка: {times[2] * 1000:8.1f} мс")
+    return results
+
+
+def benchmark_redraw(object_counts=(10, 100, 1000, 5000), repeats=5):
+    """Час оновлення графіка та кадру прогресу залежно від кількості об'єктів"""
+    rng = np.random.default_rng(0)
+    results = []
+    for count in object_counts:
+        optimizer = AntennaPlacementOptimizer()
+        optimizer.obstacles = [tuple(p) for p in rng.random((count, 2)) * 100]
+        optimizer.interest_points = [tuple(p) for p in rng.random((count, 2)) * 100]
+        optimizer.antennas = [(x, y, 'medium') for x, y in rng.random((count // 10 + 1, 2)) * 100]
+        optimizer.fig.canvas.draw()
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            optimizer._update_plot()
+        update = (time.perf_counter() - start) / repeats
+
+        start = time.perf_counter()
+        for iteration in range(repeats):
+            optimizer._show_progress(optimizer.interest_points[:5], iteration, 50.0)
+        progress = (time.perf_counter() - start) / repeats
+
+        results.append((count, update, progress))
+        print(f"Об'єктів: {count:>5}, _update_plot: {update * 1000:7.2f} мс, кадр прогресу: {progress * 1000:7.2f} мс")
+        plt.close(optimizer.fig)
+    return results
+
+
+def benchmark_colony_phases(city_counts=(10, 20, 40), n_ants=10, n_iterations=20, db_path=None,
+                            profile_mode=None):
+    """
+    Час фаз ітерації AntColony.run і лічильники залежно від кількості міст
+
+    :param db_path: база результатів для статистики кожної ітерації (таблиця iteration_stats)
+    :param profile_mode: 'cprofile' або 'tracemalloc' - додатковий прогін під профайлером
+    """
+    results = []
+    for count in city_counts:
+        random.seed(0)
+        cities = np.random.default_rng(count).random((count, 2)) * 100
+        colony = AntColony(euclidean_distances(cities), n_ants=n_ants, n_iterations=n_iterations, profile=True)
+        colony.run()
+        totals = summarize(colony.stats)
+        results.append((count, totals))
+        phases = ', '.join(f"{phase}: {totals[f'{phase}_time'] / n_iterations * 1000:.2f}" for phase in PHASES)
+        print(f"Міст: {count:>4}, мс на ітерацію - {phases}; "
+              f"оцінок ймовірностей: {totals['probability_evaluations']}")
+
+        if db_path:
+            conn = sqlite3.connect(db_path)
+            save_stats(colony.stats, conn, f'benchmark/{count}/{n_ants}/{n_iterations}')
+            conn.close()
+        if profile_mode:
+            colony = AntColony(euclidean_distances(cities), n_ants=n_ants, n_iterations=n_iterations)
+            _, report = profile_run(colony, profile_mode)
+            print(report)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Вимірювання продуктивності")
+    parser.add_argument('--db', default=None, help="база результатів для статистики ітерацій мурашиного алгоритму")
+    parser.add_argument('--profile-mode', choices=PROFILE_MODES, default=None)
+    args = parser.parse_args()
+
+    benchmark_line_of_sight()
+    benchmark_brute_force()
+    benchmark_redraw()
+    benchmark_colony_phases(db_path=args.db, profile_mode=args.profile_mode)
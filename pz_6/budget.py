@@ -0,0 +1,213 @@
+import numpy as np
+import random
+import threading
+import time
+from typing import List, Tuple
+
+
+class SiteCoverage:
+    """
+    Для кожного типу антени - які точки інтересу покриває антена в кожній позиції
+
+    Зберігається у форматі CSR: точки позиції i - indices[indptr[i]:indptr[i + 1]].
+    Позиції антен - точки інтересу.
+    """
+
+    def __init__(self, optimizer, chunk: int = 512):
+        points = np.array(optimizer.interest_points, dtype=float).reshape(-1, 2)
+        self.n_points = len(points)
+        self.types = list(optimizer.antenna_types)
+        self.costs = np.array([optimizer.antenna_types[t]['cost'] for t in self.types], dtype=float)
+        self.indptr = []
+        self.indices = []
+        for name in self.types:
+            radius = optimizer.antenna_types[name]['radius']
+            counts, columns = [], []
+            for begin in range(0, len(points), chunk):
+                rows, cols = np.nonzero(optimizer._site_coverage(points[begin:begin + chunk], points, radius))
+                counts.append(np.bincount(rows, minlength=len(points[begin:begin + chunk])))
+                columns.append(cols)
+            counts = np.concatenate(counts) if counts else np.zeros(0, dtype=int)
+            self.indptr.append(np.concatenate([[0], np.cumsum(counts)]))
+            self.indices.append(np.concatenate(columns) if columns else np.zeros(0, dtype=int))
+
+    def points(self, site: int, kind: int) -> np.ndarray:
+        """Точки, які покриває антена типу kind у позиції site"""
+        indptr = self.indptr[kind]
+        return self.indices[kind][indptr[site]:indptr[site + 1]]
+
+    def gains(self, counts: np.ndarray, kind: int) -> np.ndarray:
+        """Приріст покриття від додавання антени типу kind у кожну позицію (CSR x вектор)"""
+        uncovered = (counts == 0)[self.indices[kind]].astype(np.int64)
+        sums = np.concatenate([[0], np.cumsum(uncovered)])
+        indptr = self.indptr[kind]
+        return sums[indptr[1:]] - sums[indptr[:-1]]
+
+
+class BudgetPlacement:
+    """
+    Розміщення антен різних типів з лічильником антен, що покривають кожну точку
+
+    Завдяки лічильникам зміна покриття від додавання, видалення, переміщення чи зміни
+    типу однієї антени рахується лише по точках, яких вона стосується.
+    """
+
+    def __init__(self, coverage: SiteCoverage, budget: float):
+        self.coverage = coverage
+        self.budget = budget
+        self.counts = np.zeros(coverage.n_points, dtype=np.int32)
+        self.antennas = {}  # позиція -> індекс типу
+        self.cost = 0.0
+        self.covered = 0
+
+    def copy(self) -> 'BudgetPlacement':
+        other = BudgetPlacement(self.coverage, self.budget)
+        other.counts = self.counts.copy()
+        other.antennas = dict(self.antennas)
+        other.cost = self.cost
+        other.covered = self.covered
+        return other
+
+    @property
+    def coverage_percent(self) -> float:
+        return (self.covered / self.coverage.n_points) * 100 if self.coverage.n_points else 0.0
+
+    def add_delta(self, site: int, kind: int) -> int:
+        return int(np.count_nonzero(self.counts[self.coverage.points(site, kind)] == 0))
+
+    def remove_delta(self, site: int) -> int:
+        return -int(np.count_nonzero(self.counts[self.coverage.points(site, self.antennas[site])] == 1))
+
+    def replace_delta(self, site: int, new_site: int, new_kind: int) -> int:
+        """Зміна покриття від заміни антени в site на антену типу new_kind у new_site"""
+        old = self.coverage.points(site, self.antennas[site])
+        new = self.coverage.points(new_site, new_kind)
+        lost = old[self.counts[old] == 1]
+        lost = np.count_nonzero(~np.isin(lost, new))
+        # Точки, які зараз покриває лише стара антена, після заміни все одно враховуються в new
+        gained = np.count_nonzero(self.counts[new] == 0)
+        return int(gained - lost)
+
+    def add(self, site: int, kind: int):
+        points = self.coverage.points(site, kind)
+        self.covered += int(np.count_nonzero(self.counts[points] == 0))
+        self.counts[points] += 1
+        self.antennas[site] = kind
+        self.cost += self.coverage.costs[kind]
+
+    def remove(self, site: int):
+        kind = self.antennas.pop(site)
+        points = self.coverage.points(site, kind)
+        self.counts[points] -= 1
+        self.covered -= int(np.count_nonzero(self.counts[points] == 0))
+        self.cost -= self.coverage.costs[kind]
+
+    def replace(self, site: int, new_site: int, new_kind: int):
+        self.remove(site)
+        self.add(new_site, new_kind)
+
+    def solution(self, optimizer) -> List[Tuple[float, float, str]]:
+        """Антени у форматі optimizer.antennas"""
+        return [(*optimizer.interest_points[site], self.coverage.types[kind])
+                for site, kind in self.antennas.items()]
+
+
+def construct(coverage: SiteCoverage, budget: float, pheromone: np.ndarray,
+              alpha: float = 1, beta: float = 2) -> BudgetPlacement:
+    """Побудова рішення однією мурахою: (позиція, тип) з ймовірністю ~ феромон * (приріст / вартість)"""
+    placement = BudgetPlacement(coverage, budget)
+    n_sites = coverage.n_points
+    while True:
+        weights = np.zeros((n_sites, len(coverage.types)))
+        for kind, cost in enumerate(coverage.costs):
+            if placement.cost + cost > budget:
+                continue
+            weights[:, kind] = pheromone[:, kind] ** alpha * (coverage.gains(placement.counts, kind) / cost) ** beta
+        if placement.antennas:
+            weights[list(placement.antennas)] = 0
+        total = weights.sum()
+        if total <= 0:
+            return placement
+        cumulative = np.cumsum(weights.ravel())
+        choice = min(int(np.searchsorted(cumulative, random.random() * total, side='right')), weights.size - 1)
+        site, kind = divmod(choice, len(coverage.types))
+        placement.add(site, kind)
+
+
+def local_search(placement: BudgetPlacement, n_moves: int = 5000, time_limit: float = None) -> BudgetPlacement:
+    """
+    Покращення рішення випадковими ходами: додати, видалити, перемістити, змінити тип
+
+    Хід приймається, якщо вкладається в бюджет і збільшує покриття
+    (або не зменшує покриття і зменшує вартість).
+    """
+    coverage = placement.coverage
+    n_types = len(coverage.types)
+    start = time.perf_counter()
+    for _ in range(n_moves):
+        if time_limit is not None and time.perf_counter() - start > time_limit:
+            break
+        move = random.random()
+        sites = list(placement.antennas)
+        if not sites or move < 0.25:
+            site, kind = random.randrange(coverage.n_points), random.randrange(n_types)
+            if site in placement.antennas or placement.cost + coverage.costs[kind] > placement.budget:
+                continue
+            if placement.add_delta(site, kind) > 0:
+                placement.add(site, kind)
+        elif move < 0.4:
+            site = random.choice(sites)
+            if placement.remove_delta(site) == 0:
+                placement.remove(site)
+        else:
+            site = random.choice(sites)
+            if move < 0.7:
+                # Переміщення в іншу позицію з тим самим типом
+                new_site, new_kind = random.randrange(coverage.n_points), placement.antennas[site]
+                if new_site in placement.antennas:
+                    continue
+            else:
+                # Зміна типу на місці
+                new_site, new_kind = site, random.randrange(n_types)
+                if new_kind == placement.antennas[site]:
+                    continue
+            cost_change = coverage.costs[new_kind] - coverage.costs[placement.antennas[site]]
+            if placement.cost + cost_change > placement.budget:
+                continue
+            delta = placement.replace_delta(site, new_site, new_kind)
+            if delta > 0 or (delta == 0 and cost_change < 0):
+                placement.replace(site, new_site, new_kind)
+    return placement
+
+
+def optimize_budget(optimizer, budget: float, n_ants: int = 20, n_iterations: int = 50,
+                    n_moves: int = 5000, decay: float = 0.95, progress=None,
+                    cancel: threading.Event = None) -> Tuple[List[Tuple[float, float, str]], float, float]:
+    """
+    Максимізація покриття за обмеженого бюджету: мурашиний алгоритм + локальний пошук
+
+    :return: (антени (x, y, тип), відсоток покриття, вартість)
+    """
+    if not optimizer.interest_points:
+        return [], 0.0, 0.0
+    coverage = SiteCoverage(optimizer)
+    pheromone = np.ones((coverage.n_points, len(coverage.types)))
+    best = BudgetPlacement(coverage, budget)
+
+    for iteration in range(n_iterations):
+        placements = [construct(coverage, budget, pheromone) for _ in range(n_ants)]
+        iteration_best = max(placements, key=lambda p: (p.covered, -p.cost))
+        if (iteration_best.covered, -iteration_best.cost) > (best.covered, -best.cost):
+            best = iteration_best
+
+        pheromone *= decay
+        for site, kind in best.antennas.items():
+            pheromone[site, kind] += best.coverage_percent / 100
+
+        if progress is not None:
+            progress(iteration, best.coverage_percent, [optimizer.interest_points[s] for s in best.antennas])
+        if cancel is not None and cancel.is_set():
+            break
+
+    best = local_search(best.copy(), n_moves)
+    return best.solution(optimizer), best.coverage_percent, best.cost
@@ -0,0 +1,286 @@
+import numpy as np
+import argparse
+import csv
+import itertools
+import json
+import os
+import random
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Set, Tuple
+
+from distance_cache import cache_path, get_distance_matrix, instance_hash, load_distance_matrix
+from profiling import PHASES, PROFILE_MODES, profile_run, save_stats, summarize
+from test import AntColony
+
+DEFAULT_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'colony_sweep.db')
+PARAMS = ('n_ants', 'decay', 'alpha', 'beta')
+
+# Значення для сітки та межі (мін, макс) для випадкового/LHS плану
+DEFAULT_GRID = {
+    'n_ants': [10, 20, 40],
+    'decay': [0.3, 0.5, 0.7, 0.9],
+    'alpha': [0.5, 1, 2],
+    'beta': [1, 2, 5],
+}
+DEFAULT_BOUNDS = {
+    'n_ants': (5, 50),
+    'decay': (0.1, 0.95),
+    'alpha': (0.1, 3),
+    'beta': (0.5, 6),
+}
+
+
+def grid_design(grid: Dict[str, List[float]] = DEFAULT_GRID) -> List[Dict[str, float]]:
+    """Повний перебір значень параметрів"""
+    return [dict(zip(PARAMS, values)) for values in itertools.product(*(grid[p] for p in PARAMS))]
+
+
+def random_design(n_samples: int, bounds: Dict[str, Tuple[float, float]] = DEFAULT_BOUNDS,
+                  seed: int = 0) -> List[Dict[str, float]]:
+    """Рівномірна випадкова вибірка з меж параметрів"""
+    rng = np.random.default_rng(seed)
+    return _scale(rng.random((n_samples, len(PARAMS))), bounds)
+
+
+def latin_hypercube_design(n_samples: int, bounds: Dict[str, Tuple[float, float]] = DEFAULT_BOUNDS,
+                           seed: int = 0) -> List[Dict[str, float]]:
+    """Латинський гіперкуб: кожен параметр покриває всі n_samples інтервалів рівно один раз"""
+    rng = np.random.default_rng(seed)
+    unit = np.empty((n_samples, len(PARAMS)))
+    for k in range(len(PARAMS)):
+        # Відступ 1% від меж інтервалу: округлення значень не переносить точку в сусідній інтервал
+        unit[:, k] = (rng.permutation(n_samples) + 0.01 + 0.98 * rng.random(n_samples)) / n_samples
+    return _scale(unit, bounds)
+
+
+def _scale(unit: np.ndarray, bounds: Dict[str, Tuple[float, float]]) -> List[Dict[str, float]]:
+    configs = []
+    for row in unit:
+        config = {}
+        for value, param in zip(row, PARAMS):
+            low, high = bounds[param]
+            config[param] = low + value * (high - low)
+        config['n_ants'] = int(round(config['n_ants']))
+        config['decay'] = round(config['decay'], 4)
+        config['alpha'] = round(config['alpha'], 4)
+        config['beta'] = round(config['beta'], 4)
+        configs.append(config)
+    return configs
+
+
+def init_db(db_path: str) -> sqlite3.Connection:
+    """Таблиця результатів прогонів: один рядок на (екземпляр, кількість ітерацій, конфігурація, зерно)"""
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+            CREATE TABLE IF NOT EXISTS sweep_results (
+                instance TEXT,
+                n_iterations INTEGER,
+                n_ants INTEGER,
+                decay REAL,
+                alpha REAL,
+                beta REAL,
+                seed INTEGER,
+                path_length REAL,
+                runtime REAL,
+                path TEXT,
+                profile TEXT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (instance, n_iterations, n_ants, decay, alpha, beta, seed)
+            )''')
+    # Бази, створені до появи статистики фаз, не мають стовпця profile
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(sweep_results)')}
+    if 'profile' not in columns:
+        conn.execute('ALTER TABLE sweep_results ADD COLUMN profile TEXT')
+    conn.commit()
+    return conn
+
+
+def task_seed(base_seed: int, repetition: int) -> int:
+    """Зерно повторення; однакове для всіх конфігурацій (спільні випадкові числа)"""
+    return int(np.random.SeedSequence([base_seed, repetition]).generate_state(1)[0])
+
+
+def pending_tasks(configs: List[Dict[str, float]], done: Set[tuple], repetitions: int,
+                  base_seed: int) -> Tuple[List[Tuple[Dict[str, float], int]], int]:
+    """
+    Пари (конфігурація, зерно), яких ще немає в базі
+
+    :param done: записані кортежі (значення PARAMS..., зерно)
+    :return: задачі та кількість пропущених (уже виконаних) повторень
+    """
+    tasks = []
+    for config in configs:
+        for repetition in range(repetitions):
+            seed = task_seed(base_seed, repetition)
+            if tuple(config[p] for p in PARAMS) + (seed,) not in done:
+                tasks.append((config, seed))
+    return tasks, len(configs) * repetitions - len(tasks)
+
+
+def run_pool(function: Callable, tasks: List[tuple], workers: int = None) -> Iterator[Tuple[int, tuple, object]]:
+    """
+    Виконання function(*task) для кожної задачі в пулі процесів
+
+    :return: ітератор (номер завершеної, задача, результат) у порядку завершення
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(function, *task): task for task in tasks}
+        for completed, future in enumerate(as_completed(futures), 1):
+            yield completed, futures[future], future.result()
+
+
+def make_colony(matrix_path: str, n_iterations: int, config: Dict[str, float], seed: int) -> AntColony:
+    """Колонія для одного прогону з відтворюваними випадковими числами"""
+    random.seed(seed)
+    np.random.seed(seed)
+    distances, scale = load_distance_matrix(matrix_path)
+    return AntColony(distances, n_iterations=n_iterations, distance_scale=scale, profile=True, **config)
+
+
+def run_task(matrix_path: str, n_iterations: int, config: Dict[str, float],
+             seed: int) -> Tuple[List[int], float, float, list]:
+    """Один прогін алгоритму у процесі-працівнику (зі статистикою фаз кожної ітерації)"""
+    colony = make_colony(matrix_path, n_iterations, config, seed)
+    start = time.perf_counter()
+    path, length = colony.run()
+    return [int(city) for city in path], length, time.perf_counter() - start, colony.stats
+
+
+def run_id(instance: str, n_iterations: int, config: Dict[str, float], seed: int) -> str:
+    """Ідентифікатор прогону для таблиці iteration_stats (ті самі поля, що й ключ sweep_results)"""
+    return '/'.join(str(value) for value in (instance, n_iterations, *(config[p] for p in PARAMS), seed))
+
+
+def profile_task(matrix_path: str, n_iterations: int, config: Dict[str, float], seed: int,
+                 mode: str = 'cprofile') -> str:
+    """Один прогін у поточному процесі під cProfile або tracemalloc; повертає текстовий звіт"""
+    (path, length), report = profile_run(make_colony(matrix_path, n_iterations, config, seed), mode)
+    return f"{config} seed={seed}: {length:.2f}\n{report}"
+
+
+def run_sweep(configs: List[Dict[str, float]], matrix_path: str, instance: str, n_iterations: int,
+              repetitions: int = 5, base_seed: int = 0, workers: int = None, db_path: str = DEFAULT_DB) -> int:
+    """
+    Запуск усіх повторень у пулі процесів
+
+    Комбінації (конфігурація, зерно), вже записані в базі, пропускаються. Сумарна статистика
+    фаз пишеться в стовпець profile, статистика кожної ітерації - в таблицю iteration_stats.
+
+    :return: кількість пропущених повторень
+    """
+    conn = init_db(db_path)
+    done = set(conn.execute(
+        'SELECT n_ants, decay, alpha, beta, seed FROM sweep_results WHERE instance = ? AND n_iterations = ?',
+        (instance, n_iterations)).fetchall())
+
+    tasks, skipped = pending_tasks(configs, done, repetitions, base_seed)
+    print(f"Задач: {len(tasks)} (пропущено вже виконаних: {skipped})")
+
+    results = run_pool(run_task, [(matrix_path, n_iterations, config, seed) for config, seed in tasks], workers)
+    for completed, (_, _, config, seed), (path, length, runtime, stats) in results:
+        conn.execute(
+            'INSERT OR IGNORE INTO sweep_results '
+            '(instance, n_iterations, n_ants, decay, alpha, beta, seed, path_length, runtime, path, profile) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (instance, n_iterations, config['n_ants'], config['decay'], config['alpha'], config['beta'],
+             seed, length, runtime, str(path), json.dumps(summarize(stats))))
+        save_stats(stats, conn, run_id(instance, n_iterations, config, seed))
+        print(f"[{completed}/{len(tasks)}] {config} seed={seed}: {length:.2f} за {runtime:.2f} с")
+    conn.close()
+    return skipped
+
+
+def aggregate(instance: str, n_iterations: int, db_path: str = DEFAULT_DB) -> List[Dict[str, float]]:
+    """
+    Середні значення та 95% довірчі інтервали довжини й часу для кожної конфігурації
+
+    Додатково - середній час кожної фази ітерації за статистикою профілювання.
+    """
+    conn = init_db(db_path)
+    rows = conn.execute(
+        'SELECT n_ants, decay, alpha, beta, path_length, runtime, profile FROM sweep_results '
+        'WHERE instance = ? AND n_iterations = ?', (instance, n_iterations)).fetchall()
+    conn.close()
+
+    groups = {}
+    profiles = {}
+    for *config, length, runtime, profile in rows:
+        groups.setdefault(tuple(config), []).append((length, runtime))
+        if profile:
+            profiles.setdefault(tuple(config), []).append(json.loads(profile))
+
+    table = []
+    for config, values in groups.items():
+        values = np.array(values)
+        row = dict(zip(PARAMS, config))
+        row['runs'] = len(values)
+        for k, name in enumerate(('length', 'runtime')):
+            mean = values[:, k].mean()
+            half_width = 1.96 * values[:, k].std(ddof=1) / np.sqrt(len(values)) if len(values) > 1 else 0.0
+            row[f'{name}_mean'] = mean
+            row[f'{name}_ci_low'] = mean - half_width
+            row[f'{name}_ci_high'] = mean + half_width
+        for phase in PHASES:
+            times = [p[f'{phase}_time'] for p in profiles.get(config, [])]
+            row[f'{phase}_time_mean'] = np.mean(times) if times else float('nan')
+        table.append(row)
+    return sorted(table, key=lambda r: r['length_mean'])
+
+
+def write_table(table: List[Dict[str, float]], path: str):
+    """Запис зведеної таблиці у CSV"""
+    if not table:
+        return
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(table[0].keys()))
+        writer.writeheader()
+        writer.writerows(table)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Перебір параметрів мурашиного алгоритму")
+    parser.add_argument('--design', choices=('grid', 'random', 'lhs'), default='grid')
+    parser.add_argument('--samples', type=int, default=20, help="кількість конфігурацій для random/lhs")
+    parser.add_argument('--repetitions', type=int, default=5)
+    parser.add_argument('--cities', type=int, default=15)
+    parser.add_argument('--iterations', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--db', default=DEFAULT_DB)
+    parser.add_argument('--out', default='sweep_summary.csv')
+    parser.add_argument('--profile-mode', choices=PROFILE_MODES, default=None,
+                        help="перед перебором - один прогін першої конфігурації під профайлером")
+    args = parser.parse_args()
+
+    # Екземпляр задачі: випадкові міста, матриця - у спільному кеші
+    cities = np.random.default_rng(args.seed).random((args.cities, 2)) * 100
+    get_distance_matrix(cities, dtype='float32')
+    matrix_path = cache_path(cities, 'float32')
+    instance = instance_hash(cities, 'float32')
+
+    if args.design == 'grid':
+        configs = grid_design()
+    elif args.design == 'random':
+        configs = random_design(args.samples, seed=args.seed)
+    else:
+        configs = latin_hypercube_design(args.samples, seed=args.seed)
+
+    if args.profile_mode:
+        report = profile_task(matrix_path, args.iterations, configs[0], task_seed(args.seed, 0), args.profile_mode)
+        report_path = f'{os.path.splitext(args.out)[0]}_{args.profile_mode}.txt'
+        with open(report_path, 'w') as f:
+            f.write(report)
+        print(f"Звіт профілювання: {report_path}")
+
+    run_sweep(configs, matrix_path, instance, args.iterations, args.repetitions,
+              args.seed, args.workers, args.db)
+    table = aggregate(instance, args.iterations, args.db)
+    write_table(table, args.out)
+
+    print("\nНайкращі конфігурації:")
+    for row in table[:5]:
+        print(f"n_ants={row['n_ants']}, decay={row['decay']}, alpha={row['alpha']}, beta={row['beta']}: "
+              f"{row['length_mean']:.2f} [{row['length_ci_low']:.2f}; {row['length_ci_high']:.2f}], "
+              f"{row['runtime_mean']:.2f} с")
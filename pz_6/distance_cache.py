@@ -0,0 +1,138 @@
+import numpy as np
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+from typing import Callable, Tuple
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'distance_cache')
+SUPPORTED_DTYPES = ('float64', 'float32', 'uint16', 'uint32')
+
+
+def instance_hash(data: np.ndarray, dtype: str = 'float32') -> str:
+    """Хеш екземпляра задачі (координати або сирі відстані) разом із форматом зберігання"""
+    data = np.ascontiguousarray(data)
+    digest = hashlib.sha256()
+    digest.update(str(data.shape).encode())
+    digest.update(str(data.dtype).encode())
+    digest.update(data.tobytes())
+    digest.update(dtype.encode())
+    return digest.hexdigest()[:32]
+
+
+def euclidean_distances(cities: np.ndarray) -> np.ndarray:
+    """Матриця евклідових відстаней між містами"""
+    diff = cities[:, None, :] - cities[None, :, :]
+    return np.sqrt((diff ** 2).sum(axis=-1))
+
+
+def quantize(distances: np.ndarray, dtype: str = 'float32') -> Tuple[np.ndarray, float]:
+    """
+    Перетворення матриці у компактний формат
+
+    :return: (матриця, масштаб), реальна відстань = значення * масштаб
+    """
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError(f"Непідтримуваний тип: {dtype}")
+    if dtype.startswith('float'):
+        return distances.astype(dtype), 1.0
+
+    max_value = np.iinfo(dtype).max
+    max_distance = float(np.max(distances))
+    scale = max_distance / max_value if max_distance > 0 else 1.0
+    quantized = np.rint(distances / scale)
+    # Ненульові відстані не повинні округлюватись до нуля (ділення на нуль в евристиці)
+    quantized[(distances > 0) & (quantized == 0)] = 1
+    return quantized.astype(dtype), scale
+
+
+def save_distance_matrix(distances: np.ndarray, path: str, dtype: str = 'float32') -> float:
+    """
+    Збереження матриці у .npy разом з файлом метаданих .json
+
+    Запис атомарний: паралельні процеси ніколи не побачать недописаний файл.
+    """
+    matrix, scale = quantize(distances, dtype)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(suffix='.npy', dir=directory)
+    with os.fdopen(fd, 'wb') as f:
+        np.save(f, matrix)
+
+    meta = {
+        'dtype': dtype,
+        'scale': scale,
+        'n': int(matrix.shape[0]),
+    }
+    fd, tmp_meta_path = tempfile.mkstemp(suffix='.json', dir=directory)
+    with os.fdopen(fd, 'w') as f:
+        json.dump(meta, f)
+
+    # Спершу матриця: метадані без матриці не залишаються
+    os.replace(tmp_path, path)
+    os.replace(tmp_meta_path, _meta_path(path))
+    return scale
+
+
+def load_distance_matrix(path: str) -> Tuple[np.ndarray, float]:
+    """
+    Завантаження матриці у режимі memory-map (лише читання)
+
+    :return: (np.memmap, масштаб) - аргументи distances та distance_scale для AntColony
+    """
+    matrix = np.load(path, mmap_mode='r')
+    scale = 1.0
+    if os.path.exists(_meta_path(path)):
+        with open(_meta_path(path)) as f:
+            scale = json.load(f)['scale']
+    return matrix, scale
+
+
+def cache_path(data: np.ndarray, dtype: str = 'float32', cache_dir: str = DEFAULT_CACHE_DIR) -> str:
+    """Шлях до файлу матриці в кеші"""
+    return os.path.join(cache_dir, f"{instance_hash(data, dtype)}.npy")
+
+
+def get_distance_matrix(data: np.ndarray, builder: Callable[[np.ndarray], np.ndarray] = euclidean_distances,
+                        dtype: str = 'float32', cache_dir: str = DEFAULT_CACHE_DIR) -> Tuple[np.ndarray, float]:
+    """
+    Отримати матрицю з кешу або побудувати та закешувати її
+
+    :param data: опис екземпляра (координати міст або сирі дані мережі доріг)
+    :param builder: функція побудови повної матриці відстаней з data
+    :param dtype: формат зберігання (float32, uint16, uint32, float64)
+    :param cache_dir: каталог кешу, спільний для всіх процесів
+    """
+    path = cache_path(data, dtype, cache_dir)
+    if not os.path.exists(path):
+        save_distance_matrix(builder(data), path, dtype)
+    return load_distance_matrix(path)
+
+
+def _meta_path(path: str) -> str:
+    return os.path.splitext(path)[0] + '.json'
+
+
+def _read_input(path: str) -> np.ndarray:
+    if path.endswith('.npy'):
+        return np.load(path)
+    return np.loadtxt(path, delimiter=',')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Попереднє обчислення та кешування матриць відстаней")
+    parser.add_argument('inputs', nargs='+', help="файли .npy/.csv з координатами міст або готовими матрицями")
+    parser.add_argument('--dtype', choices=SUPPORTED_DTYPES, default='float32')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+    parser.add_argument('--matrix', action='store_true',
+                        help="вхідні файли вже містять (можливо несиметричні) матриці відстаней")
+    args = parser.parse_args()
+
+    builder = (lambda m: m) if args.matrix else euclidean_distances
+    for input_path in args.inputs:
+        data = _read_input(input_path)
+        matrix, scale = get_distance_matrix(data, builder, args.dtype, args.cache_dir)
+        cached = cache_path(data, args.dtype, args.cache_dir)
+        print(f"{input_path}: {matrix.shape[0]} міст, {args.dtype}, масштаб {scale:.6g} -> {cached}")
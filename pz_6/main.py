@@ -4,6 +4,8 @@ import random
 import time
 from typing import List, Tuple
 
+from profiling import PhaseTimer
+
 class AntColonyVisualizer:
     """Клас для візуалізації роботи мурашиного алгоритму"""
     
@@ -44,7 +46,7 @@ class AntColony:
     """Клас для реалізації мурашиного алгоритму з візуалізацією"""
     
     def __init__(self, cities: np.ndarray, n_ants: int = 10, n_iterations: int = 100,
-                 decay: float = 0.5, alpha: float = 1, beta: float = 2):
+                 decay: float = 0.5, alpha: float = 1, beta: float = 2, profile: bool = False):
         # Координати міст
         self.cities = cities
         self.n = len(cities)
@@ -70,32 +72,48 @@ class AntColony:
         self.best_path = None
         self.best_length = float('inf')
         
+        # Статистика фаз ітерацій (лише при profile=True)
+        self.timer = PhaseTimer(profile)
+        self.stats = []
+        
         # Візуалізація
         self.visualizer = AntColonyVisualizer(cities)
         self.visualizer.plot_cities()
     
     def run(self) -> Tuple[List[int], float]:
         """Запуск алгоритму з візуалізацією"""
+        timer = self.timer
         for iteration in range(self.n_iterations):
+            stats = timer.start(iteration)
+            
             # Генерація шляхів для всіх мурах
-            ants_paths = self._generate_ants_paths()
+            with timer.phase('construct'):
+                ants_paths = self._generate_ants_paths()
             
             # Оновлення феромонів
-            self._update_pheromones(ants_paths)
+            with timer.phase('update'):
+                self._update_pheromones(ants_paths)
             
-            # Знаходження найкращого шляху в поточній ітерації
-            current_best_path, current_best_length = min(ants_paths, key=lambda x: x[1])
-            
-            # Оновлення глобально найкращого шляху
-            if current_best_length < self.best_length:
-                self.best_path = current_best_path
-                self.best_length = current_best_length
+            with timer.phase('best'):
+                # Знаходження найкращого шляху в поточній ітерації
+                current_best_path, current_best_length = min(ants_paths, key=lambda x: x[1])
+                
+                # Оновлення глобально найкращого шляху
+                if current_best_length < self.best_length:
+                    self.best_path = current_best_path
+                    self.best_length = current_best_length
             
             # Візуалізація
-            self._visualize_iteration(iteration, ants_paths, current_best_path, current_best_length)
+            with timer.phase('visualize'):
+                self._visualize_iteration(iteration, ants_paths, current_best_path, current_best_length)
             
             # Випаровування феромонів
-            self.pheromone *= self.decay
+            with timer.phase('evaporate'):
+                self.pheromone *= self.decay
+            
+            if stats is not None:
+                stats.count_paths(ants_paths)
+                self.stats.append(stats)
         
         plt.ioff()
         plt.show()
@@ -149,6 +167,9 @@ class AntColony:
             heuristic = (1 / self.distances[current][city]) ** self.beta
             probabilities.append(pheromone * heuristic)
         
+        if self.timer.current is not None:
+            self.timer.current.probability_evaluations += len(unvisited)
+        
         # Нормалізація ймовірностей
         total = sum(probabilities)
         probabilities = [p/total for p in probabilities] if total > 0 else [1/len(unvisited)]*len(unvisited)
@@ -0,0 +1,117 @@
+import contextlib
+import cProfile
+import io
+import pstats
+import sqlite3
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, List
+
+PHASES = ('construct', 'update', 'evaporate', 'best', 'visualize')
+PROFILE_MODES = ('cprofile', 'tracemalloc')
+
+
+@dataclass
+class IterationStats:
+    """Статистика однієї ітерації алгоритму (probability_evaluations рахує _select_next_city)"""
+    iteration: int
+    construct_time: float = 0.0
+    update_time: float = 0.0
+    evaporate_time: float = 0.0
+    best_time: float = 0.0
+    visualize_time: float = 0.0
+    ants_constructed: int = 0
+    edges_deposited: int = 0
+    probability_evaluations: int = 0
+
+    def count_paths(self, ants_paths):
+        """Лічильники за згенерованими шляхами (без втручання у сам алгоритм)"""
+        self.ants_constructed += len(ants_paths)
+        for path, _ in ants_paths:
+            self.edges_deposited += len(path) - 1
+
+
+class PhaseTimer:
+    """Таймер фаз ітерації; коли вимкнений, phase() повертає порожній контекст"""
+
+    _disabled = contextlib.nullcontext()
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.current = None
+
+    def start(self, iteration: int):
+        self.current = IterationStats(iteration) if self.enabled else None
+        return self.current
+
+    def phase(self, name: str):
+        if self.current is None:
+            return self._disabled
+        return self._timed(name)
+
+    @contextlib.contextmanager
+    def _timed(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            attr = f'{name}_time'
+            setattr(self.current, attr, getattr(self.current, attr) + time.perf_counter() - start)
+
+
+def summarize(stats: List[IterationStats]) -> Dict[str, float]:
+    """Сумарні значення по всіх ітераціях"""
+    totals = {f.name: 0 for f in fields(IterationStats) if f.name != 'iteration'}
+    for record in stats:
+        for name in totals:
+            totals[name] += getattr(record, name)
+    totals['iterations'] = len(stats)
+    return totals
+
+
+def init_stats_table(conn: sqlite3.Connection):
+    """Таблиця статистики ітерацій у базі результатів"""
+    conn.execute(f'''
+            CREATE TABLE IF NOT EXISTS iteration_stats (
+                run_id TEXT,
+                {', '.join(f'{f.name} REAL' for f in fields(IterationStats))},
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )''')
+
+
+def save_stats(stats: List[IterationStats], conn: sqlite3.Connection, run_id: str):
+    """Запис статистики ітерацій прогону run_id у базу результатів"""
+    columns = [f.name for f in fields(IterationStats)]
+    init_stats_table(conn)
+    conn.executemany(
+        f'INSERT INTO iteration_stats (run_id, {", ".join(columns)}) VALUES (?{", ?" * len(columns)})',
+        [(run_id, *asdict(record).values()) for record in stats])
+    conn.commit()
+
+
+def profile_run(colony, mode: str = 'cprofile', limit: int = 20):
+    """
+    Один прогін colony.run() під cProfile або tracemalloc
+
+    :return: (результат run(), текстовий звіт)
+    """
+    report = io.StringIO()
+    if mode == 'cprofile':
+        profiler = cProfile.Profile()
+        result = profiler.runcall(colony.run)
+        pstats.Stats(profiler, stream=report).sort_stats('cumulative').print_stats(limit)
+    elif mode == 'tracemalloc':
+        tracemalloc.start()
+        try:
+            result = colony.run()
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        report.write(f"Поточна пам'ять: {current / 1024:.1f} КБ, пік: {peak / 1024:.1f} КБ\n")
+        for stat in snapshot.statistics('lineno')[:limit]:
+            report.write(f"{stat}\n")
+    else:
+        raise ValueError(f"Невідомий режим профілювання: {mode}")
+    return result, report.getvalue()
@@ -0,0 +1,209 @@
+import numpy as np
+from typing import List, Tuple
+
+
+def density_grid(points: np.ndarray, width: float, height: float, shape: Tuple[int, int]) -> np.ndarray:
+    """Кількість точок інтересу в кожній комірці растра форми (ny, nx)"""
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    density, _, _ = np.histogram2d(points[:, 1], points[:, 0], bins=shape, range=[[0, height], [0, width]])
+    return density
+
+
+def cell_size(width: float, height: float, shape: Tuple[int, int]) -> Tuple[float, float]:
+    """Розмір комірки (по x, по y)"""
+    return width / shape[1], height / shape[0]
+
+
+def cell_centers(indices: np.ndarray, width: float, height: float, shape: Tuple[int, int]) -> np.ndarray:
+    """Координати центрів комірок за пласкими індексами"""
+    cx, cy = cell_size(width, height, shape)
+    iy, ix = np.unravel_index(indices, shape)
+    return np.column_stack([(ix + 0.5) * cx, (iy + 0.5) * cy])
+
+
+def disk_kernel(radius: float, cx: float, cy: float) -> np.ndarray:
+    """Ядро-диск: комірки, центри яких не далі radius від центральної"""
+    rx, ry = int(np.ceil(radius / cx)), int(np.ceil(radius / cy))
+    dy, dx = np.mgrid[-ry:ry + 1, -rx:rx + 1]
+    return (np.hypot(dx * cx, dy * cy) <= radius).astype(float)
+
+
+def fft_convolve(image: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    """Згортка через FFT з результатом розміру image (режим 'same')"""
+    ky, kx = kernel.shape
+    full_shape = (image.shape[0] + ky - 1, image.shape[1] + kx - 1)
+    spectrum = np.fft.rfft2(image, full_shape) * np.fft.rfft2(kernel, full_shape)
+    full = np.fft.irfft2(spectrum, full_shape)
+    oy, ox = ky // 2, kx // 2
+    result = full[oy:oy + image.shape[0], ox:ox + image.shape[1]]
+    # Округлення прибирає похибки FFT: у комірках - цілі кількості точок
+    return np.rint(result)
+
+
+def coverage_heatmap(points: np.ndarray, width: float, height: float, radius: float,
+                     shape: Tuple[int, int] = (200, 200), obstacles: np.ndarray = None) -> np.ndarray:
+    """
+    Для кожної комірки - скільки точок інтересу покрила б антена в її центрі
+
+    Точки враховуються центрами своїх комірок, тож значення наближене до розміру комірки.
+
+    :param obstacles: якщо задано - тіні від перешкод віднімаються (shadow_correction)
+    """
+    cx, cy = cell_size(width, height, shape)
+    density = density_grid(points, width, height, shape)
+    kernel = disk_kernel(radius, cx, cy)
+    heat = fft_convolve(density, kernel)
+    if obstacles is not None and len(obstacles):
+        heat -= shadow_correction(density, kernel, obstacles, width, height, radius)
+    return heat
+
+
+def shadow_correction(density: np.ndarray, kernel: np.ndarray, obstacles: np.ndarray,
+                      width: float, height: float, radius: float) -> np.ndarray:
+    """
+    Маски тіней: скільки точок у радіусі кожної комірки закрито перешкодами
+
+    Для кожної зайнятої комірки тінь растеризується у вікні ядра навколо неї від перешкод
+    не далі radius + буфер. Перешкода на відстані d > буфер закриває лише напрямки в межах
+    asin(буфер / d) від напрямку на неї, тож точно (тією ж формулою, що й _obstructed_segments:
+    центр комірки антени -> центр комірки точки) перевіряються лише комірки цього сектора,
+    знайдені бінарним пошуком у відсортованих за кутом зсувах ядра.
+    """
+    from solver import OBSTACLE_BUFFER, AntennaPlacementSolver
+
+    shape = density.shape
+    cx, cy = cell_size(width, height, shape)
+    obstacles = np.asarray(obstacles, dtype=float).reshape(-1, 2)
+    ry, rx = kernel.shape[0] // 2, kernel.shape[1] // 2
+    dy, dx = np.nonzero(kernel)
+    dy, dx = dy - ry, dx - rx
+
+    # Зсуви ядра за кутом, тричі з періодом 2pi: сектор будь-якого напрямку - суцільний відрізок
+    angles = np.arctan2(dy * cy, dx * cx)
+    order = np.argsort(angles)
+    angles = np.concatenate([angles[order] - 2 * np.pi, angles[order], angles[order] + 2 * np.pi])
+    order = np.tile(order, 3)
+    correction = np.zeros(shape)
+    # Точки, закриті з усіх напрямків (перешкода ближче буфера): віднімається весь їхній диск
+    hidden = np.zeros(shape)
+
+    for cell in np.flatnonzero(density):
+        center = cell_centers(cell, width, height, shape)[0]
+        offset = obstacles - center
+        distance = np.hypot(offset[:, 0], offset[:, 1])
+        near = distance < radius + OBSTACLE_BUFFER
+        if not np.any(near):
+            continue
+        if np.any(distance[near] < OBSTACLE_BUFFER):
+            hidden.flat[cell] = density.flat[cell]
+            continue
+
+        direction = np.arctan2(offset[near, 1], offset[near, 0])
+        spread = np.arcsin(OBSTACLE_BUFFER / distance[near]) + 1e-6  # Запас - від похибок округлення
+        starts = np.searchsorted(angles, direction - spread, 'left')
+        lengths = np.searchsorted(angles, direction + spread, 'right') - starts
+        positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        candidates = order[positions]
+        obstacle_idx = np.repeat(np.flatnonzero(near), lengths)
+
+        iy, ix = np.unravel_index(cell, shape)
+        ys, xs = iy + dy[candidates], ix + dx[candidates]
+        inside = (ys >= 0) & (ys < shape[0]) & (xs >= 0) & (xs < shape[1])
+        sites = cell_centers(np.ravel_multi_index((ys[inside], xs[inside]), shape), width, height, shape)
+        hit = AntennaPlacementSolver._distance_to_segments(
+            sites, center[None, :], obstacles[obstacle_idx[inside]]) < OBSTACLE_BUFFER
+        blocked = np.zeros(len(dy), dtype=bool)
+        blocked[candidates[inside][hit]] = True
+        correction[iy + dy[blocked], ix + dx[blocked]] += density.flat[cell]
+    if np.any(hidden):
+        correction += fft_convolve(hidden, kernel)
+    return correction
+
+
+def visible_points(optimizer, sites: np.ndarray, points: np.ndarray, radius: float) -> np.ndarray:
+    """Маски (позиції x точки) покриття з урахуванням тіней від перешкод"""
+    return optimizer._site_coverage(np.asarray(sites, dtype=float).reshape(-1, 2), points, radius)
+
+
+def greedy_sites(optimizer, n_sites: int, radius: float, shape: Tuple[int, int] = (200, 200),
+                 batch: int = 64, max_rounds: int = 10) -> Tuple[List[Tuple[float, float]], float]:
+    """
+    Жадібний пошук позицій антен по комірках растра
+
+    Теплова карта дає верхню межу приросту. Спершу перевіряються вузли розрідженої
+    решітки (крок - восьма частина діаметра диска) у порядку спадання межі, пакетами
+    по batch, поки найкращий точний приріст (маска тіней по реальних точках) не стане
+    не меншим за межі решти вузлів; потім позиція уточнюється в околі найкращого вузла.
+    Покриті точки віднімаються з карти локально, тож вартість не залежить від роздільності растра.
+
+    :return: (позиції антен, відсоток покриття)
+    """
+    width, height = optimizer.width, optimizer.height
+    points = np.array(optimizer.interest_points, dtype=float).reshape(-1, 2)
+    if not len(points):
+        return [], 0.0
+
+    cx, cy = cell_size(width, height, shape)
+    kernel = disk_kernel(radius, cx, cy)
+    bound = fft_convolve(density_grid(points, width, height, shape), kernel)
+    point_cells = np.column_stack([
+        np.clip((points[:, 1] / cy).astype(int), 0, shape[0] - 1),
+        np.clip((points[:, 0] / cx).astype(int), 0, shape[1] - 1),
+    ])
+    uncovered = np.ones(len(points), dtype=bool)
+    sites = []
+
+    step = max(1, min(kernel.shape) // 8)
+    lattice = np.ravel_multi_index(np.meshgrid(np.arange(step // 2, shape[0], step),
+                                               np.arange(step // 2, shape[1], step), indexing='ij'),
+                                   shape).ravel()
+
+    def evaluate(cells):
+        masks = visible_points(optimizer, cell_centers(cells, width, height, shape), points[uncovered], radius)
+        return masks, masks.sum(axis=1)
+
+    for _ in range(n_sites):
+        # Лінивий перебір вузлів решітки за спаданням верхньої межі
+        current = bound.ravel()[lattice]
+        best_gain, best_cell = 0, None
+        for _ in range(max_rounds):
+            top = np.argpartition(current, -min(batch, len(current)))[-batch:]
+            top = top[current[top] > best_gain]
+            if not len(top):
+                break
+            _, gains = evaluate(lattice[top])
+            current[top] = -1
+            k = int(np.argmax(gains))
+            if gains[k] > best_gain:
+                best_gain, best_cell = gains[k], lattice[top[k]]
+            if best_gain >= current.max():
+                break
+        if best_cell is None:
+            break
+
+        # Уточнення в околі найкращого вузла з кроком step / 4
+        iy, ix = np.unravel_index(best_cell, shape)
+        fine = max(1, step // 4)
+        ys = np.clip(np.arange(iy - step, iy + step + 1, fine), 0, shape[0] - 1)
+        xs = np.clip(np.arange(ix - step, ix + step + 1, fine), 0, shape[1] - 1)
+        cells = np.unique(np.ravel_multi_index(np.meshgrid(ys, xs, indexing='ij'), shape))
+        masks, gains = evaluate(cells)
+        k = int(np.argmax(gains))
+
+        sites.append(tuple(cell_centers(cells[k], width, height, shape)[0]))
+        best_mask = np.zeros(len(points), dtype=bool)
+        best_mask[uncovered] = masks[k]
+        uncovered &= ~best_mask
+        for iy, ix in point_cells[best_mask]:
+            _subtract_kernel(bound, kernel, iy, ix)
+
+    coverage = (int(np.count_nonzero(~uncovered)) / len(points)) * 100
+    return sites, coverage
+
+
+def _subtract_kernel(image: np.ndarray, kernel: np.ndarray, iy: int, ix: int):
+    """Локальне віднімання внеску однієї точки з карти"""
+    ry, rx = kernel.shape[0] // 2, kernel.shape[1] // 2
+    y0, y1 = max(iy - ry, 0), min(iy + ry + 1, image.shape[0])
+    x0, x1 = max(ix - rx, 0), min(ix + rx + 1, image.shape[1])
+    image[y0:y1, x0:x1] -= kernel[y0 - iy + ry:y1 - iy + ry, x0 - ix + rx:x1 - ix + rx]
@@ -0,0 +1,613 @@
+import json
+import numpy as np
+import os
+import tempfile
+import threading
+from typing import List, Tuple, Dict
+
+import budget
+import raster
+
+OBSTACLE_BUFFER = 5  # Перешкода ближче цієї відстані до лінії блокує сигнал
+
+
+class ObstacleGrid:
+    """Рівномірна сітка перешкод для швидкої перевірки прямої видимості"""
+    
+    def __init__(self, buffer: float = OBSTACLE_BUFFER):
+        # Комірка вдвічі більша за буфер: усі перешкоди в межах буфера від точки
+        # відрізка лежать у комірці цієї точки або в сусідніх
+        self.buffer = buffer
+        self.cell_size = 2 * buffer
+        self.cells = {}
+        self.coords = []
+        self.source = None
+        self._points = None
+    
+    def sync(self, obstacles: List[Tuple[float, float]]):
+        """Інкрементальне оновлення індексу; повна перебудова лише якщо список замінено"""
+        if obstacles is not self.source or len(obstacles) < len(self.coords):
+            self.cells = {}
+            self.coords = []
+            self.source = obstacles
+        for x, y in obstacles[len(self.coords):]:
+            self.add(x, y)
+    
+    def add(self, x: float, y: float):
+        """Додати перешкоду в індекс"""
+        self.cells.setdefault(self._cell(x, y), []).append(len(self.coords))
+        self.coords.append((x, y))
+        self._points = None
+    
+    @property
+    def points(self) -> np.ndarray:
+        if self._points is None:
+            self._points = np.array(self.coords, dtype=float).reshape(-1, 2)
+        return self._points
+    
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int(np.floor(x / self.cell_size)), int(np.floor(y / self.cell_size))
+    
+    def segment_cells(self, p1: Tuple[float, float], p2: Tuple[float, float]) -> set:
+        """Комірки, через які проходить відрізок з буфером"""
+        (x1, y1), (x2, y2) = p1, p2
+        # Крок не більший за комірку - кожна точка відрізка не далі cell_size / 2 від вибірки
+        steps = max(1, int(np.ceil(np.hypot(x2 - x1, y2 - y1) / self.cell_size)))
+        cells = set()
+        for k in range(steps + 1):
+            t = k / steps
+            cx, cy = self._cell(x1 + t * (x2 - x1), y1 + t * (y2 - y1))
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    cells.add((cx + dx, cy + dy))
+        return cells
+    
+    def candidates(self, p1: Tuple[float, float], p2: Tuple[float, float]) -> List[int]:
+        """Індекси перешкод, що можуть бути ближче за буфер до відрізка"""
+        found = []
+        for cell in self.segment_cells(p1, p2):
+            found.extend(self.cells.get(cell, ()))
+        return found
+    
+    def candidate_pairs(self, starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Пари (індекс відрізка, індекс перешкоди) для масиву відрізків"""
+        segment_idx, obstacle_idx = [], []
+        for k, (p1, p2) in enumerate(zip(starts, ends)):
+            found = self.candidates(p1, p2)
+            segment_idx.append(np.full(len(found), k))
+            obstacle_idx.append(np.array(found, dtype=int))
+        if not segment_idx:
+            return np.empty(0, dtype=int), np.empty(0, dtype=int)
+        return np.concatenate(segment_idx).astype(int), np.concatenate(obstacle_idx)
+
+
+# Кількість одиничних бітів у кожному значенні байта
+_POPCOUNT = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+
+class CoverageCache:
+    """
+    Кеш матриці видимості: біт (i, j) - антена в точці інтересу i покриває точку j
+
+    Рядки зберігаються бітово упакованими (np.packbits). Кеш прив'язаний до списків
+    точок і перешкод та радіусу; додані точки й перешкоди дораховуються інкрементально.
+    """
+    
+    def __init__(self, chunk: int = 1024):
+        self.chunk = chunk
+        self.bits = np.zeros((0, 0), dtype=np.uint8)
+        self.n_points = 0
+        self.n_obstacles = 0
+        self.points_source = None
+        self.obstacles_source = None
+        self.radius = None
+    
+    def sync(self, optimizer: 'AntennaPlacementSolver'):
+        """Привести кеш у відповідність до поточного сценарію"""
+        points, obstacles = optimizer.interest_points, optimizer.obstacles
+        if (points is not self.points_source or obstacles is not self.obstacles_source
+                or optimizer.coverage_radius != self.radius
+                or len(points) < self.n_points or len(obstacles) < self.n_obstacles):
+            self._rebuild(optimizer)
+            return
+        # Спочатку нові перешкоди для наявних точок, потім нові точки з усіма перешкодами
+        if len(obstacles) > self.n_obstacles:
+            self._add_obstacles(optimizer)
+        if len(points) > self.n_points:
+            self._add_points(optimizer)
+    
+    def coverage(self, rows: List[int]) -> float:
+        """Відсоток покриття набору антен: OR відповідних рядків"""
+        if not rows or not self.n_points:
+            return 0.0
+        covered = np.bitwise_or.reduce(self.bits[rows], axis=0)
+        return (int(_POPCOUNT[covered].sum()) / self.n_points) * 100
+    
+    def rows(self, rows: List[int]) -> np.ndarray:
+        """Розпаковані рядки матриці видимості"""
+        return np.unpackbits(self.bits[rows], axis=1, count=self.n_points).astype(bool)
+    
+    def _rebuild(self, optimizer):
+        points = np.array(optimizer.interest_points, dtype=float).reshape(-1, 2)
+        blocks = [np.packbits(optimizer._site_coverage(points[begin:begin + self.chunk], points), axis=1)
+                  for begin in range(0, len(points), self.chunk)]
+        self.bits = np.vstack(blocks) if blocks else np.zeros((0, 0), dtype=np.uint8)
+        self.n_points = len(points)
+        self.n_obstacles = len(optimizer.obstacles)
+        self.points_source = optimizer.interest_points
+        self.obstacles_source = optimizer.obstacles
+        self.radius = optimizer.coverage_radius
+    
+    def _add_points(self, optimizer):
+        points = np.array(optimizer.interest_points, dtype=float).reshape(-1, 2)
+        old = self.n_points
+        
+        # Нові стовпці для наявних рядків (по блоках, щоб не розпаковувати всю матрицю)
+        blocks = []
+        for begin in range(0, old, self.chunk):
+            rows = np.unpackbits(self.bits[begin:begin + self.chunk], axis=1, count=old).astype(bool)
+            new_columns = optimizer._site_coverage(points[begin:min(begin + self.chunk, old)], points[old:])
+            blocks.append(np.packbits(np.hstack([rows, new_columns]), axis=1))
+        # Нові рядки для нових точок
+        for begin in range(old, len(points), self.chunk):
+            blocks.append(np.packbits(optimizer._site_coverage(points[begin:begin + self.chunk], points), axis=1))
+        
+        self.bits = np.vstack(blocks)
+        self.n_points = len(points)
+    
+    def _add_obstacles(self, optimizer):
+        points = np.array(optimizer.interest_points[:self.n_points], dtype=float).reshape(-1, 2)
+        reach = self.radius + OBSTACLE_BUFFER
+        for obstacle in np.array(optimizer.obstacles[self.n_obstacles:], dtype=float):
+            # Перешкода може закрити лише відрізки від антен у межах радіуса + буфера
+            near = np.nonzero(np.hypot(*(points - obstacle).T) <= reach)[0]
+            if not len(near):
+                continue
+            rows = self.rows(near)
+            site_idx, point_idx = np.nonzero(rows)
+            distance = AntennaPlacementSolver._distance_to_segments(
+                points[near[site_idx]], points[point_idx], obstacle[None, :])
+            blocked = distance < OBSTACLE_BUFFER
+            rows[site_idx[blocked], point_idx[blocked]] = False
+            self.bits[near] = np.packbits(rows, axis=1)
+        self.n_obstacles = len(optimizer.obstacles)
+
+
+
+# Параметри оптимізації сценарію за замовчуванням
+DEFAULT_PARAMS = {'method': 'aco', 'n_ants': 20, 'n_iterations': 50, 'budget': 1000.0, 'seed': 0}
+SCENARIO_FORMATS = ('.json', '.npz')
+METHODS = ('aco', 'budget', 'raster')
+
+
+class AntennaPlacementSolver:
+    """Сценарій розміщення антен і алгоритми оптимізації без графічного інтерфейсу"""
+
+    # Менше перешкод перевіряється повним векторизованим перебором
+    GRID_MIN_OBSTACLES = 256
+    # Кількість антен у рішенні та ваги феромону і евристики (приросту покриття)
+    N_ANTENNAS = 5
+    # Розмір растра (ny, nx) для теплової карти та пошуку позицій поза точками інтересу
+    RASTER_SHAPE = (200, 200)
+    ALPHA = 1
+    BETA = 2
+
+    def __init__(self, width=100, height=100):
+        self.width = width
+        self.height = height
+        
+        # Ініціалізація параметрів
+        self.antennas = []
+        self.obstacles = []
+        self.interest_points = []
+        self.obstacle_grid = ObstacleGrid()
+        self.coverage_cache = CoverageCache()
+        self.coverage_radius = 15
+        self.antenna_types = {
+            'small': {'radius': 10, 'cost': 100},
+            'medium': {'radius': 15, 'cost': 200},
+            'large': {'radius': 20, 'cost': 300}
+        }
+    
+    def _ant_colony_optimization(self, n_ants: int, n_iterations: int, target_coverage: float = 100.0,
+                                 progress=None, cancel: threading.Event = None) -> List[Tuple[float, float]]:
+        """
+        Мурашиний алгоритм для оптимізації розміщення антен
+
+        Зупиняється достроково, коли покриття досягає target_coverage або встановлено cancel.
+
+        :param progress: функція (ітерація, покриття, рішення), що викликається після кожної
+                         ітерації; без неї прогрес малюється напряму кожні 10 ітерацій
+        """
+        # Ініціалізація феромонів
+        pheromone = np.ones((len(self.interest_points), len(self.interest_points))) / len(self.interest_points)
+        
+        best_solution = None
+        best_coverage = -1
+        
+        for iteration in range(n_iterations):
+            # Побудова рішень усіх мурах (індекси точок) разом з їх покриттям
+            generated, coverages = self._construct_solutions(pheromone, n_ants)
+            solutions = list(zip(generated, coverages))
+            
+            for solution, coverage in solutions:
+                # Оновлення найкращого рішення
+                if coverage > best_coverage:
+                    best_coverage = coverage
+                    best_solution = solution
+            
+            # Оновлення феромонів
+            pheromone = self._update_pheromones(pheromone, solutions)
+            
+            # Випаровування феромонів
+            pheromone *= 0.95
+            
+            # Візуалізація прогресу
+            if progress is not None:
+                progress(iteration, best_coverage, self._solution_points(best_solution))
+            if iteration % 10 == 0:
+                print(f"Iteration {iteration}: Best coverage = {best_coverage:.2f}%")
+                if progress is None:
+                    self._visualize_progress(self._solution_points(best_solution), iteration, best_coverage)
+            
+            if cancel is not None and cancel.is_set():
+                break
+            if best_coverage >= target_coverage:
+                print(f"Iteration {iteration}: досягнуто покриття {best_coverage:.2f}%")
+                break
+        
+        return self._solution_points(best_solution)
+    
+    def _generate_solution(self, pheromone: np.ndarray = None) -> np.ndarray:
+        """Генерація рішення для однієї мурахи (індекси точок інтересу)"""
+        if not self.interest_points:
+            return np.empty(0, dtype=int)
+        if pheromone is None:
+            pheromone = np.ones((len(self.interest_points), len(self.interest_points)))
+        solutions, _ = self._construct_solutions(pheromone, 1)
+        return solutions[0]
+    
+    def _construct_solutions(self, pheromone: np.ndarray, n_ants: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Побудова рішень для всіх мурах одночасно
+
+        На кожному кроці позиція обирається з ймовірністю, пропорційною
+        феромону (щодо вже обраних позицій) та кількості ще не покритих точок, які вона додасть.
+
+        :return: (індекси позицій форми (n_ants, k), відсотки покриття)
+        """
+        cache = self._coverage_cache()
+        n_points = len(self.interest_points)
+        # Перевірка, що кількість точок для антен не перевищує кількість точок інтересу
+        k = min(self.N_ANTENNAS, n_points)
+        
+        solutions = np.empty((n_ants, k), dtype=int)
+        covered = np.zeros((n_ants, cache.bits.shape[1]), dtype=np.uint8)
+        attraction = np.zeros((n_ants, n_points))
+        available = np.ones((n_ants, n_points), dtype=bool)
+        ants = np.arange(n_ants)
+        # Мурахи обробляються блоками, щоб тензор приросту займав обмежену пам'ять
+        block = max(1, 2**22 // max(1, cache.bits.size))
+        
+        for step in range(k):
+            gain = np.empty((n_ants, n_points))
+            for begin in range(0, n_ants, block):
+                uncovered = ~covered[begin:begin + block, None, :]
+                gain[begin:begin + block] = _POPCOUNT[cache.bits[None, :, :] & uncovered].sum(axis=2)
+            
+            tau = attraction / step if step else np.broadcast_to(pheromone.mean(axis=0), attraction.shape)
+            weights = tau ** self.ALPHA * np.maximum(gain, 1e-3) ** self.BETA * available
+            
+            # Вибір за ймовірностями для всіх мурах одним проходом
+            cumulative = np.cumsum(weights, axis=1)
+            threshold = np.random.random((n_ants, 1)) * cumulative[:, -1:]
+            choice = np.minimum((cumulative <= threshold).sum(axis=1), n_points - 1)
+            
+            solutions[:, step] = choice
+            available[ants, choice] = False
+            covered |= cache.bits[choice]
+            attraction += pheromone[choice]
+        
+        coverages = (_POPCOUNT[covered].sum(axis=1) / n_points) * 100
+        return solutions, coverages
+    
+    def _solution_points(self, solution) -> List[Tuple[float, float]]:
+        """Координати позицій рішення"""
+        if solution is None:
+            return []
+        return [self.interest_points[index] for index in solution]
+    
+    def _calculate_coverage(self, antennas: List[Tuple[float, float]]) -> float:
+        """Розрахунок відсотка покриття"""
+        if not self.interest_points:  # Якщо немає точок інтересу
+            return 0.0
+            
+        covered = 0
+        radius = self.coverage_radius
+        
+        for ip_x, ip_y in self.interest_points:
+            for ant_x, ant_y in antennas:
+                # Перевірка, що координати антен валідні
+                if not isinstance(ant_x, (int, float)) or not isinstance(ant_y, (int, float)):
+                    continue
+                    
+                distance = np.sqrt((ip_x - ant_x)**2 + (ip_y - ant_y)**2)
+                if distance <= radius and not self._is_obstructed((ant_x, ant_y), (ip_x, ip_y)):
+                    covered += 1
+                    break
+        
+        return (covered / len(self.interest_points)) * 100
+    
+    def _calculate_coverage_batch(self, solutions: List[List[Tuple[float, float]]]) -> List[float]:
+        """
+        Розрахунок відсотка покриття для кількох рішень одним проходом NumPy
+
+        Результат збігається з _calculate_coverage для кожного рішення.
+        """
+        if not self.interest_points:
+            return [0.0] * len(solutions)
+        
+        # Антени в точках інтересу - оцінка через кеш матриці видимості
+        site_rows = self._site_rows(solutions)
+        if site_rows is not None:
+            cache = self._coverage_cache()
+            return [cache.coverage(rows) for rows in site_rows]
+        
+        points = np.array(self.interest_points, dtype=float)
+        sites = [[(x, y) for x, y in solution
+                  if isinstance(x, (int, float)) and isinstance(y, (int, float))]
+                 for solution in solutions]
+        
+        # Кожна унікальна позиція антени перевіряється один раз для всіх рішень
+        unique_sites = sorted({site for solution in sites for site in solution})
+        if not unique_sites:
+            return [0.0] * len(solutions)
+        site_index = {site: k for k, site in enumerate(unique_sites)}
+        site_coverage = self._site_coverage(np.array(unique_sites, dtype=float), points)
+        
+        coverages = []
+        for solution in sites:
+            if not solution:
+                coverages.append(0.0)
+                continue
+            rows = [site_index[site] for site in solution]
+            covered = int(np.count_nonzero(site_coverage[rows].any(axis=0)))
+            coverages.append((covered / len(self.interest_points)) * 100)
+        return coverages
+    
+    def _site_rows(self, solutions: List[List[Tuple[float, float]]]):
+        """Індекси рядків матриці видимості для рішень або None, якщо антена не в точці інтересу"""
+        index = {point: k for k, point in reversed(list(enumerate(self.interest_points)))}
+        try:
+            return [[index[site] for site in solution] for solution in solutions]
+        except (KeyError, TypeError):
+            return None
+    
+    def _coverage_cache(self) -> CoverageCache:
+        """Кеш видимості, синхронізований з поточним сценарієм"""
+        self.coverage_cache.sync(self)
+        return self.coverage_cache
+    
+    def _site_coverage(self, sites: np.ndarray, points: np.ndarray, radius: float = None) -> np.ndarray:
+        """Матриця (позиції x точки): чи покриває антена в позиції точку інтересу"""
+        # Тензор відстаней через broadcasting, та сама формула, що й у _calculate_coverage
+        distances = np.sqrt((points[None, :, 0] - sites[:, None, 0])**2 +
+                            (points[None, :, 1] - sites[:, None, 1])**2)
+        coverage = distances <= (self.coverage_radius if radius is None else radius)
+        
+        # Перешкоди перевіряються лише для пар у межах радіусу
+        site_idx, point_idx = np.nonzero(coverage)
+        if len(site_idx) and self.obstacles:
+            obstructed = self._obstructed_segments(sites[site_idx], points[point_idx])
+            coverage[site_idx[obstructed], point_idx[obstructed]] = False
+        return coverage
+    
+    def _obstructed_segments(self, starts: np.ndarray, ends: np.ndarray, chunk: int = 4096) -> np.ndarray:
+        """Векторизований _is_obstructed для масиву відрізків (N, 2) -> (N,)"""
+        if len(self.obstacles) >= self.GRID_MIN_OBSTACLES:
+            return self._obstructed_segments_indexed(starts, ends)
+        
+        obstacles = np.array(self.obstacles, dtype=float)
+        result = np.zeros(len(starts), dtype=bool)
+        for begin in range(0, len(starts), chunk):
+            p1 = starts[begin:begin + chunk]
+            p2 = ends[begin:begin + chunk]
+            # Відстань рахується лише для перешкод у розширеному на буфер прямокутнику відрізка
+            low = np.minimum(p1, p2) - OBSTACLE_BUFFER
+            high = np.maximum(p1, p2) + OBSTACLE_BUFFER
+            near = ((obstacles[None, :, 0] > low[:, 0, None]) & (obstacles[None, :, 0] < high[:, 0, None]) &
+                    (obstacles[None, :, 1] > low[:, 1, None]) & (obstacles[None, :, 1] < high[:, 1, None]))
+            segment_idx, obstacle_idx = np.nonzero(near)
+            distance = self._distance_to_segments(p1[segment_idx], p2[segment_idx], obstacles[obstacle_idx])
+            result[begin + segment_idx[distance < OBSTACLE_BUFFER]] = True
+        return result
+    
+    def _obstructed_segments_indexed(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """Те саме, але перевіряються лише перешкоди з комірок сітки вздовж відрізків"""
+        grid = self._obstacle_grid()
+        segment_idx, obstacle_idx = grid.candidate_pairs(starts, ends)
+        distance = self._distance_to_segments(starts[segment_idx], ends[segment_idx],
+                                              grid.points[obstacle_idx])
+        result = np.zeros(len(starts), dtype=bool)
+        result[segment_idx[distance < OBSTACLE_BUFFER]] = True
+        return result
+    
+    def _obstacle_grid(self) -> ObstacleGrid:
+        """Індекс перешкод, синхронізований зі списком self.obstacles"""
+        self.obstacle_grid.sync(self.obstacles)
+        return self.obstacle_grid
+    
+    @staticmethod
+    def _distance_to_segments(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> np.ndarray:
+        """Векторизований _distance_to_line з тими ж операціями (для однакових результатів)"""
+        x1, y1 = p1[..., 0], p1[..., 1]
+        x2, y2 = p2[..., 0], p2[..., 1]
+        x3, y3 = p3[..., 0], p3[..., 1]
+        
+        px = x2 - x1
+        py = y2 - y1
+        norm = px*px + py*py
+        degenerate = norm == 0
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            u = ((x3 - x1) * px + (y3 - y1) * py) / norm
+        u = np.clip(u, 0, 1)
+        
+        x = x1 + u * px
+        y = y1 + u * py
+        
+        dx = x - x3
+        dy = y - y3
+        
+        # Якщо p1 і p2 збігаються - відстань між p1 і p3
+        return np.where(degenerate, np.sqrt((x3 - x1)**2 + (y3 - y1)**2), np.sqrt(dx*dx + dy*dy))
+    
+    def _is_obstructed(self, point1: Tuple[float, float], point2: Tuple[float, float]) -> bool:
+        """Перевірка на наявність перешкод між двома точками"""
+        if not self.obstacles:  # Якщо немає перешкод
+            return False
+        
+        # Перевіряються лише перешкоди з комірок сітки вздовж відрізка
+        grid = self._obstacle_grid()
+        for index in grid.candidates(point1, point2):
+            # Спрощена перевірка - якщо перешкода ближче ніж 5 одиниць до лінії
+            distance = self._distance_to_line(point1, point2, grid.coords[index])
+            if distance < OBSTACLE_BUFFER:
+                return True
+        return False
+    
+    def _distance_to_line(self, p1, p2, p3):
+        """Відстань від точки p3 до лінії між p1 і p2"""
+        x1, y1 = p1
+        x2, y2 = p2
+        x3, y3 = p3
+        
+        # Якщо точки p1 і p2 збігаються, повертаємо відстань між p1 і p3
+        if x1 == x2 and y1 == y2:
+            return np.sqrt((x3 - x1)**2 + (y3 - y1)**2)
+        
+        px = x2 - x1
+        py = y2 - y1
+        norm = px*px + py*py
+        
+        u = ((x3 - x1) * px + (y3 - y1) * py) / float(norm)
+        u = max(0, min(1, u))
+        
+        x = x1 + u * px
+        y = y1 + u * py
+        
+        dx = x - x3
+        dy = y - y3
+        
+        return np.sqrt(dx*dx + dy*dy)
+    
+    def _update_pheromones(self, pheromone: np.ndarray, solutions: List) -> np.ndarray:
+        """Оновлення матриці феромонів (для пар позицій найкращого рішення)"""
+        best_solution, best_coverage = max(solutions, key=lambda x: x[1])
+        deposit = np.full((len(best_solution), len(best_solution)), best_coverage / 100)
+        np.fill_diagonal(deposit, 0)
+        pheromone[np.ix_(best_solution, best_solution)] += deposit
+        
+        return pheromone
+    
+    def _visualize_progress(self, solution: List[Tuple[float, float]], iteration: int, coverage: float):
+        """Без інтерфейсу прогрес лише друкується"""
+    
+    def solve(self, method: str = 'aco', n_ants: int = 20, n_iterations: int = 50, total_budget: float = 1000.0,
+              progress=None, cancel: threading.Event = None) -> Tuple[List[Tuple[float, float, str]], float, float]:
+        """
+        Оптимізація розміщення обраним методом (покриття - за цільовою функцією методу)
+
+        :param method: 'aco' - мурашиний алгоритм, 'budget' - типи антен у межах бюджету,
+                       'raster' - жадібний пошук по комірках растра
+        :return: (антени (x, y, тип), відсоток покриття, вартість)
+        """
+        if method == 'aco':
+            sites = self._ant_colony_optimization(n_ants, n_iterations, progress=progress, cancel=cancel)
+            coverage = self._calculate_coverage_batch([sites])[0]
+        elif method == 'budget':
+            antennas, coverage, cost = budget.optimize_budget(self, total_budget, n_ants, n_iterations,
+                                                              progress=progress, cancel=cancel)
+            return antennas, coverage, cost
+        elif method == 'raster':
+            sites, coverage = raster.greedy_sites(self, self.N_ANTENNAS, self.coverage_radius, self.RASTER_SHAPE)
+        else:
+            raise ValueError(f"Невідомий метод оптимізації: {method}")
+        # Позиції без типу отримують антену 'medium', покриття - з радіусом coverage_radius
+        antennas = [(float(x), float(y), 'medium') for x, y in sites]
+        return antennas, coverage, float(len(antennas) * self.antenna_types['medium']['cost'])
+
+
+def scenario_dict(solver: AntennaPlacementSolver, params: Dict = None) -> Dict:
+    """Сценарій (розміри, точки, перешкоди, антени, типи антен) і параметри оптимізації"""
+    return {
+        'width': solver.width,
+        'height': solver.height,
+        'coverage_radius': solver.coverage_radius,
+        'antenna_types': solver.antenna_types,
+        'interest_points': [[float(x), float(y)] for x, y in solver.interest_points],
+        'obstacles': [[float(x), float(y)] for x, y in solver.obstacles],
+        'antennas': [[float(x), float(y), kind] for x, y, kind in solver.antennas],
+        'params': dict(params or {}),
+    }
+
+
+def save_scenario(solver: AntennaPlacementSolver, path: str, params: Dict = None):
+    """
+    Атомарний запис сценарію у JSON або NPZ (за розширенням path)
+
+    У NPZ координати зберігаються масивами, решта полів - JSON-рядком 'meta'.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in SCENARIO_FORMATS:
+        raise ValueError(f"Непідтримуваний формат сценарію: {path}")
+    data = scenario_dict(solver, params)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(suffix=extension, dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if extension == '.json':
+                f.write(json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8'))
+            else:
+                arrays = {name: np.array(data.pop(name), dtype=float).reshape(-1, 2)
+                          for name in ('interest_points', 'obstacles')}
+                antennas = data.pop('antennas')
+                np.savez_compressed(f, **arrays,
+                                    antenna_positions=np.array([a[:2] for a in antennas], dtype=float).reshape(-1, 2),
+                                    antenna_kinds=np.array([a[2] for a in antennas], dtype=str),
+                                    meta=np.array(json.dumps(data, ensure_ascii=False)))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def load_scenario(path: str) -> Tuple[AntennaPlacementSolver, Dict]:
+    """
+    Читання сценарію, записаного save_scenario
+
+    :return: (розв'язувач зі сценарієм, параметри оптимізації)
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.json':
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    elif extension == '.npz':
+        with np.load(path, allow_pickle=False) as archive:
+            data = json.loads(str(archive['meta']))
+            data['interest_points'] = archive['interest_points'].tolist()
+            data['obstacles'] = archive['obstacles'].tolist()
+            data['antennas'] = [[x, y, str(kind)] for (x, y), kind
+                                in zip(archive['antenna_positions'].tolist(), archive['antenna_kinds'])]
+    else:
+        raise ValueError(f"Непідтримуваний формат сценарію: {path}")
+
+    solver = AntennaPlacementSolver(data['width'], data['height'])
+    solver.coverage_radius = data.get('coverage_radius', solver.coverage_radius)
+    solver.antenna_types = data.get('antenna_types', solver.antenna_types)
+    solver.interest_points = [(float(x), float(y)) for x, y in data['interest_points']]
+    solver.obstacles = [(float(x), float(y)) for x, y in data.get('obstacles', [])]
+    solver.antennas = [(float(x), float(y), kind) for x, y, kind in data.get('antennas', [])]
+    return solver, data.get('params', {})
@@ -4,20 +4,26 @@ import random
 import unittest
 from typing import List, Tuple
 
+from profiling import PhaseTimer
+
 class AntColony:
     """Клас для реалізації мурашиного алгоритму"""
     
     def __init__(self, distances: np.ndarray, n_ants: int = 10, n_iterations: int = 100,
-                 decay: float = 0.5, alpha: float = 1, beta: float = 2):
+                 decay: float = 0.5, alpha: float = 1, beta: float = 2,
+                 distance_scale: float = 1.0, profile: bool = False):
         """
         Ініціалізація параметрів
         
-        :param distances: матриця відстаней між містами
+        :param distances: матриця відстаней між містами (може бути np.memmap,
+                          float32 або масштабована uint16/uint32; не обов'язково симетрична)
         :param n_ants: кількість мурах
         :param n_iterations: кількість ітерацій
         :param decay: коефіцієнт випаровування феромонів
         :param alpha: вага феромонів у ймовірності вибору шляху
         :param beta: вага евристичної інформації (1/відстань)
+        :param distance_scale: множник для переведення значень матриці у реальні відстані
+        :param profile: збирати статистику фаз кожної ітерації у self.stats
         """
         # 1. Ініціалізація феромонів
         self.distances = distances
@@ -26,32 +32,161 @@ class AntColony:
         self.decay = decay
         self.alpha = alpha
         self.beta = beta
+        self.distance_scale = distance_scale
         self.pheromone = np.ones(self.distances.shape) / len(distances)
         self.all_cities = range(len(distances))
         self.best_path = None
         self.best_length = float('inf')
+        self.timer = PhaseTimer(profile)
+        self.stats = []
         
-    def run(self) -> Tuple[List[int], float]:
-        """Запуск алгоритму"""
-        for iteration in range(self.n_iterations):
+    def run(self, n_iterations: int = None) -> Tuple[List[int], float]:
+        """
+        Запуск алгоритму
+
+        :param n_iterations: кількість ітерацій цього запуску (за замовчуванням self.n_iterations);
+                             повторний виклик продовжує пошук з поточних феромонів і найкращого шляху
+        """
+        timer = self.timer
+        for iteration in range(n_iterations or self.n_iterations):
+            stats = timer.start(iteration)
+            
             # 2. Вибір маршруту та 3. Прокладання шляху
-            ants_paths = self._generate_ants_paths()
+            with timer.phase('construct'):
+                ants_paths = self._generate_ants_paths()
             
             # 4. Оновлення феромонів
-            self._update_pheromones(ants_paths)
+            with timer.phase('update'):
+                self._update_pheromones(ants_paths)
             
             # 5. Еволюція шляхів (знаходження найкращого)
-            current_best_path, current_best_length = min(ants_paths, key=lambda x: x[1])
-            if current_best_length < self.best_length:
-                self.best_path = current_best_path
-                self.best_length = current_best_length
+            with timer.phase('best'):
+                current_best_path, current_best_length = min(ants_paths, key=lambda x: x[1])
+                if current_best_length < self.best_length:
+                    self.best_path = current_best_path
+                    self.best_length = current_best_length
                 
             # 6. Випаровування феромонів
-            self.pheromone *= self.decay
+            with timer.phase('evaporate'):
+                self.pheromone *= self.decay
+            
+            if stats is not None:
+                stats.count_paths(ants_paths)
+                self.stats.append(stats)
             
         # 7. Завершення роботи алгоритму
         return self.best_path, self.best_length
     
+    def add_cities(self, out_distances: np.ndarray, in_distances: np.ndarray = None) -> List[int]:
+        """
+        Додавання міст без перебудови колонії
+
+        Феромони нових ребер копіюються з найближчого існуючого міста
+        (ребра до нього самого і між новими містами - з його найсильнішого ребра),
+        нові міста вставляються у найкращий шлях методом найдешевшої вставки.
+
+        :param out_distances: відстані від нових міст до всіх міст, форма (k, n + k)
+        :param in_distances: відстані від існуючих міст до нових, форма (n, k);
+                             якщо не задано - відстані вважаються симетричними
+        :return: індекси нових міст
+        """
+        out_distances = np.atleast_2d(np.asarray(out_distances, dtype=float))
+        n, k = len(self.distances), len(out_distances)
+        if in_distances is None:
+            in_distances = out_distances[:, :n].T
+        in_distances = np.asarray(in_distances, dtype=float).reshape(n, k)
+
+        distances = np.empty((n + k, n + k), dtype=self.distances.dtype)
+        distances[:n, :n] = self.distances
+        distances[n:, :] = self._to_matrix_units(out_distances)
+        distances[:n, n:] = self._to_matrix_units(in_distances)
+
+        nearest = np.argmin(out_distances[:, :n], axis=1)
+        pheromone = np.empty((n + k, n + k))
+        pheromone[:n, :n] = self.pheromone
+        pheromone[n:, :n] = self.pheromone[nearest, :]
+        pheromone[:n, n:] = self.pheromone[:, nearest]
+        # Діагональ не отримує феромонів, тому ребра нове-найближче та нове-нове
+        # засіваються найбільшим феромоном рядка найближчого міста без діагоналі
+        off_diagonal = self.pheromone[nearest].copy()
+        off_diagonal[np.arange(k), nearest] = -np.inf
+        seed = off_diagonal.max(axis=1) if n > 1 else self.pheromone[nearest, nearest]
+        pheromone[n + np.arange(k), nearest] = seed
+        pheromone[nearest, n + np.arange(k)] = seed
+        pheromone[n:, n:] = (seed[:, None] + seed[None, :]) / 2
+
+        self.distances = distances
+        self.pheromone = pheromone
+        self.all_cities = range(n + k)
+
+        new_cities = list(range(n, n + k))
+        if self.best_path is not None:
+            for city in new_cities:
+                self.best_path = self._insert_city(self.best_path, city)
+            self._repair_best_path()
+        return new_cities
+
+    def remove_cities(self, cities: List[int]):
+        """
+        Видалення міст; індекси решти міст зсуваються як у np.delete
+
+        Найкращий шлях зберігається без видалених міст.
+        """
+        n = len(self.distances)
+        keep = np.setdiff1d(np.arange(n), cities)
+        self.distances = self.distances[np.ix_(keep, keep)]
+        self.pheromone = self.pheromone[np.ix_(keep, keep)]
+        self.all_cities = range(len(keep))
+
+        if self.best_path is not None:
+            new_index = np.full(n, -1)
+            new_index[keep] = np.arange(len(keep))
+            path = [int(new_index[city]) for city in self.best_path[:-1] if new_index[city] >= 0]
+            self.best_path = path + path[:1]
+            self._repair_best_path()
+
+    def update_distances(self, rows: List[int], cols: List[int], values: List[float], symmetric: bool = False):
+        """
+        Зміна окремих відстаней (наприклад, через затори)
+
+        :param symmetric: оновити також зворотні відстані cols -> rows
+        """
+        if not self.distances.flags.writeable:
+            # Матриця з memmap лише для читання - робимо власну копію
+            self.distances = np.array(self.distances)
+        values = self._to_matrix_units(np.asarray(values, dtype=float))
+        self.distances[rows, cols] = values
+        if symmetric:
+            self.distances[cols, rows] = values
+
+        if self.best_path is not None:
+            self._repair_best_path()
+
+    def _to_matrix_units(self, distances: np.ndarray) -> np.ndarray:
+        """Переведення реальних відстаней у формат матриці (з урахуванням масштабу)"""
+        values = distances / self.distance_scale
+        if np.issubdtype(self.distances.dtype, np.integer):
+            values = np.clip(np.rint(values), 1, np.iinfo(self.distances.dtype).max)
+            values[distances == 0] = 0
+        return values.astype(self.distances.dtype)
+
+    def _insert_city(self, path: List[int], city: int) -> List[int]:
+        """Найдешевша вставка міста у замкнений шлях"""
+        tour = np.array(path)
+        start, end = tour[:-1], tour[1:]
+        delta = (self.distances[start, city].astype(np.float64) + self.distances[city, end]
+                 - self.distances[start, end])
+        position = int(np.argmin(delta)) + 1
+        return path[:position] + [city] + path[position:]
+
+    def _repair_best_path(self):
+        """Перерахунок довжини найкращого шляху та підсилення його феромонів для теплого старту"""
+        if len(self.best_path) < 2:
+            self.best_path, self.best_length = None, float('inf')
+            return
+        self.best_length = self._calculate_path_length(self.best_path)
+        self._update_pheromones([(self.best_path, self.best_length)])
+
     def _generate_ants_paths(self) -> List[Tuple[List[int], float]]:
         """Генерація шляхів для всіх мурах"""
         return [self._generate_path() for _ in range(self.n_ants)]
@@ -81,12 +216,17 @@ class AntColony:
     def _select_next_city(self, current: int, visited: set) -> int:
         """Вибір наступного міста на основі ймовірностей"""
         unvisited = [city for city in self.all_cities if city not in visited]
+        # Рядки читаються один раз: індексування memmap по елементу створює view на кожне місто
+        distances = np.asarray(self.distances[current], dtype=np.float64).tolist()
+        pheromone = self.pheromone[current].tolist()
         probabilities = []
         
         for city in unvisited:
-            pheromone = self.pheromone[current][city] ** self.alpha
-            heuristic = (1 / self.distances[current][city]) ** self.beta
-            probabilities.append(pheromone * heuristic)
+            heuristic = (1 / distances[city]) ** self.beta
+            probabilities.append(pheromone[city] ** self.alpha * heuristic)
+        
+        if self.timer.current is not None:
+            self.timer.current.probability_evaluations += len(unvisited)
         
         # Нормалізація ймовірностей
         total = sum(probabilities)
@@ -103,7 +243,9 @@ class AntColony:
     
     def _calculate_path_length(self, path: List[int]) -> float:
         """Розрахунок довжини шляху"""
-        return sum(self.distances[path[i], path[i+1]] for i in range(len(path)-1))
+        # Приведення до float64, щоб цілочисельні матриці не переповнювались при сумуванні
+        steps = self.distances[path[:-1], path[1:]].astype(np.float64)
+        return float(steps.sum()) * self.distance_scale
 
 
 # Тести для перевірки коректності роботи алгоритму
@@ -155,6 +297,110 @@ class TestAntColony(unittest.TestCase):
         self.assertEqual(path[0], path[-1])
         self.assertTrue(length < float('inf'))
 
+    def test_memmap_scaled_asymmetric_matrix(self):
+        """Тест роботи з memory-mapped масштабованою несиметричною матрицею"""
+        import os
+        import tempfile
+        from distance_cache import save_distance_matrix, load_distance_matrix
+
+        distances = self.distances.astype(float)
+        distances[0][1] = 9  # Несиметрична відстань
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'matrix.npy')
+            save_distance_matrix(distances, path, dtype='uint16')
+            matrix, scale = load_distance_matrix(path)
+            self.assertIsInstance(matrix, np.memmap)
+            self.assertEqual(matrix.dtype, np.uint16)
+
+            colony = AntColony(matrix, n_ants=5, n_iterations=5, distance_scale=scale)
+            self.assertAlmostEqual(colony._calculate_path_length([0, 1, 2, 3, 0]), 9 + 4 + 7 + 5, places=2)
+            self.assertAlmostEqual(colony._calculate_path_length([0, 3, 2, 1, 0]), 5 + 7 + 4 + 2, places=2)
+            path, length = colony.run()
+            self.assertEqual(len(set(path[:-1])), 4)
+            del colony, matrix
+
+    def test_profiling_stats(self):
+        """Тест збору статистики фаз"""
+        self.assertEqual(self.colony.timer.phase('construct'), self.colony.timer.phase('update'))
+        colony = AntColony(self.distances, n_ants=5, n_iterations=3, profile=True)
+        colony.run()
+        self.assertEqual(len(colony.stats), 3)
+        stats = colony.stats[0]
+        self.assertEqual(stats.ants_constructed, 5)
+        self.assertEqual(stats.edges_deposited, 5 * 4)
+        self.assertEqual(stats.probability_evaluations, 5 * (3 + 2 + 1))
+        self.assertGreater(stats.construct_time, 0)
+        self.assertEqual(len(self.colony.stats), 0)
+
+    def test_visualizing_colony_stats(self):
+        """Колонія з візуалізацією (main.py) теж рахує обчислені ймовірності"""
+        import main
+
+        plt.switch_backend('Agg')
+        cities = np.array([[0, 0], [2, 0], [2, 3], [0, 5]], dtype=float)
+        colony = main.AntColony(cities, n_ants=3, n_iterations=2, profile=True)
+        colony.run()
+        plt.close(colony.visualizer.fig)
+        self.assertEqual([stats.probability_evaluations for stats in colony.stats], [3 * (3 + 2 + 1)] * 2)
+        self.assertTrue(all(stats.visualize_time > 0 for stats in colony.stats))
+
+    def test_added_city_pheromone(self):
+        """Феромони нових ребер порівнянні з існуючими ребрами, а не близькі до нуля"""
+        colony = AntColony(self.distances, n_ants=5, n_iterations=20, decay=0.5)
+        colony.run()
+        before = colony.pheromone.copy()
+        existing = before[~np.eye(4, dtype=bool)]
+        colony.add_cities([[2.5, 3, 4, 6, 0, 1], [3, 3.5, 4.5, 6.5, 1, 0]])
+        # Найближче місто обох нових - 0; найкращий шлях лише додає феромони
+        strongest = np.delete(before[0], 0).max()
+        for new in (4, 5):
+            self.assertGreaterEqual(colony.pheromone[new, 0], strongest)
+            self.assertGreaterEqual(colony.pheromone[0, new], strongest)
+        self.assertGreaterEqual(colony.pheromone[4, 5], np.median(existing))
+        self.assertGreaterEqual(colony.pheromone[5, 4], np.median(existing))
+
+    def test_profile_capture_and_store(self):
+        """Прогін під cProfile/tracemalloc дає звіт; статистика ітерацій пишеться в базу"""
+        import sqlite3
+        from profiling import profile_run, save_stats
+
+        (path, length), report = profile_run(AntColony(self.distances, n_ants=3, n_iterations=2), 'cprofile')
+        self.assertEqual(len(path), 5)
+        self.assertIn('_generate_ants_paths', report)
+        _, report = profile_run(AntColony(self.distances, n_ants=3, n_iterations=2), 'tracemalloc')
+        self.assertIn('пік', report)
+        with self.assertRaises(ValueError):
+            profile_run(self.colony, 'perf')
+
+        colony = AntColony(self.distances, n_ants=3, n_iterations=4, profile=True)
+        colony.run()
+        conn = sqlite3.connect(':memory:')
+        save_stats(colony.stats, conn, 'run-1')
+        rows = conn.execute('SELECT iteration, ants_constructed, probability_evaluations FROM iteration_stats '
+                            'WHERE run_id = ? ORDER BY iteration', ('run-1',)).fetchall()
+        self.assertEqual(rows, [(i, 3, 3 * 6) for i in range(4)])
+        conn.close()
+
+    def test_dynamic_cities(self):
+        """Тест додавання, видалення міст і зміни відстаней після запуску"""
+        self.colony.run()
+        new_cities = self.colony.add_cities([[4, 3, 2, 6, 0]])
+        self.assertEqual(new_cities, [4])
+        self.assertEqual(self.colony.pheromone.shape, (5, 5))
+        self.assertEqual(self.colony.distances[1][4], 3)
+        self.assertEqual(sorted(self.colony.best_path[:-1]), [0, 1, 2, 3, 4])
+        self.assertEqual(self.colony.best_length, self.colony._calculate_path_length(self.colony.best_path))
+
+        self.colony.remove_cities([1])
+        self.assertEqual(self.colony.distances.shape, (4, 4))
+        self.assertEqual(sorted(self.colony.best_path[:-1]), [0, 1, 2, 3])
+
+        self.colony.update_distances([0], [1], [1], symmetric=True)
+        self.assertEqual(self.colony.distances[1][0], 1)
+        path, length = self.colony.run(n_iterations=3)
+        self.assertEqual(len(set(path[:-1])), 4)
+        self.assertEqual(length, self.colony._calculate_path_length(path))
+
 
 # Приклад використання
 if __name__ == "__main__":
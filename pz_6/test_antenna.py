@@ -0,0 +1,155 @@
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import random
+import unittest
+
+import raster
+from antenna import AntennaPlacementOptimizer
+
+
+# Тести для перевірки оптимізатора розміщення антен
+class TestAntennaPlacement(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(1)
+        random.seed(1)
+        self.optimizer = AntennaPlacementOptimizer()
+        self.optimizer.interest_points = [tuple(p) for p in np.random.rand(60, 2) * 100]
+        self.optimizer.obstacles = [tuple(p) for p in np.random.rand(25, 2) * 100]
+
+    def tearDown(self):
+        plt.close(self.optimizer.fig)
+
+    def test_batch_coverage_matches_scalar(self):
+        """Пакетна оцінка дає ті самі відсотки покриття"""
+        solutions = [self.optimizer._solution_points(self.optimizer._generate_solution())
+                     for _ in range(30)]
+        solutions.append([self.optimizer.interest_points[0]] * 2)  # Антени в одній точці
+        solutions.append([])
+        expected = [self.optimizer._calculate_coverage(solution) for solution in solutions]
+        self.assertEqual(self.optimizer._calculate_coverage_batch(solutions), expected)
+
+    def test_batch_coverage_without_obstacles(self):
+        """Без перешкод покриття визначається лише радіусом"""
+        self.optimizer.obstacles = []
+        solution = [self.optimizer.interest_points[0]]
+        self.assertEqual(self.optimizer._calculate_coverage_batch([solution]),
+                         [self.optimizer._calculate_coverage(solution)])
+
+    def test_obstacle_grid_matches_full_scan(self):
+        """Індекс перешкод знаходить ті самі блокування, що й повний перебір"""
+        self.optimizer.obstacles = [tuple(p) for p in np.random.rand(400, 2) * 100]
+        starts = np.random.rand(300, 2) * 100
+        ends = starts + (np.random.rand(300, 2) - 0.5) * 60
+        indexed = self.optimizer._obstructed_segments_indexed(starts, ends)
+        self.optimizer.GRID_MIN_OBSTACLES = 10 ** 9
+        self.assertTrue(np.array_equal(indexed, self.optimizer._obstructed_segments(starts, ends)))
+
+        # Інкрементальне додавання перешкоди оновлює індекс
+        self.optimizer.obstacles.append((float(starts[0, 0]), float(starts[0, 1])))
+        self.assertTrue(self.optimizer._is_obstructed(tuple(starts[0]), tuple(ends[0])))
+        self.assertEqual(len(self.optimizer.obstacle_grid.coords), 401)
+
+    def test_coverage_cache_incremental(self):
+        """Інкрементальне оновлення кешу видимості збігається з повною перебудовою"""
+        cache = self.optimizer._coverage_cache()
+        self.assertEqual(cache.coverage([0, 1, 2]),
+                         self.optimizer._calculate_coverage(self.optimizer.interest_points[:3]))
+
+        self.optimizer.interest_points.extend(tuple(p) for p in np.random.rand(13, 2) * 100)
+        self.optimizer.obstacles.extend(tuple(p) for p in np.random.rand(4, 2) * 100)
+        incremental = self.optimizer._coverage_cache().bits.copy()
+        self.assertEqual(self.optimizer.coverage_cache.n_points, 73)
+
+        self.optimizer.coverage_cache = type(cache)()
+        self.assertTrue(np.array_equal(incremental, self.optimizer._coverage_cache().bits))
+
+    def test_constructed_solutions(self):
+        """Рішення - різні індекси точок, покриття збігається з прямим розрахунком"""
+        pheromone = np.ones((60, 60)) / 60
+        solutions, coverages = self.optimizer._construct_solutions(pheromone, 8)
+        self.assertEqual(solutions.shape, (8, 5))
+        for solution, coverage in zip(solutions, coverages):
+            self.assertEqual(len(set(solution)), 5)
+            self.assertEqual(coverage, self.optimizer._calculate_coverage(self.optimizer._solution_points(solution)))
+
+        updated = self.optimizer._update_pheromones(pheromone.copy(), list(zip(solutions, coverages)))
+        best = solutions[np.argmax(coverages)]
+        self.assertGreater(updated[best[0], best[1]], pheromone[best[0], best[1]])
+        self.assertEqual(updated[best[0], best[0]], pheromone[best[0], best[0]])
+
+    def test_optimization(self):
+        """Тест повного виконання мурашиного алгоритму"""
+        self.optimizer._visualize_progress = lambda *args: None
+        solution = self.optimizer._ant_colony_optimization(n_ants=10, n_iterations=5)
+        self.assertEqual(len(solution), 5)
+        self.assertTrue(all(site in self.optimizer.interest_points for site in solution))
+
+    def test_coverage_heatmap(self):
+        """Теплова карта збігається з прямим підрахунком точок у диску навколо центру комірки"""
+        points = np.array(self.optimizer.interest_points)
+        heat = raster.coverage_heatmap(points, 100, 100, 15, (40, 50))
+        self.assertEqual(heat.shape, (40, 50))
+        for cell in (0, 777, 1999):
+            center = raster.cell_centers(cell, 100, 100, (40, 50))[0]
+            cells = np.floor(points / [2, 2.5]) * [2, 2.5] + [1, 1.25]  # Центри комірок точок
+            expected = np.count_nonzero(np.hypot(*(cells - center).T) <= 15 + 1e-9)
+            self.assertEqual(heat.ravel()[cell], expected)
+
+    def test_coverage_heatmap_shadows(self):
+        """З перешкодами карта рахує лише видимі з центру комірки точки (центри їхніх комірок)"""
+        points = np.array(self.optimizer.interest_points)
+        shape = (40, 50)
+        plain = raster.coverage_heatmap(points, 100, 100, 15, shape)
+        heat = raster.coverage_heatmap(points, 100, 100, 15, shape, self.optimizer.obstacles)
+        self.assertTrue(np.all(heat <= plain))
+        self.assertLess(heat.sum(), plain.sum())
+
+        cells = np.floor(points / [2, 2.5]) * [2, 2.5] + [1, 1.25]
+        for cell in range(0, 2000, 13):
+            center = raster.cell_centers(cell, 100, 100, shape)[0]
+            near = cells[np.hypot(*(cells - center).T) <= 15 + 1e-9]
+            blocked = self.optimizer._obstructed_segments(np.repeat(center[None], len(near), axis=0), near)
+            self.assertEqual(heat.ravel()[cell], np.count_nonzero(~blocked))
+
+    def test_raster_greedy_sites(self):
+        """Растровий пошук ставить антени поза точками інтересу і повертає точне покриття"""
+        sites, coverage = raster.greedy_sites(self.optimizer, 5, 15, (100, 100))
+        self.assertEqual(len(sites), 5)
+        self.assertEqual(coverage, self.optimizer._calculate_coverage(sites))
+        self.assertGreater(coverage, 0)
+
+    def test_plot_reuses_artists(self):
+        """Перемальовування оновлює дані наявних об'єктів, не створюючи нових"""
+        self.optimizer.antennas = [(10.0, 20.0, 'small'), (30.0, 40.0, 'large')]
+        self.optimizer._update_plot()
+        n_artists = len(self.optimizer.ax.get_children())
+        self.optimizer.fig.canvas.draw()
+
+        self.optimizer.interest_points.append((5.0, 5.0))
+        self.optimizer._update_plot(self.optimizer.interest_points[:3])
+        self.optimizer._show_progress(self.optimizer.interest_points[:3], 1, 50.0)
+        self.assertEqual(len(self.optimizer.ax.get_children()), n_artists)
+        self.assertEqual(len(self.optimizer.interest_artist.get_xdata()), 61)
+        self.assertEqual(list(self.optimizer.antenna_circles.get_offsets()[1]), [30.0, 40.0])
+        self.assertEqual(len(self.optimizer.solution_circles.get_offsets()), 3)
+
+    def test_background_optimization_and_cancel(self):
+        """Оптимізація у фоновому потоці публікує прогрес і підтримує скасування"""
+        self.optimizer.slider_iter.set_val(200)
+        self.optimizer._run_optimization(None)
+        self.optimizer.slider_iter.set_val(10)  # Не впливає на запущену оптимізацію
+        self.optimizer._cancel_optimization(None)
+        self.optimizer.worker.join(timeout=30)
+        self.assertFalse(self.optimizer._is_running())
+
+        messages = list(self.optimizer.progress_queue.queue)
+        self.assertIn(messages[-1][0], ('cancelled', 'done'))
+        self.optimizer._poll_progress()
+        self.assertEqual(len(self.optimizer.antennas), 5)
+        self.assertTrue(self.optimizer.progress_queue.empty())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import csv
+import numpy as np
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import batch
+from solver import load_scenario, save_scenario
+
+
+# Тести для збереження сценаріїв і пакетної оптимізації без інтерфейсу
+class TestBatchOptimization(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(3)
+        random.seed(3)
+        self.directory = tempfile.TemporaryDirectory()
+        self.scenarios = os.path.join(self.directory.name, 'scenarios')
+        os.makedirs(self.scenarios)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_scenario_round_trip(self):
+        """Сценарій відновлюється однаково з JSON і NPZ"""
+        json_path, npz_path = batch.generate_scenarios(self.scenarios, 1, 20, 5)[0], \
+            os.path.join(self.scenarios, 'copy.npz')
+        solver, params = load_scenario(json_path)
+        solver.antennas = [(1.5, 2.5, 'small'), (3.0, 4.0, 'large')]
+        save_scenario(solver, npz_path, params)
+
+        restored, restored_params = load_scenario(npz_path)
+        self.assertEqual(restored_params, params)
+        for name in ('interest_points', 'obstacles', 'antennas', 'antenna_types', 'width', 'height'):
+            self.assertEqual(getattr(restored, name), getattr(solver, name))
+
+    def test_headless_import(self):
+        """Розв'язувач і пакетний запуск не імпортують matplotlib"""
+        code = 'import sys, batch; assert "matplotlib" not in sys.modules'
+        subprocess.run([sys.executable, '-c', code], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+    def test_run_batch(self):
+        """Кожен сценарій отримує файл результату і рядок зведеної таблиці"""
+        batch.generate_scenarios(self.scenarios, 2, 30, 10, extension='.npz')
+        out_dir = os.path.join(self.directory.name, 'results')
+        summary = batch.run_batch(self.scenarios, out_dir, {'n_ants': 5, 'n_iterations': 3}, workers=2)
+
+        self.assertEqual([row['scenario'] for row in summary], ['scenario_000.npz', 'scenario_001.npz'])
+        with open(os.path.join(out_dir, 'summary.csv')) as f:
+            self.assertEqual(len(list(csv.DictReader(f))), 2)
+        for row in summary:
+            solver, params = load_scenario(os.path.join(out_dir, row['scenario']))
+            self.assertEqual(len(solver.antennas), row['antennas'])
+            self.assertEqual(params['n_iterations'], 3)
+            self.assertGreater(row['coverage'], 0)
+
+        # Той самий сценарій з тим самим зерном дає той самий результат
+        again = batch.run_scenario(os.path.join(self.scenarios, 'scenario_000.npz'), out_dir,
+                                   {'n_ants': 5, 'n_iterations': 3})
+        self.assertEqual(again['coverage'], summary[0]['coverage'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import random
+import unittest
+
+import budget
+from antenna import AntennaPlacementOptimizer
+
+
+# Тести для розміщення антен з обмеженим бюджетом
+class TestBudgetPlacement(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(2)
+        random.seed(2)
+        self.optimizer = AntennaPlacementOptimizer()
+        self.optimizer.interest_points = [tuple(p) for p in np.random.rand(80, 2) * 100]
+        self.optimizer.obstacles = [tuple(p) for p in np.random.rand(15, 2) * 100]
+        self.coverage = budget.SiteCoverage(self.optimizer)
+
+    def tearDown(self):
+        plt.close(self.optimizer.fig)
+
+    def _full_coverage(self, placement):
+        """Покриття, пораховане заново для всього рішення"""
+        covered = np.zeros(80, dtype=bool)
+        for site, kind in placement.antennas.items():
+            covered[self.coverage.points(site, kind)] = True
+        return int(covered.sum())
+
+    def test_site_coverage_matches_optimizer(self):
+        """CSR-покриття позиції збігається з матрицею видимості для радіуса типу"""
+        points = np.array(self.optimizer.interest_points)
+        for kind, name in enumerate(self.coverage.types):
+            radius = self.optimizer.antenna_types[name]['radius']
+            expected = self.optimizer._site_coverage(points[7:8], points, radius)[0]
+            self.assertEqual(list(self.coverage.points(7, kind)), list(np.nonzero(expected)[0]))
+            gains = self.coverage.gains(np.zeros(80, dtype=int), kind)
+            self.assertEqual(gains[7], expected.sum())
+
+    def test_incremental_deltas(self):
+        """Інкрементальні зміни покриття збігаються з повним перерахунком"""
+        placement = budget.BudgetPlacement(self.coverage, 1000)
+        for site, kind in [(0, 0), (5, 2), (9, 1), (30, 1)]:
+            delta = placement.add_delta(site, kind)
+            before = placement.covered
+            placement.add(site, kind)
+            self.assertEqual(placement.covered - before, delta)
+            self.assertEqual(placement.covered, self._full_coverage(placement))
+
+        for site, new_site, new_kind in [(5, 5, 0), (9, 40, 1), (30, 31, 2)]:
+            delta = placement.replace_delta(site, new_site, new_kind)
+            before = placement.covered
+            placement.replace(site, new_site, new_kind)
+            self.assertEqual(placement.covered - before, delta)
+            self.assertEqual(placement.covered, self._full_coverage(placement))
+
+        delta = placement.remove_delta(0)
+        before = placement.covered
+        placement.remove(0)
+        self.assertEqual(placement.covered - before, delta)
+        self.assertEqual(placement.cost, 100 + 200 + 300)
+
+    def test_optimize_within_budget(self):
+        """Рішення вкладається в бюджет, покриття відповідає прямому розрахунку"""
+        antennas, coverage, cost = budget.optimize_budget(self.optimizer, 700, n_ants=5, n_iterations=5,
+                                                          n_moves=500)
+        costs = {name: spec['cost'] for name, spec in self.optimizer.antenna_types.items()}
+        self.assertLessEqual(cost, 700)
+        self.assertEqual(cost, sum(costs[t] for _, _, t in antennas))
+        self.optimizer.antennas = antennas
+        covered = np.zeros(80, dtype=bool)
+        points = np.array(self.optimizer.interest_points)
+        for x, y, name in antennas:
+            radius = self.optimizer.antenna_types[name]['radius']
+            covered |= self.optimizer._site_coverage(np.array([[x, y]]), points, radius)[0]
+        self.assertAlmostEqual(coverage, covered.mean() * 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
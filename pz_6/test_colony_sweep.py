@@ -0,0 +1,110 @@
+import contextlib
+import io
+import numpy as np
+import os
+import sqlite3
+import tempfile
+import unittest
+
+import colony_sweep
+from distance_cache import save_distance_matrix
+
+
+# Тести для перебору параметрів мурашиного алгоритму
+class TestSweep(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = os.path.join(self.directory.name, 'results.db')
+        self.matrix = os.path.join(self.directory.name, 'matrix.npy')
+        save_distance_matrix(np.array([[0, 2, 3, 5], [2, 0, 4, 6], [3, 4, 0, 7], [5, 6, 7, 0]], dtype=float),
+                             self.matrix)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_grid_design(self):
+        """Сітка - декартів добуток значень у порядку PARAMS"""
+        grid = {'n_ants': [5, 10], 'decay': [0.5], 'alpha': [1, 2], 'beta': [2, 3, 4]}
+        configs = colony_sweep.grid_design(grid)
+        self.assertEqual(len(configs), 12)
+        self.assertEqual(configs[0], {'n_ants': 5, 'decay': 0.5, 'alpha': 1, 'beta': 2})
+        self.assertEqual(len({tuple(c.values()) for c in configs}), 12)
+
+    def test_random_and_lhs_bounds(self):
+        """Випадковий план і LHS не виходять за межі; n_ants - ціле"""
+        for design in (colony_sweep.random_design, colony_sweep.latin_hypercube_design):
+            configs = design(30, seed=1)
+            self.assertEqual(len(configs), 30)
+            for config in configs:
+                self.assertIsInstance(config['n_ants'], int)
+                for param, (low, high) in colony_sweep.DEFAULT_BOUNDS.items():
+                    self.assertTrue(low <= config[param] <= high, (param, config[param]))
+
+    def test_lhs_one_sample_per_stratum(self):
+        """У LHS кожен параметр має рівно одну точку в кожному з n інтервалів"""
+        n = 25
+        configs = colony_sweep.latin_hypercube_design(n, seed=3)
+        for param in ('decay', 'alpha', 'beta'):
+            low, high = colony_sweep.DEFAULT_BOUNDS[param]
+            strata = np.floor((np.array([c[param] for c in configs]) - low) / (high - low) * n).astype(int)
+            self.assertEqual(sorted(np.minimum(strata, n - 1)), list(range(n)))
+
+    def test_sweep_skips_recorded_runs_and_aggregates(self):
+        """Повторний запуск пропускає записані прогони; зведення - середні та довірчі інтервали"""
+        configs = colony_sweep.grid_design({'n_ants': [3], 'decay': [0.5], 'alpha': [1], 'beta': [1, 2]})
+        with contextlib.redirect_stdout(io.StringIO()):
+            skipped = colony_sweep.run_sweep(configs[:1], self.matrix, 'tiny', 3, repetitions=2, workers=1,
+                                             db_path=self.db)
+            self.assertEqual(skipped, 0)
+            skipped = colony_sweep.run_sweep(configs, self.matrix, 'tiny', 3, repetitions=2, workers=1,
+                                             db_path=self.db)
+            self.assertEqual(skipped, 2)
+
+        with sqlite3.connect(self.db) as conn:
+            rows = conn.execute('SELECT beta, path_length, runtime FROM sweep_results').fetchall()
+        self.assertEqual(len(rows), 4)
+
+        table = colony_sweep.aggregate('tiny', 3, self.db)
+        self.assertEqual(len(table), 2)
+        for row in table:
+            lengths = [length for beta, length, _ in rows if beta == row['beta']]
+            self.assertEqual(row['runs'], 2)
+            self.assertAlmostEqual(row['length_mean'], np.mean(lengths))
+            self.assertLessEqual(row['length_ci_low'], row['length_mean'])
+            self.assertGreaterEqual(row['length_ci_high'], row['length_mean'])
+            self.assertGreater(row['construct_time_mean'], 0)
+        self.assertEqual(colony_sweep.aggregate('other', 3, self.db), [])
+
+        with sqlite3.connect(self.db) as conn:
+            runs = conn.execute('SELECT run_id, COUNT(*) FROM iteration_stats GROUP BY run_id').fetchall()
+        self.assertEqual(len(runs), 4)
+        self.assertTrue(all(count == 3 and run.startswith('tiny/3/3/') for run, count in runs))
+
+    def test_old_schema_migration(self):
+        """База зі схемою без стовпця profile доповнюється, і нові прогони записуються"""
+        conn = sqlite3.connect(self.db)
+        conn.execute('''
+                CREATE TABLE sweep_results (
+                    instance TEXT, n_iterations INTEGER, n_ants INTEGER, decay REAL, alpha REAL, beta REAL,
+                    seed INTEGER, path_length REAL, runtime REAL, path TEXT,
+                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE (instance, n_iterations, n_ants, decay, alpha, beta, seed)
+                )''')
+        conn.execute("INSERT INTO sweep_results VALUES ('tiny', 3, 3, 0.5, 1, 1, 7, 18.0, 0.1, '[]', NULL)")
+        conn.commit()
+        conn.close()
+
+        configs = colony_sweep.grid_design({'n_ants': [3], 'decay': [0.5], 'alpha': [1], 'beta': [1]})
+        with contextlib.redirect_stdout(io.StringIO()):
+            colony_sweep.run_sweep(configs, self.matrix, 'tiny', 3, repetitions=1, workers=1, db_path=self.db)
+        table = colony_sweep.aggregate('tiny', 3, self.db)
+        self.assertEqual(table[0]['runs'], 2)
+
+    def test_profile_task(self):
+        """Режим профілювання одного прогону"""
+        report = colony_sweep.profile_task(self.matrix, 2, {'n_ants': 3, 'decay': 0.5, 'alpha': 1, 'beta': 1}, 0)
+        self.assertIn('_select_next_city', report)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import numpy as np
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+from model import EpidemicModel
+
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+def replica_seeds(seed: int, replicas: int) -> List[np.random.SeedSequence]:
+    """Незалежні зерна реалізацій; реалізація r отримує те саме зерно за будь-якого розбиття на задачі"""
+    return np.random.SeedSequence(seed).spawn(replicas)
+
+
+def run_replicas(params: Dict, steps: int, seeds: List[np.random.SeedSequence]) -> np.ndarray:
+    """
+    Реалізації з власними генераторами; кількості S, I, R пишуться в заздалегідь виділений масив
+
+    :return: масив (реалізації, steps + 1, 3)
+    """
+    counts = np.empty((len(seeds), steps + 1, 3), dtype=np.int64)
+    for replica, seed in enumerate(seeds):
+        model = EpidemicModel(rng=np.random.default_rng(seed), **params)
+        counts[replica, 0] = model.get_counts()
+        for step in range(1, steps + 1):
+            model.update()
+            counts[replica, step] = model.get_counts()
+    return counts
+
+
+def run_ensemble(steps: int = 100, replicas: int = 100, seed: int = 0, workers: int = None,
+                 quantiles: Tuple[float, ...] = QUANTILES, **params) -> Dict[str, np.ndarray]:
+    """
+    Ансамбль реалізацій моделі з однаковими параметрами
+
+    Реалізації розподіляються по пулу процесів (workers=1 - у поточному процесі).
+
+    :param params: параметри EpidemicModel (size, p_infect, t_recover, initial_infected)
+    :return: словник: counts (реалізації, крок, S/I/R), mean і bands (квантилі x крок x S/I/R),
+             peak_time і peak_size - момент і розмір піку інфікованих у кожній реалізації
+    """
+    seeds = replica_seeds(seed, replicas)
+    if workers == 1:
+        counts = run_replicas(params, steps, seeds)
+    else:
+        # Кілька задач на процес вирівнюють навантаження; межі задач не впливають на результат
+        n_tasks = max(1, min(replicas, 4 * (workers or os.cpu_count() or 1)))
+        bounds = np.linspace(0, replicas, n_tasks + 1).astype(int)
+        chunks = [seeds[begin:end] for begin, end in zip(bounds[:-1], bounds[1:])]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            counts = np.concatenate(list(pool.map(run_replicas, [params] * n_tasks, [steps] * n_tasks, chunks)))
+    return summarize_ensemble(counts, quantiles)
+
+
+def summarize_ensemble(counts: np.ndarray, quantiles: Tuple[float, ...] = QUANTILES) -> Dict[str, np.ndarray]:
+    """Середнє, квантильні смуги та розподіли часу й розміру піку інфікованих"""
+    infected = counts[:, :, 1]
+    return {
+        'counts': counts,
+        'mean': counts.mean(axis=0),
+        'quantiles': np.array(quantiles),
+        'bands': np.quantile(counts, quantiles, axis=0),
+        'peak_time': infected.argmax(axis=1),
+        'peak_size': infected.max(axis=1),
+    }
+
+
+def plot_ensemble(result: Dict[str, np.ndarray], path: str = None):
+    """Середні криві S, I, R зі смугами між крайніми квантилями"""
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(10, 5))
+    steps = np.arange(result['mean'].shape[0])
+    bands = result['bands']
+    for k, (label, color) in enumerate((('Здорові (S)', '#2ecc71'), ('Інфіковані (I)', '#e74c3c'),
+                                        ('Одужавші (R)', '#95a5a6'))):
+        ax.fill_between(steps, bands[0, :, k], bands[-1, :, k], color=color, alpha=0.25)
+        ax.plot(steps, result['mean'][:, k], color=color, linewidth=2, label=label)
+    ax.set_xlabel('Час (кроки)')
+    ax.set_ylabel('Кількість клітин')
+    ax.set_title(f"Ансамбль з {len(result['counts'])} реалізацій "
+                 f"(смуга {result['quantiles'][0]:.0%}-{result['quantiles'][-1]:.0%})")
+    ax.grid(True, linestyle='--', alpha=0.6)
+    ax.legend(loc='upper right')
+    if path:
+        fig.savefig(path, dpi=100)
+        plt.close(fig)
+    else:
+        plt.show()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ансамбль реалізацій SIR клітинного автомата")
+    parser.add_argument('--replicas', type=int, default=100)
+    parser.add_argument('--steps', type=int, default=50)
+    parser.add_argument('--size', type=int, default=30)
+    parser.add_argument('--p-infect', type=float, default=0.4)
+    parser.add_argument('--t-recover', type=int, default=6)
+    parser.add_argument('--initial-infected', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--plot', default=None, help="файл для графіка (без нього - вікно)")
+    args = parser.parse_args()
+
+    result = run_ensemble(args.steps, args.replicas, args.seed, args.workers, size=args.size,
+                          p_infect=args.p_infect, t_recover=args.t_recover,
+                          initial_infected=args.initial_infected)
+    peak_time, peak_size = result['peak_time'], result['peak_size']
+    print(f"Пік інфікованих: крок {np.median(peak_time):.0f} "
+          f"[{np.quantile(peak_time, 0.05):.0f}; {np.quantile(peak_time, 0.95):.0f}], "
+          f"розмір {peak_size.mean():.1f} [{np.quantile(peak_size, 0.05):.0f}; {np.quantile(peak_size, 0.95):.0f}]")
+    print(f"Одужавші наприкінці: {result['mean'][-1, 2]:.1f} з {args.size ** 2}")
+    plot_ensemble(result, args.plot)
@@ -0,0 +1,88 @@
+import numpy as np
+
+from model import SUSCEPTIBLE, INFECTED, RECOVERED
+
+# Зсуви околу Мура (рядок, стовпець)
+NEIGHBOR_OFFSETS = [(i, j) for i in (-1, 0, 1) for j in (-1, 0, 1) if i or j]
+
+
+class FrontierEpidemicModel:
+    """
+    Та сама модель, що й EpidemicModel, але оновлюються лише інфіковані клітини та їхні сусіди
+
+    Інфіковані клітини зберігаються масивами лінійних індексів (рядок * size + стовпець) і таймерів,
+    а всі коли-небудь інфіковані - бітовою картою (біт на клітину; сторінки пам'яті виділяються лише
+    під зачеплену область). Тож крок коштує O(кількості інфікованих), а не O(size²).
+    """
+
+    def __init__(self, size=50, p_infect=0.3, t_recover=5, initial_infected=5, rng=None):
+        """
+        :param rng: np.random.Generator реалізації; за замовчуванням - глобальний np.random
+        """
+        self.size = size
+        self.p_infect = p_infect
+        self.t_recover = t_recover
+        self.rng = np.random if rng is None else rng
+        self.visited = np.zeros((size * size + 7) // 8, dtype=np.uint8)
+        self.n_visited = 0
+        self.infected = np.zeros(0, dtype=np.int64)
+        self.timers = np.zeros(0, dtype=np.min_scalar_type(max(int(np.ceil(t_recover)), 1)))
+
+        # Ті самі випадкові числа, що й у EpidemicModel, дають ті самі початкові клітини
+        integers = getattr(self.rng, 'integers', None) or self.rng.randint
+        cells = [int(x) * size + int(y) for x, y in (integers(0, size, 2) for _ in range(initial_infected))]
+        self.infected = np.unique(np.array(cells, dtype=np.int64))
+        self.timers = np.ones(len(self.infected), dtype=self.timers.dtype)
+        self._mark_visited(self.infected)
+
+    def _is_visited(self, cells: np.ndarray) -> np.ndarray:
+        return ((self.visited[cells >> 3] >> (cells & 7).astype(np.uint8)) & 1).astype(bool)
+
+    def _mark_visited(self, cells: np.ndarray):
+        np.bitwise_or.at(self.visited, cells >> 3, (1 << (cells & 7)).astype(np.uint8))
+        self.n_visited += len(cells)
+
+    def infected_neighbors(self):
+        """
+        Клітини з хоча б одним інфікованим сусідом і кількість таких сусідів
+
+        :return: (відсортовані лінійні індекси, кількості)
+        """
+        rows, cols = np.divmod(self.infected, self.size)
+        candidates = []
+        for i, j in NEIGHBOR_OFFSETS:
+            nx, ny = rows + i, cols + j
+            inside = (nx >= 0) & (nx < self.size) & (ny >= 0) & (ny < self.size)
+            candidates.append(nx[inside] * self.size + ny[inside])
+        return np.unique(np.concatenate(candidates), return_counts=True)
+
+    def update(self):
+        cells, neighbors = self.infected_neighbors()
+        susceptible = ~self._is_visited(cells)
+        cells, neighbors = cells[susceptible], neighbors[susceptible]
+        # Випадкове число лише для здорових клітин фронту
+        new_infected = cells[self.rng.random(len(cells)) < self.p_infect * neighbors / 8]
+
+        staying = self.timers < self.t_recover
+        self.infected = np.concatenate([self.infected[staying], new_infected])
+        self.timers = np.concatenate([self.timers[staying] + 1,
+                                      np.ones(len(new_infected), dtype=self.timers.dtype)])
+        self._mark_visited(new_infected)
+
+    def get_counts(self):
+        i = len(self.infected)
+        return self.size * self.size - self.n_visited, i, self.n_visited - i
+
+    @property
+    def grid(self) -> np.ndarray:
+        """Щільна матриця станів (для візуалізації та порівняння; O(size²) пам'яті)"""
+        cells = np.arange(self.size * self.size, dtype=np.int64)
+        grid = np.where(self._is_visited(cells), RECOVERED, SUSCEPTIBLE).astype(np.uint8)
+        grid[self.infected] = INFECTED
+        return grid.reshape(self.size, self.size)
+
+    @property
+    def time_infected(self) -> np.ndarray:
+        time_infected = np.zeros(self.size * self.size, dtype=self.timers.dtype)
+        time_infected[self.infected] = self.timers
+        return time_infected.reshape(self.size, self.size)
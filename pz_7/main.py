@@ -4,62 +4,8 @@ from matplotlib.animation import FuncAnimation
 from matplotlib.colors import ListedColormap
 import matplotlib.patches as mpatches
 
-SUSCEPTIBLE = 0
-INFECTED = 1
-RECOVERED = 2
+from model import EpidemicModel, SUSCEPTIBLE, INFECTED, RECOVERED
 
-class EpidemicModel:
-    def __init__(self, size=50, p_infect=0.3, t_recover=5, initial_infected=5):
-        self.size = size
-        self.p_infect = p_infect
-        self.t_recover = t_recover
-        self.grid = np.zeros((size, size), dtype=int)
-        self.time_infected = np.zeros((size, size), dtype=int)
-        
-        for _ in range(initial_infected):
-            x, y = np.random.randint(0, size, 2)
-            self.grid[x, y] = INFECTED
-            self.time_infected[x, y] = 1
-    
-    def count_neighbors(self, x, y):
-        infected = 0
-        for i in range(-1, 2):
-            for j in range(-1, 2):
-                if i == 0 and j == 0:
-                    continue
-                nx, ny = x + i, y + j
-                if 0 <= nx < self.size and 0 <= ny < self.size:
-                    if self.grid[nx, ny] == INFECTED:
-                        infected += 1
-        return infected
-    
-    def update(self):
-        new_grid = self.grid.copy()
-        new_time = self.time_infected.copy()
-        
-        for x in range(self.size):
-            for y in range(self.size):
-                if self.grid[x, y] == SUSCEPTIBLE:
-                    infected_neighbors = self.count_neighbors(x, y)
-                    if infected_neighbors > 0 and np.random.random() < self.p_infect * infected_neighbors / 8:
-                        new_grid[x, y] = INFECTED
-                        new_time[x, y] = 1
-                
-                elif self.grid[x, y] == INFECTED:
-                    if self.time_infected[x, y] >= self.t_recover:
-                        new_grid[x, y] = RECOVERED
-                        new_time[x, y] = 0
-                    else:
-                        new_time[x, y] += 1
-        
-        self.grid = new_grid
-        self.time_infected = new_time
-    
-    def get_counts(self):
-        s = np.sum(self.grid == SUSCEPTIBLE)
-        i = np.sum(self.grid == INFECTED)
-        r = np.sum(self.grid == RECOVERED)
-        return s, i, r
 
 def visual(model, steps=100):
     plt.style.use('default')
@@ -90,8 +36,9 @@ def visual(model, steps=100):
     ax1.legend(handles=[susceptible_patch, infected_patch, recovered_patch], 
                loc='upper right', bbox_to_anchor=(1.35, 1))
     
+    total = sum(model.get_counts())
     ax2.set_xlim(0, steps)
-    ax2.set_ylim(0, model.size**2)
+    ax2.set_ylim(0, total)
     ax2.set_xlabel('Час (кроки)', fontsize=10)
     ax2.set_ylabel('Кількість клітин', fontsize=10)
     ax2.set_title('Динаміка епідемії', pad=20)
@@ -122,9 +69,9 @@ def visual(model, steps=100):
         
         info_text.set_text(
             f"Поточний стан:\n"
-            f"Здорові: {s} ({s/model.size**2:.1%})\n"
-            f"Інфіковані: {i} ({i/model.size**2:.1%})\n"
-            f"Одужавші: {r} ({r/model.size**2:.1%})\n\n"
+            f"Здорові: {s} ({s/total:.1%})\n"
+            f"Інфіковані: {i} ({i/total:.1%})\n"
+            f"Одужавші: {r} ({r/total:.1%})\n\n"
             f"Параметри моделі:\n"
             f"Ймовірність інфікування: {model.p_infect}\n"
             f"Час одужання: {model.t_recover} кроків"
@@ -148,9 +95,9 @@ def visual(model, steps=100):
         
         info_text.set_text(
             f"Поточний стан (крок {frame+1}):\n"
-            f"Здорові: {s} ({s/model.size**2:.1%})\n"
-            f"Інфіковані: {i} ({i/model.size**2:.1%})\n"
-            f"Одужавші: {r} ({r/model.size**2:.1%})\n\n"
+            f"Здорові: {s} ({s/total:.1%})\n"
+            f"Інфіковані: {i} ({i/total:.1%})\n"
+            f"Одужавші: {r} ({r/total:.1%})\n\n"
             f"Параметри моделі:\n"
             f"Ймовірність інфікування: {model.p_infect}\n"
             f"Час одужання: {model.t_recover} кроків"
@@ -170,8 +117,9 @@ def visual(model, steps=100):
     
     return ani
 
-model = EpidemicModel(p_infect=0.4, t_recover=6, size=30)
-visual(model, steps=50)
+if __name__ == "__main__":
+    model = EpidemicModel(p_infect=0.4, t_recover=6, size=30)
+    visual(model, steps=50)
 
-model = EpidemicModel(p_infect=0.2, t_recover=12, size=30)
-visual(model, steps=50)
+    model = EpidemicModel(p_infect=0.2, t_recover=12, size=30)
+    visual(model, steps=50)
@@ -0,0 +1,128 @@
+import numpy as np
+
+SUSCEPTIBLE = 0
+INFECTED = 1
+RECOVERED = 2
+
+
+def neighbor_counts(grid, r0, r1, c0, c1):
+    """Кількість інфікованих сусідів клітин блоку grid[r0:r1, c0:c1] (сума зсунутих зрізів; за межами сітки - здорові)"""
+    n_rows, n_cols = grid.shape
+    low_r, high_r = max(r0 - 1, 0), min(r1 + 1, n_rows)
+    low_c, high_c = max(c0 - 1, 0), min(c1 + 1, n_cols)
+    infected = np.zeros((r1 - r0 + 2, c1 - c0 + 2), dtype=np.uint8)
+    np.equal(grid[low_r:high_r, low_c:high_c], INFECTED, casting='unsafe',
+             out=infected[low_r - r0 + 1:high_r - r0 + 1, low_c - c0 + 1:high_c - c0 + 1])
+    
+    counts = np.zeros((r1 - r0, c1 - c0), dtype=np.uint8)
+    for i in range(3):
+        for j in range(3):
+            if i == 1 and j == 1:
+                continue
+            counts += infected[i:i + r1 - r0, j:j + c1 - c0]
+    return counts
+
+
+def transition(state, timer, neighbors, random, p_infect, t_recover, next_state, next_timer, norm=8):
+    """
+    Правила переходу для блоку клітин; новий стан і таймери записуються в next_state, next_timer
+
+    Маски будуються до першого запису, тож next_timer може бути самим timer (оновлення на місці).
+
+    :param norm: нормування тиску інфікованих сусідів (8 - розмір околу Мура; для мережі - степінь вузла)
+    """
+    next_state[...] = state
+    next_timer[...] = timer
+    
+    infected = state == INFECTED
+    recovering = infected & (timer >= t_recover)
+    new_infected = (state == SUSCEPTIBLE) & (neighbors > 0) & (random < p_infect * neighbors / norm)
+    
+    np.add(next_timer, 1, out=next_timer, where=infected)
+    next_state[recovering] = RECOVERED
+    next_timer[recovering] = 0
+    next_state[new_infected] = INFECTED
+    next_timer[new_infected] = 1
+
+
+class EpidemicModel:
+    # Клітин в одному блоці рядків: тимчасові масиви кроку не залежать від розміру сітки
+    BLOCK_CELLS = 1 << 20
+    
+    def __init__(self, size=50, p_infect=0.3, t_recover=5, initial_infected=5, rng=None):
+        """
+        :param rng: np.random.Generator реалізації; за замовчуванням - глобальний np.random
+        """
+        self.size = size
+        self.p_infect = p_infect
+        self.t_recover = t_recover
+        self.rng = np.random if rng is None else rng
+        # Стан - 1 байт на клітину, лічильник часу - найменший беззнаковий цілий тип, що вміщує t_recover
+        time_dtype = np.min_scalar_type(max(int(np.ceil(t_recover)), 1))
+        self.grid = np.zeros((size, size), dtype=np.uint8)
+        self.time_infected = np.zeros((size, size), dtype=time_dtype)
+        # Буфер стану наступного кроку (після update міняється місцями з поточним); сусіди рахуються
+        # за старим станом, тож він потрібен. Таймер залежить лише від власної клітини й оновлюється на місці
+        self._next_grid = np.empty_like(self.grid)
+        
+        integers = getattr(self.rng, 'integers', None) or self.rng.randint
+        for _ in range(initial_infected):
+            x, y = integers(0, size, 2)
+            self.grid[x, y] = INFECTED
+            self.time_infected[x, y] = 1
+    
+    def count_neighbors(self, x, y):
+        infected = 0
+        for i in range(-1, 2):
+            for j in range(-1, 2):
+                if i == 0 and j == 0:
+                    continue
+                nx, ny = x + i, y + j
+                if 0 <= nx < self.size and 0 <= ny < self.size:
+                    if self.grid[nx, ny] == INFECTED:
+                        infected += 1
+        return infected
+    
+    def count_infected_neighbors(self, begin=0, end=None):
+        """Кількість інфікованих сусідів клітин рядків [begin, end)"""
+        return neighbor_counts(self.grid, begin, self.size if end is None else end, 0, self.size)
+    
+    def update(self):
+        if self._next_grid.shape != self.grid.shape:
+            self._next_grid = np.empty_like(self.grid)
+        grid, time_infected, new_grid = self.grid, self.time_infected, self._next_grid
+        
+        rows = max(1, self.BLOCK_CELLS // self.size)
+        for begin in range(0, self.size, rows):
+            end = min(begin + rows, self.size)
+            state = grid[begin:end]
+            # Одне випадкове число на клітину за крок (блоки рядків читають потік генератора по порядку)
+            transition(state, time_infected[begin:end], self.count_infected_neighbors(begin, end),
+                       self.rng.random(state.shape), self.p_infect, self.t_recover,
+                       new_grid[begin:end], time_infected[begin:end])
+        
+        self.grid, self._next_grid = new_grid, grid
+    
+    def get_counts(self):
+        """Кількості S, I, R за один прохід bincount (блоками рядків)"""
+        rows = max(1, self.BLOCK_CELLS // self.size)
+        counts = np.zeros(3, dtype=np.int64)
+        for begin in range(0, self.size, rows):
+            counts += np.bincount(self.grid[begin:begin + rows].ravel(), minlength=3)[:3]
+        s, i, r = (int(count) for count in counts)
+        return s, i, r
+
+
+def simulate(model, steps, snapshots=False, every=1):
+    """
+    Покрокова симуляція без графіки
+
+    Генерує (крок, (S, I, R), стан) для кроку 0 і кожного наступного кроку; стан - копія
+    model.grid кожні every кроків при snapshots=True, інакше None.
+    """
+    for step in range(steps + 1):
+        if step:
+            model.update()
+        grid = model.grid.copy() if snapshots and step % every == 0 else None
+        yield step, model.get_counts(), grid
+
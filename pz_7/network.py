@@ -0,0 +1,198 @@
+import numpy as np
+import argparse
+import time
+from typing import Tuple
+
+from model import INFECTED, transition
+
+
+def csr_from_edges(edges: np.ndarray, n_nodes: int = None, weights: np.ndarray = None,
+                   directed: bool = False, block: int = 1 << 22) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    CSR-матриця контактів зі списку ребер (E, 2)
+
+    Рядок u містить вузли, яких u може інфікувати; неорієнтоване ребро записується в обидва рядки.
+    Повторні ребра не об'єднуються: кожне дає окремий запис (і окрему вагу).
+
+    Побудова підрахунком: степені -> зсуви рядків -> розкладання ребер блоками по block.
+    Окрім результату, пам'ять займають лише масив позицій заповнення (n_nodes) і тимчасові
+    масиви одного блоку, тож список ребер може бути відображеним у пам'ять файлом.
+
+    :return: (indptr, indices, weights або None)
+    """
+    edges = np.asarray(edges).reshape(-1, 2)
+    if n_nodes is None:
+        n_nodes = int(edges.max()) + 1 if len(edges) else 0
+    index_dtype = np.int32 if n_nodes < 2 ** 31 else np.int64
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float32)
+    # Напрямки запису: (стовпець джерела, стовпець цілі)
+    directions = [(0, 1)] if directed else [(0, 1), (1, 0)]
+
+    degree = np.zeros(n_nodes, dtype=np.int64)
+    for source, _ in directions:
+        for begin in range(0, len(edges), block):
+            degree += np.bincount(edges[begin:begin + block, source], minlength=n_nodes)
+    indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+    np.cumsum(degree, out=indptr[1:])
+    del degree
+
+    indices = np.empty(indptr[-1], dtype=index_dtype)
+    values = None if weights is None else np.empty(indptr[-1], dtype=np.float32)
+    fill = indptr[:-1].copy()  # Наступна вільна позиція кожного рядка
+    for source, target in directions:
+        for begin in range(0, len(edges), block):
+            sources = edges[begin:begin + block, source].astype(np.int64)
+            order = np.argsort(sources, kind='stable')
+            sources = sources[order]
+            # Номер ребра серед ребер того самого джерела в блоці
+            first = np.flatnonzero(np.r_[True, sources[1:] != sources[:-1]])
+            rank = np.arange(len(sources)) - np.repeat(first, np.diff(np.r_[first, len(sources)]))
+            positions = fill[sources] + rank
+            indices[positions] = edges[begin:begin + block, target][order]
+            if values is not None:
+                values[positions] = weights[begin:begin + block][order]
+            fill += np.bincount(sources, minlength=n_nodes)
+    return indptr, indices, values
+
+
+class NetworkEpidemicModel:
+    """
+    Модель SIR на мережі контактів у форматі CSR (ті самі стани, таймери та правила, що й у EpidemicModel)
+
+    Тиск на вузол - кількість (або сума ваг) інфікованих сусідів, нормована на степінь вузла
+    (на решітці це відповідає діленню на 8). Тиск рахується добутком розрідженої матриці на
+    розріджений вектор інфікованих: переглядаються лише рядки інфікованих вузлів.
+    """
+    # Вузлів в одному блоці переходу: тимчасові масиви не залежать від розміру мережі
+    BLOCK_NODES = 1 << 20
+
+    def __init__(self, edges: np.ndarray, n_nodes: int = None, p_infect=0.3, t_recover=5, initial_infected=5,
+                 weights: np.ndarray = None, directed: bool = False, normalization='degree', rng=None):
+        """
+        :param edges: список ребер (E, 2) або готова CSR-трійка (indptr, indices, weights)
+        :param normalization: 'degree' - ділення на (зважений) степінь вузла, число - на цю сталу
+        :param rng: np.random.Generator реалізації; за замовчуванням - глобальний np.random
+        """
+        if isinstance(edges, tuple):
+            self.indptr, self.indices, self.weights = edges
+        else:
+            self.indptr, self.indices, self.weights = csr_from_edges(edges, n_nodes, weights, directed)
+        self.n_nodes = len(self.indptr) - 1
+        self.size = int(np.ceil(np.sqrt(self.n_nodes)))  # Сторона квадрата для відображення
+        self.p_infect = p_infect
+        self.t_recover = t_recover
+        self.rng = np.random if rng is None else rng
+
+        if normalization == 'degree':
+            # Тиск на вузол v - від його вхідних ребер; для неорієнтованої мережі це степінь v
+            if self.weights is None and not directed:
+                degree = np.diff(self.indptr)
+            else:
+                # Блоками: bincount приводить int32-індекси до intp, копія всіх ребер не потрібна
+                degree = np.zeros(self.n_nodes)
+                for begin in range(0, len(self.indices), self.BLOCK_NODES):
+                    end = begin + self.BLOCK_NODES
+                    degree += np.bincount(self.indices[begin:end], minlength=self.n_nodes,
+                                          weights=None if self.weights is None else self.weights[begin:end])
+            self.norm = np.maximum(degree, 1e-12).astype(np.float32)
+        else:
+            self.norm = float(normalization)
+
+        self.states = np.zeros(self.n_nodes, dtype=np.uint8)
+        self.timers = np.zeros(self.n_nodes, dtype=np.min_scalar_type(max(int(np.ceil(t_recover)), 1)))
+        self._next_states = np.empty_like(self.states)
+        self._next_timers = np.empty_like(self.timers)
+
+        integers = getattr(self.rng, 'integers', None) or self.rng.randint
+        for _ in range(initial_infected):
+            node = integers(0, self.n_nodes)
+            self.states[node] = INFECTED
+            self.timers[node] = 1
+
+    def infection_pressure(self) -> np.ndarray:
+        """Кількість (сума ваг) інфікованих сусідів кожного вузла: A^T x для індикатора інфікованих x"""
+        infected = np.flatnonzero(self.states == INFECTED)
+        starts = self.indptr[infected]
+        lengths = self.indptr[infected + 1] - starts
+        # Позиції ребер усіх рядків інфікованих вузлів одним масивом
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        positions = offsets + np.arange(len(offsets))
+        weights = None if self.weights is None else self.weights[positions]
+        return np.bincount(self.indices[positions], weights=weights, minlength=self.n_nodes)
+
+    def update(self):
+        pressure = self.infection_pressure()
+        states, timers = self.states, self.timers
+        for begin in range(0, self.n_nodes, self.BLOCK_NODES):
+            end = min(begin + self.BLOCK_NODES, self.n_nodes)
+            norm = self.norm[begin:end] if isinstance(self.norm, np.ndarray) else self.norm
+            transition(states[begin:end], timers[begin:end], pressure[begin:end],
+                       self.rng.random(end - begin), self.p_infect, self.t_recover,
+                       self._next_states[begin:end], self._next_timers[begin:end], norm)
+        self.states, self._next_states = self._next_states, states
+        self.timers, self._next_timers = self._next_timers, timers
+
+    def get_counts(self):
+        s, i, r = (int(count) for count in np.bincount(self.states, minlength=3)[:3])
+        return s, i, r
+
+    @property
+    def grid(self) -> np.ndarray:
+        """Стани вузлів, укладені в квадрат size x size для visual(); зайві клітини замасковані"""
+        padded = np.zeros(self.size * self.size, dtype=np.uint8)
+        padded[:self.n_nodes] = self.states
+        mask = np.arange(self.size * self.size) >= self.n_nodes
+        return np.ma.masked_array(padded, mask).reshape(self.size, self.size)
+
+
+def scale_free_edges(n_nodes: int, m: int = 3, gamma: float = 2.5, rng: np.random.Generator = None) -> np.ndarray:
+    """
+    Мережа з важкохвостим розподілом степенів (модель конфігурацій, P(k) ~ k^-gamma)
+
+    Петлі та повторні ребра відкидаються, тож кожен контакт має одиничну вагу.
+
+    :param m: мінімальний степінь вузла
+    :return: ребра (E, 2), u < v, без повторів
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    degree = np.minimum(np.floor(m * (1 - rng.random(n_nodes)) ** (-1 / (gamma - 1))), n_nodes - 1).astype(np.int64)
+    stubs = np.repeat(np.arange(n_nodes, dtype=np.int64), degree)
+    rng.shuffle(stubs)
+    stubs = stubs[:len(stubs) // 2 * 2].reshape(-1, 2)
+    stubs = stubs[stubs[:, 0] != stubs[:, 1]]
+    # Унікальні неорієнтовані пари через ключ min * n + max
+    keys = np.unique(np.minimum(stubs[:, 0], stubs[:, 1]) * n_nodes + np.maximum(stubs[:, 0], stubs[:, 1]))
+    return np.column_stack(np.divmod(keys, n_nodes))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SIR модель на мережі контактів")
+    parser.add_argument('--edges', default=None, help="файл .npy з ребрами (E, 2); без нього - випадкова мережа")
+    parser.add_argument('--nodes', type=int, default=100000)
+    parser.add_argument('--p-infect', type=float, default=0.4)
+    parser.add_argument('--t-recover', type=int, default=6)
+    parser.add_argument('--initial-infected', type=int, default=10)
+    parser.add_argument('--steps', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--visual', action='store_true', help="анімація через visual() з main.py")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    edges = np.load(args.edges, mmap_mode='r') if args.edges else scale_free_edges(args.nodes, rng=rng)
+    start = time.perf_counter()
+    model = NetworkEpidemicModel(edges, None if args.edges else args.nodes, args.p_infect, args.t_recover,
+                                 args.initial_infected, rng=rng)
+    print(f"Мережа: {model.n_nodes} вузлів, {len(model.indices)} записів CSR, "
+          f"побудова {time.perf_counter() - start:.2f} с")
+
+    if args.visual:
+        from main import visual
+        visual(model, args.steps)
+    else:
+        start = time.perf_counter()
+        for step in range(1, args.steps + 1):
+            model.update()
+        s, i, r = model.get_counts()
+        print(f"Крок {args.steps}: здорові {s}, інфіковані {i}, одужавші {r}; "
+              f"{(time.perf_counter() - start) / args.steps:.3f} с на крок")
@@ -0,0 +1,158 @@
+import numpy as np
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+from typing import Callable, Iterable, Iterator, Tuple
+
+from model import EpidemicModel, simulate
+
+# Кольори станів S, I, R - ті самі, що й у visual()
+COLORS = np.array([[0x2e, 0xcc, 0x71], [0xe7, 0x4c, 0x3c], [0x95, 0xa5, 0xa6]], dtype=np.uint8)
+
+
+class FrameStore:
+    """
+    Кадри симуляції у каталозі пачками: chunk_00000.npz, chunk_00001.npz, ...
+
+    Кожна пачка - стиснений NPZ з номерами кроків (steps) і станами (frames) до chunk_frames кадрів.
+    Кількості S, I, R для всіх кроків і параметри запису зберігаються при close().
+    Пачки попереднього запису в цьому каталозі видаляються.
+    """
+
+    def __init__(self, directory: str, chunk_frames: int = 64, on_chunk: Callable[[str], None] = None):
+        self.directory = directory
+        self.chunk_frames = chunk_frames
+        self.on_chunk = on_chunk
+        self.n_chunks = 0
+        self.steps = []
+        self.frames = []
+        self.counts = []
+        os.makedirs(directory, exist_ok=True)
+        for path in chunk_paths(directory):
+            os.remove(path)
+
+    def append(self, step: int, counts: Tuple[int, int, int], grid: np.ndarray = None):
+        self.counts.append(counts)
+        if grid is None:
+            return
+        self.steps.append(step)
+        self.frames.append(grid)
+        if len(self.frames) >= self.chunk_frames:
+            self.flush()
+
+    def flush(self):
+        """Запис накопичених кадрів у наступну пачку"""
+        if not self.frames:
+            return
+        path = os.path.join(self.directory, f'chunk_{self.n_chunks:05d}.npz')
+        np.savez_compressed(path, steps=np.array(self.steps), frames=np.stack(self.frames))
+        self.n_chunks += 1
+        self.steps, self.frames = [], []
+        if self.on_chunk is not None:
+            self.on_chunk(path)
+
+    def close(self, meta: dict = None):
+        self.flush()
+        np.save(os.path.join(self.directory, 'counts.npy'), np.array(self.counts, dtype=np.int64).reshape(-1, 3))
+        with open(os.path.join(self.directory, 'meta.json'), 'w') as f:
+            json.dump({**(meta or {}), 'chunks': self.n_chunks, 'chunk_frames': self.chunk_frames}, f, indent=2)
+
+
+def chunk_paths(directory: str) -> list:
+    return sorted(glob.glob(os.path.join(directory, 'chunk_*.npz')))
+
+
+def load_frames(directory: str) -> Iterator[Tuple[int, np.ndarray]]:
+    """Кадри записаного каталогу по черзі: (крок, стан)"""
+    for path in chunk_paths(directory):
+        with np.load(path) as chunk:
+            yield from zip(chunk['steps'].tolist(), chunk['frames'])
+
+
+def render_gif(chunks: Iterable[str], path: str, scale: int = 4, duration: int = 100):
+    """
+    Анімований GIF з пачок кадрів (кожна клітина - квадрат scale x scale пікселів)
+
+    Кадри кодуються і дописуються у файл по одному, тож пам'ять не залежить від довжини запису.
+    """
+    from PIL import GifImagePlugin, Image
+
+    palette = COLORS.ravel().tolist()
+    f = None
+    try:
+        for chunk_path in chunks:
+            with np.load(chunk_path) as chunk:
+                for frame in chunk['frames']:
+                    image = Image.fromarray(np.ascontiguousarray(frame, dtype=np.uint8), mode='P')
+                    image.putpalette(palette)
+                    image = image.resize((frame.shape[1] * scale, frame.shape[0] * scale), Image.NEAREST)
+                    if f is None:
+                        f = open(path, 'wb')
+                        header, _ = GifImagePlugin.getheader(image, bytes(palette),
+                                                             {'loop': 0, 'duration': duration, 'optimize': False})
+                        f.writelines(header)
+                    f.writelines(GifImagePlugin.getdata(image, duration=duration))
+        if f is not None:
+            f.write(b';')  # Кінець файлу GIF
+    finally:
+        if f is not None:
+            f.close()
+
+
+def _gif_worker(queue: multiprocessing.Queue, path: str, scale: int, duration: int):
+    """Процес-рендерер: отримує шляхи пачок з черги до None"""
+    render_gif(iter(queue.get, None), path, scale, duration)
+
+
+def record(model: EpidemicModel, steps: int, directory: str, every: int = 1, chunk_frames: int = 64,
+           gif: str = None, scale: int = 4, duration: int = 100) -> np.ndarray:
+    """
+    Симуляція із записом кадрів кожні every кроків у FrameStore
+
+    GIF (якщо задано gif) малює окремий процес з уже записаних пачок,
+    тож швидкість симуляції не залежить від рендерингу.
+
+    :return: кількості S, I, R для кожного кроку (steps + 1, 3)
+    """
+    queue, renderer = None, None
+    if gif:
+        queue = multiprocessing.Queue()
+        renderer = multiprocessing.Process(target=_gif_worker, args=(queue, gif, scale, duration))
+        renderer.start()
+
+    store = FrameStore(directory, chunk_frames, on_chunk=queue.put if queue is not None else None)
+    try:
+        for step, counts, grid in simulate(model, steps, snapshots=True, every=every):
+            store.append(step, counts, grid)
+        store.close({'size': model.size, 'p_infect': model.p_infect, 't_recover': model.t_recover,
+                     'steps': steps, 'every': every})
+    finally:
+        if renderer is not None:
+            queue.put(None)
+            renderer.join()
+    return np.load(os.path.join(directory, 'counts.npy'))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Запис симуляції епідемії без інтерактивної графіки")
+    parser.add_argument('--size', type=int, default=100)
+    parser.add_argument('--p-infect', type=float, default=0.4)
+    parser.add_argument('--t-recover', type=int, default=6)
+    parser.add_argument('--initial-infected', type=int, default=5)
+    parser.add_argument('--steps', type=int, default=100)
+    parser.add_argument('--every', type=int, default=1, help="записувати кожен every-й крок")
+    parser.add_argument('--chunk-frames', type=int, default=64)
+    parser.add_argument('--out', default='frames', help="каталог для пачок кадрів")
+    parser.add_argument('--gif', default=None, help="файл анімації GIF")
+    parser.add_argument('--scale', type=int, default=4)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    model = EpidemicModel(args.size, args.p_infect, args.t_recover, args.initial_infected,
+                          rng=np.random.default_rng(args.seed))
+    counts = record(model, args.steps, args.out, args.every, args.chunk_frames, args.gif, args.scale)
+    s, i, r = counts[-1]
+    print(f"Крок {args.steps}: здорові {s}, інфіковані {i}, одужавші {r}; пік інфікованих {counts[:, 1].max()} "
+          f"на кроці {counts[:, 1].argmax()}")
@@ -0,0 +1,202 @@
+import numpy as np
+import argparse
+import itertools
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List
+
+from model import EpidemicModel
+
+DEFAULT_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'epidemic_sweep.db')
+PARAMS = ('size', 'p_infect', 't_recover', 'initial_infected')
+METRICS = ('attack_rate', 'peak_infected', 'peak_time')
+
+DEFAULT_GRID = {
+    'size': [50],
+    'p_infect': [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8],
+    't_recover': [2, 4, 6, 8, 10, 12],
+    'initial_infected': [5],
+}
+
+
+def grid_design(grid: Dict[str, List[float]] = DEFAULT_GRID) -> List[Dict[str, float]]:
+    """Повний перебір значень параметрів"""
+    return [dict(zip(PARAMS, values)) for values in itertools.product(*(grid[p] for p in PARAMS))]
+
+
+def init_db(db_path: str) -> sqlite3.Connection:
+    """Таблиця результатів: один рядок на (параметри, кількість кроків, зерно)"""
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+            CREATE TABLE IF NOT EXISTS epidemic_sweep (
+                size INTEGER,
+                p_infect REAL,
+                t_recover INTEGER,
+                initial_infected INTEGER,
+                steps INTEGER,
+                seed INTEGER,
+                attack_rate REAL,
+                peak_infected INTEGER,
+                peak_time INTEGER,
+                runtime REAL,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (size, p_infect, t_recover, initial_infected, steps, seed)
+            )''')
+    conn.commit()
+    return conn
+
+
+def task_seed(base_seed: int, repetition: int) -> int:
+    """Зерно повторення; однакове для всіх конфігурацій (спільні випадкові числа)"""
+    return int(np.random.SeedSequence([base_seed, repetition]).generate_state(1)[0])
+
+
+def run_task(config: Dict[str, float], steps: int, seed: int) -> Dict[str, float]:
+    """
+    Одна реалізація у процесі-працівнику
+
+    Симуляція зупиняється раніше, якщо інфікованих не залишилось (стан більше не змінюється).
+
+    :return: частка коли-небудь інфікованих клітин, пік інфікованих, крок піку, час виконання
+    """
+    start = time.perf_counter()
+    model = EpidemicModel(rng=np.random.default_rng(seed), **config)
+    s, peak_infected, _ = model.get_counts()
+    peak_time = 0
+    for step in range(1, steps + 1):
+        model.update()
+        s, i, _ = model.get_counts()
+        if i > peak_infected:
+            peak_infected, peak_time = i, step
+        if i == 0:
+            break
+    return {
+        'attack_rate': (model.size ** 2 - s) / model.size ** 2,
+        'peak_infected': peak_infected,
+        'peak_time': peak_time,
+        'runtime': time.perf_counter() - start,
+    }
+
+
+def run_sweep(configs: List[Dict[str, float]], steps: int, repetitions: int = 5, base_seed: int = 0,
+              workers: int = None, db_path: str = DEFAULT_DB) -> int:
+    """
+    Запуск усіх повторень у пулі процесів
+
+    Комбінації (параметри, кроки, зерно), вже записані в базі, пропускаються,
+    тож перерваний перебір продовжується з місця зупинки.
+
+    :return: кількість пропущених повторень
+    """
+    conn = init_db(db_path)
+    done = set(conn.execute(f'SELECT {", ".join(PARAMS)}, seed FROM epidemic_sweep WHERE steps = ?',
+                            (steps,)).fetchall())
+
+    tasks = []
+    for config in configs:
+        for repetition in range(repetitions):
+            seed = task_seed(base_seed, repetition)
+            if tuple(config[p] for p in PARAMS) + (seed,) not in done:
+                tasks.append((config, seed))
+    skipped = len(configs) * repetitions - len(tasks)
+    print(f"Задач: {len(tasks)} (пропущено вже виконаних: {skipped})")
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_task, config, steps, seed): (config, seed) for config, seed in tasks}
+        for completed, future in enumerate(as_completed(futures), 1):
+            config, seed = futures[future]
+            result = future.result()
+            conn.execute(
+                f'INSERT OR IGNORE INTO epidemic_sweep ({", ".join(PARAMS)}, steps, seed, '
+                f'{", ".join(METRICS)}, runtime) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (*(config[p] for p in PARAMS), steps, seed, *(result[m] for m in METRICS), result['runtime']))
+            conn.commit()
+            if completed % 50 == 0 or completed == len(tasks):
+                print(f"[{completed}/{len(tasks)}]")
+    conn.close()
+    return skipped
+
+
+def phase_diagram(steps: int, size: int, initial_infected: int,
+                  db_path: str = DEFAULT_DB) -> Dict[str, np.ndarray]:
+    """
+    Фазова діаграма p_infect x t_recover для фіксованих size та initial_infected
+
+    :return: значення осей p_infect і t_recover та масиви (t_recover, p_infect) середніх
+             attack_rate, peak_fraction (пік інфікованих як частка клітин), peak_time і кількості runs
+    """
+    conn = init_db(db_path)
+    rows = conn.execute(
+        'SELECT p_infect, t_recover, AVG(attack_rate), AVG(peak_infected), AVG(peak_time), COUNT(*) '
+        'FROM epidemic_sweep WHERE steps = ? AND size = ? AND initial_infected = ? '
+        'GROUP BY p_infect, t_recover', (steps, size, initial_infected)).fetchall()
+    conn.close()
+
+    p_values = np.array(sorted({row[0] for row in rows}), dtype=float)
+    t_values = np.array(sorted({row[1] for row in rows}), dtype=int)
+    diagram = {name: np.full((len(t_values), len(p_values)), np.nan)
+               for name in ('attack_rate', 'peak_fraction', 'peak_time', 'runs')}
+    for p, t, attack_rate, peak, peak_time, runs in rows:
+        k, j = np.searchsorted(t_values, t), np.searchsorted(p_values, p)
+        diagram['attack_rate'][k, j] = attack_rate
+        diagram['peak_fraction'][k, j] = peak / size ** 2
+        diagram['peak_time'][k, j] = peak_time
+        diagram['runs'][k, j] = runs
+    diagram['p_infect'] = p_values
+    diagram['t_recover'] = t_values
+    return diagram
+
+
+def plot_phase_diagram(diagram: Dict[str, np.ndarray], path: str = None, title: str = ''):
+    """Теплові карти фазової діаграми"""
+    import matplotlib.pyplot as plt
+
+    fig, axes = plt.subplots(1, 3, figsize=(16, 5))
+    labels = (('attack_rate', 'Частка інфікованих за весь час'),
+              ('peak_fraction', 'Пік інфікованих (частка)'),
+              ('peak_time', 'Крок піку'))
+    p_values, t_values = diagram['p_infect'], diagram['t_recover']
+    for ax, (name, label) in zip(axes, labels):
+        image = ax.imshow(diagram[name], origin='lower', aspect='auto', cmap='viridis', interpolation='none')
+        ax.set_xticks(range(len(p_values)), [f'{p:g}' for p in p_values])
+        ax.set_yticks(range(len(t_values)), [str(t) for t in t_values])
+        ax.set_xlabel('Ймовірність інфікування')
+        ax.set_ylabel('Час одужання')
+        ax.set_title(label)
+        fig.colorbar(image, ax=ax)
+    if title:
+        fig.suptitle(title)
+    fig.tight_layout()
+    if path:
+        fig.savefig(path, dpi=100)
+        plt.close(fig)
+    else:
+        plt.show()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Перебір параметрів SIR клітинного автомата")
+    parser.add_argument('--p-infect', type=float, nargs='+', default=DEFAULT_GRID['p_infect'])
+    parser.add_argument('--t-recover', type=int, nargs='+', default=DEFAULT_GRID['t_recover'])
+    parser.add_argument('--initial-infected', type=int, nargs='+', default=DEFAULT_GRID['initial_infected'])
+    parser.add_argument('--size', type=int, nargs='+', default=DEFAULT_GRID['size'])
+    parser.add_argument('--repetitions', type=int, default=5)
+    parser.add_argument('--steps', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--db', default=DEFAULT_DB)
+    parser.add_argument('--out', default='phase', help="префікс файлів .npz і .png фазових діаграм")
+    args = parser.parse_args()
+
+    grid = {'size': args.size, 'p_infect': args.p_infect, 't_recover': args.t_recover,
+            'initial_infected': args.initial_infected}
+    run_sweep(grid_design(grid), args.steps, args.repetitions, args.seed, args.workers, args.db)
+
+    for size, initial_infected in itertools.product(args.size, args.initial_infected):
+        diagram = phase_diagram(args.steps, size, initial_infected, args.db)
+        prefix = f'{args.out}_size{size}_init{initial_infected}'
+        np.savez(f'{prefix}.npz', **diagram)
+        plot_phase_diagram(diagram, f'{prefix}.png', f'Розмір {size}, початково інфікованих {initial_infected}')
+        print(f"Фазова діаграма: {prefix}.npz, {prefix}.png")
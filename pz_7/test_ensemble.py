@@ -0,0 +1,31 @@
+import numpy as np
+import unittest
+
+import ensemble
+
+
+# Тести для ансамблю реалізацій епідемії
+class TestEnsemble(unittest.TestCase):
+    params = dict(size=15, p_infect=0.5, t_recover=4, initial_infected=3)
+
+    def test_summary_shapes(self):
+        """Кількості зберігаються для кожного кроку, смуги - для кожного квантиля"""
+        result = ensemble.run_ensemble(steps=20, replicas=12, seed=1, workers=1, **self.params)
+        self.assertEqual(result['counts'].shape, (12, 21, 3))
+        self.assertTrue(np.all(result['counts'].sum(axis=2) == 15 * 15))
+        self.assertEqual(result['bands'].shape, (len(ensemble.QUANTILES), 21, 3))
+        self.assertTrue(np.all(result['bands'][0] <= result['bands'][-1]))
+        infected = result['counts'][:, :, 1]
+        self.assertTrue(np.array_equal(infected[np.arange(12), result['peak_time']], result['peak_size']))
+        # Незалежні генератори дають різні реалізації
+        self.assertGreater(len({tuple(row) for row in infected}), 1)
+
+    def test_reproducible_across_workers(self):
+        """Результат залежить лише від зерна, а не від кількості процесів"""
+        serial = ensemble.run_ensemble(steps=10, replicas=7, seed=3, workers=1, **self.params)
+        parallel = ensemble.run_ensemble(steps=10, replicas=7, seed=3, workers=2, **self.params)
+        self.assertTrue(np.array_equal(serial['counts'], parallel['counts']))
+
+
+if __name__ == "__main__":
+    unittest.main()
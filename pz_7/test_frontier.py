@@ -0,0 +1,55 @@
+import numpy as np
+import unittest
+
+from frontier import FrontierEpidemicModel
+from model import EpidemicModel
+
+
+# Тести для моделі з оновленням лише фронту епідемії
+class TestFrontierModel(unittest.TestCase):
+    def _pair(self, p_infect, seed=1):
+        return (EpidemicModel(30, p_infect, 4, 6, rng=np.random.default_rng(seed)),
+                FrontierEpidemicModel(30, p_infect, 4, 6, rng=np.random.default_rng(seed)))
+
+    def test_deterministic_runs_match_dense(self):
+        """Без випадковості (гарантоване зараження або його відсутність) стани збігаються покроково"""
+        for p_infect in (8.0, 0.0):
+            dense, frontier = self._pair(p_infect)
+            for _ in range(25):
+                dense.update()
+                frontier.update()
+                self.assertEqual(frontier.get_counts(), dense.get_counts())
+                self.assertTrue(np.array_equal(frontier.grid, dense.grid))
+                self.assertTrue(np.array_equal(frontier.time_infected, dense.time_infected))
+
+    def test_fractional_recovery_time(self):
+        """Дробовий t_recover дає цілочисельні таймери"""
+        self.assertEqual(FrontierEpidemicModel(5, 0.3, 5.5, 1).timers.dtype, np.uint8)
+
+    def test_statistics_match_dense(self):
+        """Середні кількості після 20 кроків збігаються в межах статистичної похибки"""
+        finals = {}
+        for engine in (EpidemicModel, FrontierEpidemicModel):
+            counts = []
+            for seed in range(150):
+                model = engine(20, 0.4, 4, 3, rng=np.random.default_rng(seed + 1000 * (engine is EpidemicModel)))
+                for _ in range(20):
+                    model.update()
+                counts.append(model.get_counts())
+            finals[engine] = np.array(counts, dtype=float)
+        dense, frontier = finals[EpidemicModel], finals[FrontierEpidemicModel]
+        error = np.sqrt(dense.var(axis=0) / len(dense) + frontier.var(axis=0) / len(frontier))
+        self.assertTrue(np.all(np.abs(dense.mean(axis=0) - frontier.mean(axis=0)) < 4 * error))
+
+    def test_huge_grid(self):
+        """Кілька вогнищ на сітці 50000 x 50000 без щільних масивів станів"""
+        model = FrontierEpidemicModel(50000, 0.5, 5, 3, rng=np.random.default_rng(0))
+        for _ in range(30):
+            model.update()
+        s, i, r = model.get_counts()
+        self.assertEqual(s + i + r, 50000 ** 2)
+        self.assertGreater(i + r, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import numpy as np
+import unittest
+
+from model import EpidemicModel, SUSCEPTIBLE, INFECTED, RECOVERED, simulate
+
+
+# Тести для клітинного автомата епідемії
+class TestEpidemicModel(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(4)
+        self.model = EpidemicModel(size=20, p_infect=0.5, t_recover=3, initial_infected=0)
+        self.model.grid[...] = np.random.randint(0, 3, (20, 20))
+        self.model.time_infected[...] = np.where(self.model.grid == INFECTED, np.random.randint(1, 5, (20, 20)), 0)
+
+    def test_neighbor_counts(self):
+        """Векторизований підрахунок сусідів збігається з count_neighbors, включно з краями"""
+        counts = self.model.count_infected_neighbors()
+        for x in range(20):
+            for y in range(20):
+                self.assertEqual(counts[x, y], self.model.count_neighbors(x, y))
+
+    def test_update_rules(self):
+        """Одужання за часом, зараження лише здорових клітин з інфікованими сусідами"""
+        grid, time_infected = self.model.grid.copy(), self.model.time_infected.copy()
+        neighbors = self.model.count_infected_neighbors()
+        self.model.p_infect = 8.0  # Гарантоване зараження за наявності сусіда
+        self.model.update()
+
+        infected = grid == INFECTED
+        recovering = infected & (time_infected >= 3)
+        self.assertTrue(np.all(self.model.grid[recovering] == RECOVERED))
+        self.assertTrue(np.all(self.model.time_infected[recovering] == 0))
+        staying = infected & ~recovering
+        self.assertTrue(np.all(self.model.time_infected[staying] == time_infected[staying] + 1))
+
+        susceptible = grid == SUSCEPTIBLE
+        self.assertTrue(np.all(self.model.grid[susceptible & (neighbors > 0)] == INFECTED))
+        self.assertTrue(np.all(self.model.time_infected[susceptible & (neighbors > 0)] == 1))
+        self.assertTrue(np.all(self.model.grid[susceptible & (neighbors == 0)] == SUSCEPTIBLE))
+        self.assertTrue(np.all(self.model.grid[grid == RECOVERED] == RECOVERED))
+
+    def test_no_infection_without_probability(self):
+        """При p_infect = 0 нових заражень немає"""
+        self.model.p_infect = 0
+        susceptible = self.model.grid == SUSCEPTIBLE
+        self.model.update()
+        self.assertTrue(np.all(self.model.grid[susceptible] == SUSCEPTIBLE))
+
+    def test_compact_buffers(self):
+        """Стан і час займають по байту на клітину; буфери стану міняються місцями, таймер оновлюється на місці"""
+        self.assertEqual(self.model.grid.dtype, np.uint8)
+        self.assertEqual(self.model.time_infected.dtype, np.uint8)
+        self.assertEqual(EpidemicModel(size=5, t_recover=1000).time_infected.dtype, np.uint16)
+        self.assertEqual(EpidemicModel(size=5, t_recover=5.5).time_infected.dtype, np.uint8)
+        self.assertEqual(EpidemicModel(size=5, t_recover=255.5).time_infected.dtype, np.uint16)
+
+        grid, next_grid, time_infected = self.model.grid, self.model._next_grid, self.model.time_infected
+        self.model.update()
+        self.assertIs(self.model.grid, next_grid)
+        self.assertIs(self.model._next_grid, grid)
+        self.assertIs(self.model.time_infected, time_infected)
+        self.assertEqual(self.model.grid.nbytes + self.model._next_grid.nbytes + time_infected.nbytes, 3 * 20 * 20)
+
+    def test_fractional_recovery_time(self):
+        """Дробовий t_recover: одужання на першому цілому кроці, не меншому за t_recover"""
+        model = EpidemicModel(size=3, p_infect=0, t_recover=2.5, initial_infected=0)
+        model.grid[1, 1] = INFECTED
+        model.time_infected[1, 1] = 1
+        model.update()
+        model.update()
+        self.assertEqual((model.grid[1, 1], model.time_infected[1, 1]), (INFECTED, 3))
+        model.update()
+        self.assertEqual((model.grid[1, 1], model.time_infected[1, 1]), (RECOVERED, 0))
+
+    def test_block_update_matches_single_block(self):
+        """Покрокова обробка блоками рядків дає той самий результат, що й одним блоком"""
+        blocked = EpidemicModel(size=20, p_infect=0.5, t_recover=3, initial_infected=0)
+        blocked.grid[...] = self.model.grid
+        blocked.time_infected[...] = self.model.time_infected
+        blocked.BLOCK_CELLS = 60  # Блоки по 3 рядки
+        for model in (self.model, blocked):
+            np.random.seed(5)
+            for _ in range(5):
+                model.update()
+        self.assertTrue(np.array_equal(self.model.grid, blocked.grid))
+        self.assertTrue(np.array_equal(self.model.time_infected, blocked.time_infected))
+        self.assertEqual(blocked.get_counts(), tuple(int(np.sum(self.model.grid == state))
+                                                     for state in (SUSCEPTIBLE, INFECTED, RECOVERED)))
+
+    def test_simulate(self):
+        """Генератор симуляції повертає початковий стан і кожен наступний крок"""
+        initial = self.model.get_counts()
+        states = list(simulate(self.model, 4, snapshots=True, every=2))
+        self.assertEqual([step for step, _, _ in states], [0, 1, 2, 3, 4])
+        self.assertEqual(states[0][1], initial)
+        self.assertEqual([grid is None for _, _, grid in states], [False, True, False, True, False])
+        self.assertTrue(np.array_equal(states[-1][2], self.model.grid))
+        self.assertIsNot(states[-1][2], self.model.grid)
+
+
+if __name__ == "__main__":
+    unittest.main()
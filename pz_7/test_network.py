@@ -0,0 +1,100 @@
+import numpy as np
+import unittest
+
+from model import EpidemicModel, INFECTED
+from network import NetworkEpidemicModel, csr_from_edges, scale_free_edges
+
+
+def lattice_edges(size):
+    """Ребра околу Мура решітки size x size (кожне ребро один раз)"""
+    index = np.arange(size * size).reshape(size, size)
+    edges = [np.column_stack([index[:size - di, max(0, -dj):size - max(0, dj)].ravel(),
+                              index[di:, max(0, dj):size + min(0, dj)].ravel()])
+             for di, dj in ((0, 1), (1, -1), (1, 0), (1, 1))]
+    return np.concatenate(edges)
+
+
+# Тести для моделі на мережі контактів
+class TestNetworkModel(unittest.TestCase):
+    def test_csr_from_edges(self):
+        """Неорієнтовані ребра потрапляють в обидва рядки, ваги - разом з ними"""
+        indptr, indices, weights = csr_from_edges([[0, 1], [1, 2], [0, 3]], weights=[1.0, 2.0, 3.0])
+        self.assertEqual(list(indptr), [0, 2, 4, 5, 6])
+        self.assertEqual([sorted(indices[indptr[v]:indptr[v + 1]]) for v in range(4)], [[1, 3], [0, 2], [1], [0]])
+        self.assertEqual(sorted(weights[indptr[1]:indptr[2]]), [1.0, 2.0])
+
+        indptr, indices, _ = csr_from_edges([[0, 1], [1, 2]], directed=True)
+        self.assertEqual(list(indptr), [0, 1, 2, 2])
+
+    def test_csr_blocks_match_sorted_build(self):
+        """Розкладання блоками дає ті самі рядки (у порядку ребер), що й сортування всього списку"""
+        rng = np.random.default_rng(4)
+        edges = rng.integers(0, 50, (1000, 2))
+        weights = rng.random(1000)
+        indptr, indices, values = csr_from_edges(edges, 50, weights, block=64)
+
+        sources = np.concatenate([edges[:, 0], edges[:, 1]])
+        order = np.argsort(sources, kind='stable')
+        self.assertEqual(list(indptr), [0] + list(np.cumsum(np.bincount(sources, minlength=50))))
+        self.assertTrue(np.array_equal(indices, np.concatenate([edges[:, 1], edges[:, 0]])[order]))
+        self.assertTrue(np.array_equal(values, np.concatenate([weights, weights]).astype(np.float32)[order]))
+
+    def test_duplicate_edges(self):
+        """Повторне ребро у списку дає два записи; scale_free_edges повторів і петель не має"""
+        model = NetworkEpidemicModel(np.array([[0, 1], [0, 1], [1, 2]]), 3, initial_infected=0)
+        model.states[0] = INFECTED
+        self.assertEqual(list(model.infection_pressure()), [0, 2, 0])
+
+        edges = scale_free_edges(3000, rng=np.random.default_rng(1))
+        self.assertTrue(np.all(edges[:, 0] < edges[:, 1]))
+        self.assertEqual(len(np.unique(edges, axis=0)), len(edges))
+
+    def test_lattice_graph_matches_grid(self):
+        """Мережа околу Мура з нормуванням на 8 відтворює решітчасту модель з тим самим генератором"""
+        dense = EpidemicModel(25, 0.6, 4, 0, rng=np.random.default_rng(9))
+        network = NetworkEpidemicModel(lattice_edges(25), 625, 0.6, 4, 0, normalization=8,
+                                       rng=np.random.default_rng(9))
+        for x, y in ((3, 4), (20, 20), (0, 24)):
+            dense.grid[x, y] = INFECTED
+            dense.time_infected[x, y] = 1
+        network.states[...] = dense.grid.ravel()
+        network.timers[...] = dense.time_infected.ravel()
+
+        for _ in range(20):
+            self.assertTrue(np.array_equal(network.infection_pressure(), dense.count_infected_neighbors().ravel()))
+            dense.update()
+            network.update()
+            self.assertTrue(np.array_equal(network.states, dense.grid.ravel()))
+            self.assertEqual(network.get_counts(), dense.get_counts())
+
+    def test_weighted_pressure(self):
+        """Тиск - сума ваг ребер від інфікованих вузлів (для орієнтованих - лише вздовж ребра)"""
+        model = NetworkEpidemicModel(np.array([[0, 1], [2, 1], [1, 3]]), 4, initial_infected=0,
+                                     weights=np.array([0.5, 2.0, 1.0]), directed=True)
+        model.states[[0, 2, 1]] = INFECTED
+        self.assertEqual(list(model.infection_pressure()), [0.0, 2.5, 0.0, 1.0])
+        self.assertEqual((model.norm[1], model.norm[3]), (2.5, 1.0))
+
+    def test_degree_normalization(self):
+        """Нормування - кількість вхідних ребер: для неорієнтованої мережі - довжини рядків CSR"""
+        edges = np.array([[0, 1], [1, 2], [1, 3], [2, 1]])
+        self.assertEqual(list(NetworkEpidemicModel(edges, 4).norm), [1, 4, 2, 1])
+        norm = NetworkEpidemicModel(edges, 4, directed=True).norm
+        self.assertEqual(list(norm[1:]), [2, 1, 1])
+        self.assertLess(norm[0], 1e-6)
+
+    def test_scale_free_run(self):
+        """Епідемія на мережі з важкими хвостами степенів; grid для visual() маскує зайві клітини"""
+        rng = np.random.default_rng(0)
+        model = NetworkEpidemicModel(scale_free_edges(5000, rng=rng), 5000, 0.5, 5, 10, rng=rng)
+        for _ in range(30):
+            model.update()
+        s, i, r = model.get_counts()
+        self.assertEqual(s + i + r, 5000)
+        self.assertGreater(r, 10)
+        self.assertEqual(model.grid.shape, (71, 71))
+        self.assertEqual(model.grid.count(), 5000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import numpy as np
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import recorder
+from model import EpidemicModel, simulate
+
+
+# Тести для запису кадрів симуляції
+class TestRecorder(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _model(self):
+        return EpidemicModel(size=12, p_infect=0.6, t_recover=3, initial_infected=2,
+                             rng=np.random.default_rng(7))
+
+    def test_record_matches_simulation(self):
+        """Записані кадри та кількості збігаються з симуляцією з тим самим зерном"""
+        frames_dir = os.path.join(self.directory.name, 'frames')
+        gif = os.path.join(self.directory.name, 'epidemic.gif')
+        counts = recorder.record(self._model(), 10, frames_dir, every=2, chunk_frames=4, gif=gif)
+
+        expected = [(step, grid) for step, _, grid in simulate(self._model(), 10, snapshots=True, every=2)
+                    if grid is not None]
+        frames = list(recorder.load_frames(frames_dir))
+        self.assertEqual([step for step, _ in frames], [0, 2, 4, 6, 8, 10])
+        for (step, grid), (_, frame) in zip(expected, frames):
+            self.assertTrue(np.array_equal(grid, frame))
+        self.assertEqual(len(recorder.chunk_paths(frames_dir)), 2)
+        self.assertEqual([tuple(row) for row in counts],
+                         [c for _, c, _ in simulate(self._model(), 10)])
+
+        from PIL import Image
+        with Image.open(gif) as image:
+            self.assertEqual(image.n_frames, 6)
+            self.assertEqual(image.size, (48, 48))
+
+    def test_render_gif_streams_chunks(self):
+        """GIF з багатьох пачок: кадри пишуться по одному з генератора і збігаються із записаними"""
+        frames_dir = os.path.join(self.directory.name, 'frames')
+        recorder.record(self._model(), 20, frames_dir, chunk_frames=3)
+        self.assertEqual(len(recorder.chunk_paths(frames_dir)), 7)
+
+        gif = os.path.join(self.directory.name, 'stream.gif')
+        recorder.render_gif((path for path in recorder.chunk_paths(frames_dir)), gif, scale=2, duration=50)
+        from PIL import Image
+        with Image.open(gif) as image:
+            self.assertEqual(image.n_frames, 21)
+            self.assertEqual(image.info['duration'], 50)
+            self.assertEqual(image.info['loop'], 0)
+            for index, (_, frame) in enumerate(recorder.load_frames(frames_dir)):
+                image.seek(index)
+                expected = recorder.COLORS[frame].repeat(2, axis=0).repeat(2, axis=1)
+                self.assertTrue(np.array_equal(np.asarray(image.convert('RGB')), expected))
+
+        empty = os.path.join(self.directory.name, 'empty.gif')
+        recorder.render_gif([], empty)
+        self.assertFalse(os.path.exists(empty))
+
+    def test_headless_import(self):
+        """Модель, симуляція і запис не імпортують matplotlib"""
+        code = 'import sys, model, recorder, ensemble; assert "matplotlib" not in sys.modules'
+        subprocess.run([sys.executable, '-c', code], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import numpy as np
+import os
+import sqlite3
+import tempfile
+import unittest
+
+import sweep
+
+
+# Тести для перебору параметрів епідемії
+class TestSweep(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = os.path.join(self.directory.name, 'sweep.db')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_run_task_without_infection(self):
+        """Без зараження хворіє лише початково інфікована клітина"""
+        result = sweep.run_task({'size': 10, 'p_infect': 0, 't_recover': 3, 'initial_infected': 1}, 50, 1)
+        self.assertEqual(result['attack_rate'], 0.01)
+        self.assertEqual((result['peak_infected'], result['peak_time']), (1, 0))
+
+    def test_sweep_resumes_and_builds_diagram(self):
+        """Повторний запуск пропускає виконані задачі; діаграма має вісь на кожне значення параметра"""
+        grid = {'size': [12], 'p_infect': [0.2, 0.8], 't_recover': [2, 5, 8], 'initial_infected': [3]}
+        configs = sweep.grid_design(grid)
+        self.assertEqual(sweep.run_sweep(configs[:3], 40, repetitions=2, workers=2, db_path=self.db), 0)
+        self.assertEqual(sweep.run_sweep(configs, 40, repetitions=2, workers=2, db_path=self.db), 6)
+
+        with sqlite3.connect(self.db) as conn:
+            self.assertEqual(conn.execute('SELECT COUNT(*) FROM epidemic_sweep').fetchone()[0], 12)
+        diagram = sweep.phase_diagram(40, 12, 3, self.db)
+        self.assertEqual(list(diagram['p_infect']), [0.2, 0.8])
+        self.assertEqual(list(diagram['t_recover']), [2, 5, 8])
+        self.assertEqual(diagram['attack_rate'].shape, (3, 2))
+        self.assertTrue(np.all(diagram['runs'] == 2))
+        self.assertTrue(np.all((diagram['attack_rate'] > 0) & (diagram['attack_rate'] <= 1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
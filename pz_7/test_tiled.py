@@ -0,0 +1,57 @@
+import numpy as np
+import os
+import tempfile
+import unittest
+
+from model import EpidemicModel
+from tiled import TiledEpidemicModel
+
+
+# Тести для моделі на плитках у спільній пам'яті
+class TestTiledModel(unittest.TestCase):
+    def _run(self, steps, **kwargs):
+        with TiledEpidemicModel(37, 0.5, 4, 6, seed=3, **kwargs) as model:
+            for _ in range(steps):
+                model.update()
+            return model.grid.copy(), model.time_infected.copy(), model.get_counts()
+
+    def test_deterministic_run_matches_dense(self):
+        """Без випадковості плитки з облямівкою дають той самий стан, що й суцільна сітка"""
+        dense = EpidemicModel(37, 8.0, 4, 6, rng=np.random.default_rng(3))
+        with TiledEpidemicModel(37, 8.0, 4, 6, tile=10, workers=1, seed=3) as model:
+            for _ in range(15):
+                dense.update()
+                model.update()
+                self.assertTrue(np.array_equal(model.grid, dense.grid))
+                self.assertTrue(np.array_equal(model.time_infected, dense.time_infected))
+                self.assertEqual(model.get_counts(), dense.get_counts())
+
+    def test_fractional_recovery_time(self):
+        """Дробовий t_recover дає цілочисельні таймери"""
+        with TiledEpidemicModel(5, 0.3, 5.5, 1, workers=1) as model:
+            self.assertEqual(model.time_infected.dtype, np.uint8)
+
+    def test_independent_of_workers(self):
+        """Результат залежить лише від зерна і розміру плиток, а не від кількості процесів"""
+        serial = self._run(12, tile=8, workers=1)
+        parallel = self._run(12, tile=8, workers=3)
+        for a, b in zip(serial[:2], parallel[:2]):
+            self.assertTrue(np.array_equal(a, b))
+        self.assertEqual(serial[2], parallel[2])
+
+    def test_checkpoint_resume(self):
+        """Продовження з контрольної точки збігається з прогоном без перерви"""
+        expected = self._run(10, tile=16, workers=1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'checkpoint.npz')
+            with TiledEpidemicModel(37, 0.5, 4, 6, tile=16, workers=1, seed=3) as model:
+                model.run(4, path, checkpoint_every=2)
+            with TiledEpidemicModel.from_checkpoint(path, workers=2) as model:
+                self.assertEqual(model.step, 4)
+                model.run(10)
+                self.assertTrue(np.array_equal(model.grid, expected[0]))
+                self.assertEqual(model.get_counts(), expected[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
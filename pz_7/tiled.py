@@ -0,0 +1,231 @@
+import numpy as np
+import argparse
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+from multiprocessing import shared_memory
+from typing import Dict, List, Tuple
+
+from model import INFECTED, neighbor_counts, transition
+
+# Масиви стану в спільній пам'яті: два буфери станів і два буфери таймерів
+BUFFERS = ('grid_0', 'grid_1', 'time_0', 'time_1')
+
+# Масиви, приєднані процесом-працівником (заповнюються ініціалізатором пулу)
+_worker_arrays = {}
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Приєднання до блоку спільної пам'яті, створеного головним процесом
+
+    Працівники користуються трекером ресурсів головного процесу, тож повторна реєстрація
+    блоку не призводить до його видалення; звільняє блоки лише close() головного процесу.
+    """
+    return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(names: Dict[str, str], shape: Tuple[int, int], time_dtype: str):
+    for buffer, name in names.items():
+        block = _attach(name)
+        dtype = np.uint8 if buffer.startswith('grid') else np.dtype(time_dtype)
+        _worker_arrays[buffer] = (block, np.ndarray(shape, dtype=dtype, buffer=block.buf))
+
+
+def tile_rng(seed: int, step: int, tile: int) -> np.random.Generator:
+    """Незалежний генератор плитки на кроці: результат не залежить від розподілу плиток між процесами"""
+    return np.random.default_rng([seed, step, tile])
+
+
+def step_tile(arrays: Dict[str, np.ndarray], current: int, tile: int, bounds: Tuple[int, int, int, int],
+              step: int, seed: int, p_infect: float, t_recover: int) -> np.ndarray:
+    """
+    Крок однієї плитки: читається поточний буфер з облямівкою в одну клітину від сусідніх
+    плиток, пишеться наступний буфер у межах плитки
+
+    :return: кількості S, I, R плитки після кроку
+    """
+    r0, r1, c0, c1 = bounds
+    grid, timer = arrays[f'grid_{current}'], arrays[f'time_{current}']
+    next_grid, next_timer = arrays[f'grid_{1 - current}'], arrays[f'time_{1 - current}']
+    state = grid[r0:r1, c0:c1]
+    transition(state, timer[r0:r1, c0:c1], neighbor_counts(grid, r0, r1, c0, c1),
+               tile_rng(seed, step, tile).random(state.shape), p_infect, t_recover,
+               next_grid[r0:r1, c0:c1], next_timer[r0:r1, c0:c1])
+    return np.bincount(next_grid[r0:r1, c0:c1].ravel(), minlength=3)[:3]
+
+
+def _step_tile_worker(args) -> np.ndarray:
+    arrays = {buffer: array for buffer, (_, array) in _worker_arrays.items()}
+    return step_tile(arrays, *args)
+
+
+class TiledEpidemicModel:
+    """
+    Сітка EpidemicModel, розбита на плитки tile x tile у спільній пам'яті
+
+    Плитки кроку обробляються паралельно пулом процесів; сусідні клітини інших плиток
+    (облямівка) читаються з поточного буфера, новий стан пишеться в інший буфер, і буфери
+    міняються після завершення всіх плиток. Кожна плитка на кожному кроці має власний
+    генератор (seed, крок, номер плитки), тож результат не залежить від кількості процесів.
+    """
+
+    def __init__(self, size=50, p_infect=0.3, t_recover=5, initial_infected=5, tile=1024,
+                 workers=None, seed=0):
+        """
+        :param workers: кількість процесів; 1 - плитки обробляються в поточному процесі
+        """
+        self.size = size
+        self.p_infect = p_infect
+        self.t_recover = t_recover
+        self.tile = tile
+        self.seed = seed
+        self.step = 0
+        self.current = 0
+        self.time_dtype = np.min_scalar_type(max(int(np.ceil(t_recover)), 1))
+        self.tiles = [(r0, min(r0 + tile, size), c0, min(c0 + tile, size))
+                      for r0 in range(0, size, tile) for c0 in range(0, size, tile)]
+
+        self._blocks = {}
+        self._arrays = {}
+        for buffer in BUFFERS:
+            dtype = np.uint8 if buffer.startswith('grid') else self.time_dtype
+            block = shared_memory.SharedMemory(create=True, size=max(1, size * size * np.dtype(dtype).itemsize))
+            self._blocks[buffer] = block
+            self._arrays[buffer] = np.ndarray((size, size), dtype=dtype, buffer=block.buf)
+            self._arrays[buffer][...] = 0
+
+        rng = np.random.default_rng(seed)
+        for _ in range(initial_infected):
+            x, y = rng.integers(0, size, 2)
+            self.grid[x, y] = INFECTED
+            self.time_infected[x, y] = 1
+        self._counts = self._count(self.grid)
+
+        self.workers = workers
+        self._pool = None
+        if workers != 1:
+            names = {buffer: block.name for buffer, block in self._blocks.items()}
+            self._pool = multiprocessing.Pool(workers, initializer=_init_worker,
+                                              initargs=(names, (size, size), self.time_dtype.str))
+
+    @property
+    def grid(self) -> np.ndarray:
+        """Поточний стан (вигляд на спільну пам'ять, дійсний до close())"""
+        return self._arrays[f'grid_{self.current}']
+
+    @property
+    def time_infected(self) -> np.ndarray:
+        return self._arrays[f'time_{self.current}']
+
+    def update(self):
+        tasks = [(self.current, index, bounds, self.step, self.seed, self.p_infect, self.t_recover)
+                 for index, bounds in enumerate(self.tiles)]
+        if self._pool is None:
+            counts = [step_tile(self._arrays, *task) for task in tasks]
+        else:
+            counts = self._pool.map(_step_tile_worker, tasks)
+        self._counts = tuple(int(count) for count in np.sum(counts, axis=0))
+        self.current = 1 - self.current
+        self.step += 1
+
+    def get_counts(self):
+        """Кількості S, I, R (зібрані з плиток на останньому кроці)"""
+        return self._counts
+
+    @staticmethod
+    def _count(grid: np.ndarray) -> Tuple[int, int, int]:
+        s, i, r = (int(count) for count in np.bincount(grid.ravel(), minlength=3)[:3])
+        return s, i, r
+
+    def save_checkpoint(self, path: str):
+        """Атомарний запис повного стану і параметрів на диск"""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(suffix='.npz', dir=directory)
+        meta = {'size': self.size, 'p_infect': self.p_infect, 't_recover': self.t_recover,
+                'tile': self.tile, 'seed': self.seed, 'step': self.step}
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez_compressed(f, grid=self.grid, time_infected=self.time_infected, meta=json.dumps(meta))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def from_checkpoint(cls, path: str, workers=None) -> 'TiledEpidemicModel':
+        """Відновлення моделі з контрольної точки; подальші кроки такі самі, як без перерви"""
+        with np.load(path) as checkpoint:
+            meta = json.loads(str(checkpoint['meta']))
+            model = cls(meta['size'], meta['p_infect'], meta['t_recover'], 0, meta['tile'], workers, meta['seed'])
+            model.grid[...] = checkpoint['grid']
+            model.time_infected[...] = checkpoint['time_infected']
+        model.step = meta['step']
+        model._counts = model._count(model.grid)
+        return model
+
+    def run(self, steps: int, checkpoint: str = None, checkpoint_every: int = 100) -> List[Tuple[int, int, int]]:
+        """
+        Виконання кроків до self.step == steps з контрольними точками кожні checkpoint_every кроків
+
+        :return: кількості S, I, R після кожного виконаного кроку
+        """
+        counts = []
+        while self.step < steps:
+            self.update()
+            counts.append(self.get_counts())
+            if checkpoint and (self.step % checkpoint_every == 0 or self.step == steps):
+                self.save_checkpoint(checkpoint)
+        return counts
+
+    def close(self):
+        """Зупинка пулу та звільнення спільної пам'яті"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        self._arrays = {}
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SIR клітинний автомат на плитках у спільній пам'яті")
+    parser.add_argument('--size', type=int, default=4096)
+    parser.add_argument('--p-infect', type=float, default=0.4)
+    parser.add_argument('--t-recover', type=int, default=6)
+    parser.add_argument('--initial-infected', type=int, default=50)
+    parser.add_argument('--steps', type=int, default=100)
+    parser.add_argument('--tile', type=int, default=1024)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--checkpoint', default=None, help="файл контрольної точки (.npz)")
+    parser.add_argument('--checkpoint-every', type=int, default=100)
+    parser.add_argument('--resume', action='store_true', help="продовжити з файлу --checkpoint")
+    args = parser.parse_args()
+
+    if args.resume:
+        model = TiledEpidemicModel.from_checkpoint(args.checkpoint, args.workers)
+        print(f"Відновлено з кроку {model.step}")
+    else:
+        model = TiledEpidemicModel(args.size, args.p_infect, args.t_recover, args.initial_infected,
+                                   args.tile, args.workers, args.seed)
+    with model:
+        start = time.perf_counter()
+        first_step = model.step
+        counts = model.run(args.steps, args.checkpoint, args.checkpoint_every)
+        elapsed = time.perf_counter() - start
+        if counts:
+            s, i, r = counts[-1]
+            print(f"Крок {model.step}: здорові {s}, інфіковані {i}, одужавші {r}; "
+                  f"{elapsed / (model.step - first_step):.3f} с на крок")